@@ -0,0 +1,95 @@
+# Configuración de gunicorn (el Procfile solo corre `gunicorn`).
+# Todo se puede ajustar con variables de entorno sin tocar este archivo.
+import logging
+import multiprocessing
+import os
+import time
+
+# SERVIDOR=asgi usa uvicorn (vistas async de pagos y calendario); por defecto WSGI con hilos
+SERVIDOR = os.environ.get('SERVIDOR', 'wsgi')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# 2 * CPU + 1, con tope: en el dyno cpu_count() puede ver los núcleos de toda la máquina
+# y cada worker es un proceso de Django completo (memoria)
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+
+if SERVIDOR == 'asgi':
+    wsgi_app = 'mi_proyecto.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'mi_proyecto.wsgi:application'
+    # Hilos: mientras un request espera a la base o a Stripe el worker atiende otros
+    worker_class = 'gthread'
+    threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Carga Django (y stripe, reportlab...) una vez en el master: los workers lo
+# comparten copy-on-write y arrancan más rápido
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+# Reciclar workers para acotar fugas de memoria; el jitter evita que se reinicien todos a la vez
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Mayor que el peor caso de una llamada a Stripe (ver STRIPE_TIMEOUT_* en settings)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Log de acceso con la duración en ms (%(M)s); métricas por statsd si STATSD_HOST está definido
+accesslog = os.environ.get('GUNICORN_ACCESSLOG', '-')
+access_log_format = '%(h)s "%(r)s" %(s)s %(b)s %(M)sms "%(a)s"'
+if os.environ.get('STATSD_HOST'):
+    statsd_host = os.environ['STATSD_HOST']
+    statsd_prefix = os.environ.get('STATSD_PREFIX', 'helcon')
+
+# Requests más lentos que esto se registran como warning con el worker que los atendió
+LENTO_MS = int(os.environ.get('GUNICORN_LENTO_MS', 1000))
+logger = logging.getLogger('gunicorn.error')
+
+
+def on_starting(server):
+    # journal_mode=WAL se guarda en el archivo sqlite: se activa una vez al arrancar el
+    # servidor y no en init_command (que corre en cada comando de manage.py y en los tests)
+    import django
+    from django.db import connections
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mi_proyecto.settings')
+    django.setup()
+    conexion = connections['default']
+    if conexion.vendor != 'sqlite':
+        return
+    with conexion.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+    conexion.close()
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    # Importar las URLs (y con ellas las vistas, stripe y reportlab) antes del fork
+    from django.urls import get_resolver
+
+    import helcon.comprobantes  # noqa: F401
+    get_resolver().url_patterns
+    server.log.info('Django precargado en el master (%s)', SERVIDOR)
+
+
+def post_fork(server, worker):
+    # Ninguna conexión a la base se comparte entre procesos
+    from django.db import connections
+    connections.close_all()
+
+
+def pre_request(worker, req):
+    # Solo los workers sync/gthread llaman a estos hooks (uvicorn tiene su propio log)
+    req.inicio_ns = time.monotonic_ns()
+
+
+def post_request(worker, req, environ, resp):
+    inicio = getattr(req, 'inicio_ns', None)
+    if inicio is None:
+        return
+    ms = (time.monotonic_ns() - inicio) / 1e6
+    if ms >= LENTO_MS:
+        logger.warning('Request lento: %s %s %s %.0fms (worker %s)', req.method, req.path, resp.status, ms, worker.pid)
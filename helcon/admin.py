@@ -1,3 +1,6 @@
 from django.contrib import admin
 
+from .models import HorarioDoctor
+
 # Register your models here.
+admin.site.register(HorarioDoctor)
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class HelconnConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'helcon'
+
+    def ready(self):
+        from . import signals
+        post_migrate.connect(signals.crear_triggers_busqueda, sender=self)
@@ -0,0 +1,92 @@
+import os
+
+import rcssmin
+import rjsmin
+
+from .imagenes import STATIC_APP
+
+# Cada bundle junta y minifica los archivos de helcon/static en el orden dado.
+# Los que comparten varias páginas van en su propio bundle común (comun.js,
+# inicio.*, legal.css, segundapagina.*, journal.js) para que el navegador lo
+# cachee una vez; las páginas cargan comun.js antes de su propio bundle.
+CARPETA_BUNDLES = 'bundles'
+
+BUNDLES = {
+    # Comunes
+    'comun.js': ['js/imagenes.js', 'js/idioma.js'],
+    'inicio.css': ['css/nuevoo.css', 'css/nuevo.css'],
+    'inicio.js': ['js/nuevoo.js'],
+    'legal.css': ['css/defamation_policy.css'],
+    'segundapagina.css': ['css/segundapaginaa.css'],
+    'segundapagina.js': ['js/funcionalidades.js'],
+    'journal.js': ['js/journal.js'],  # journal3 a journal6, cada uno con sus animaciones en la plantilla
+
+    # Por página
+    'welcome.css': ['css/welcome.css'],
+    'welcome.js': ['js/welcome.js'],
+    'tercerapagina.css': ['css/tercerapagina.css'],
+    'tercerapagina.js': ['js/tercerapaginaa.js'],
+    'cuartapagina.css': ['css/cuartapagina.css'],
+    'cuartapagina.js': ['js/cuartapagina.js'],
+    'journal1.css': ['css/journal1.css'],
+    'journal1.js': ['js/journall1.js'],
+    'journal2.css': ['css/journal2.css'],
+    'journal2.js': ['js/journal2.js'],
+    'journal3.css': ['css/journal3.css'],
+    'journal4.css': ['css/journal4.css'],
+    'journal5.css': ['css/journal5.css'],
+    'journal6.css': ['css/journal6.css'],
+    'terms.js': ['js/terms.js'],
+    'privacy_policies.js': ['js/privacy_policies.js'],
+    'difamation.js': ['js/defamation_policy.js'],
+    'display.css': ['css/display.css'],
+    'display.js': ['js/display.js'],
+    'formDoctor.css': ['css/formDoctor.css'],
+    'formDoctor.js': ['js/formDoctor.js'],
+    'formPaciente.css': ['css/formPaciente.css'],
+    'formPaciente.js': ['js/formPaciente.js'],
+    'mas_informacion.css': ['css/mas_informacion.css'],
+    'mas_informacion.js': ['js/mas_informacion.js'],
+    'perfil_doctor.css': ['css/perfil_doctor.css'],
+    'perfil_doctor.js': ['js/perfil_doctor.js'],
+    'perfil_paciente.css': ['css/perfil_paciente.css'],
+    'perfil_paciente.js': ['js/perfil_paciente.js'],
+    'seleccionar_tipo.css': ['css/selecionar-tipo.css'],
+    'seleccionar_tipo.js': ['js/seleccionar-tipo.js'],
+    'login.css': ['css/login.css'],
+    'login.js': ['js/login.js'],
+    'calendario.js': ['js/citas_calendario.js'],
+}
+
+
+def ruta_bundle(nombre):
+    return f'{CARPETA_BUNDLES}/{nombre}'
+
+
+def _minificar(nombre, texto):
+    if nombre.endswith('.css'):
+        return rcssmin.cssmin(texto)
+    # Scripts clásicos: al concatenarlos comparten el mismo ámbito global que
+    # tenían cargados por separado; el ';' evita que un archivo se pegue al siguiente
+    return rjsmin.jsmin(texto) + ';'
+
+
+def construir_bundles(origen=STATIC_APP):
+    """
+    Escribe cada bundle de BUNDLES en helcon/static/bundles/ (ignorada por
+    git). collectstatic les pone después el hash y las versiones .gz/.br.
+    Devuelve {nombre: bytes del bundle}.
+    """
+    tamanos = {}
+    carpeta = os.path.join(origen, CARPETA_BUNDLES)
+    os.makedirs(carpeta, exist_ok=True)
+    for nombre, archivos in BUNDLES.items():
+        partes = []
+        for archivo in archivos:
+            with open(os.path.join(origen, archivo), encoding='utf-8') as f:
+                partes.append(_minificar(nombre, f.read()))
+        contenido = '\n'.join(partes)
+        with open(os.path.join(carpeta, nombre), 'w', encoding='utf-8') as f:
+            f.write(contenido)
+        tamanos[nombre] = len(contenido.encode('utf-8'))
+    return tamanos
@@ -0,0 +1,53 @@
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+
+ALIAS_PAGINAS = 'paginas'
+
+
+def _es_anonimo(request):
+    # Sin cookie de sesión no hace falta cargar la sesión (ni tocar la base de datos)
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return True
+    return not request.user.is_authenticated
+
+
+def _clave(request):
+    return f'pagina:{translation.get_language()}:{request.get_full_path()}'
+
+
+def pagina_cacheada(vista):
+    """
+    Cachea el HTML de páginas que no dependen de datos, solo para visitantes
+    anónimos: los usuarios con sesión ven su navbar, así que siempre se renderiza.
+    Las claves llevan el RELEASE (KEY_PREFIX de la caché 'paginas'), así que un
+    deploy nuevo no sirve el HTML del anterior aunque nadie vacíe la caché.
+    """
+    @wraps(vista)
+    def envoltura(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or not _es_anonimo(request):
+            return vista(request, *args, **kwargs)
+
+        cache = caches[ALIAS_PAGINAS]
+        clave = _clave(request)
+        guardada = cache.get(clave)
+        if guardada is not None:
+            contenido, content_type = guardada
+            response = HttpResponse(contenido, content_type=content_type)
+            response['X-Cache'] = 'HIT'
+        else:
+            response = vista(request, *args, **kwargs)
+            # Si la página usó el token CSRF, CsrfViewMiddleware pone la cookie después
+            # de la vista: ese HTML es de este visitante y no se puede compartir
+            if (response.status_code == 200 and not response.streaming and not response.cookies
+                    and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')):
+                cache.set(clave, (response.content, response['Content-Type']), settings.PAGINAS_CACHE_SEGUNDOS)
+            response['X-Cache'] = 'MISS'
+        # El contenido cambia si el usuario inicia sesión
+        patch_vary_headers(response, ('Cookie',))
+        return response
+    return envoltura
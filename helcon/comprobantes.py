@@ -0,0 +1,140 @@
+from decimal import Decimal
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+WIDTH, HEIGHT = A4
+NAVY = colors.HexColor("#0B0B3B")
+LIGHTBLUE = colors.HexColor("#A9D0F5")
+BLUE = colors.HexColor("#5DADE2")
+GRIS_PIE = colors.HexColor("#F2F3F4")
+BLACK = colors.black
+
+MEMBRETE = 'membrete'
+# Precio de la suscripción si no hay un pago del que tomarlo (reenvío del comprobante)
+PRECIO_SUSCRIPCION = Decimal('7.99')
+
+
+def _dibujar_membrete(p):
+    """Parte fija del comprobante (círculos, encabezado y pie), dibujada una sola vez por documento."""
+    p.beginForm(MEMBRETE)
+
+    # Fondo decorativo con círculos
+    p.setFillColor(NAVY)
+    p.circle(-50, HEIGHT + 50, 150, stroke=0, fill=1)
+    p.circle(WIDTH + 50, HEIGHT - 50, 150, stroke=0, fill=1)
+
+    p.setFillColor(LIGHTBLUE)
+    p.circle(80, HEIGHT - 100, 40, stroke=0, fill=1)
+    p.circle(WIDTH - 100, HEIGHT - 250, 60, stroke=0, fill=1)
+
+    p.setFillColor(BLUE)
+    p.circle(140, HEIGHT - 130, 20, stroke=0, fill=1)
+    p.circle(WIDTH - 30, HEIGHT - 320, 15, stroke=0, fill=1)
+
+    # Encabezado
+    p.setFillColor(BLACK)
+    p.setFont("Helvetica-Bold", 24)
+    p.drawCentredString(WIDTH / 2, HEIGHT - 80, "Health")
+
+    p.setFillColor(BLUE)
+    p.drawString((WIDTH / 2) + 40, HEIGHT - 80, "Connectors")
+
+    p.setFillColor(BLACK)
+    p.setFont("Helvetica-Oblique", 10)
+    p.drawCentredString(WIDTH / 2, HEIGHT - 100, '"Connecting patients with healthcare"')
+
+    # Pie de página
+    p.setFillColor(GRIS_PIE)
+    p.rect(80, 80, WIDTH - 160, 40, stroke=0, fill=1)
+
+    p.setFillColor(BLACK)
+    p.setFont("Helvetica-Bold", 10)
+    p.drawCentredString(WIDTH / 2, 100, "Para más información contáctenos en nuestro correo")
+
+    p.setFont("Helvetica", 10)
+    p.drawCentredString(WIDTH / 2, 90, "armadillomedico2025@gmail.com")
+
+    p.endForm()
+
+
+def _pagina(p, titulo, lineas):
+    # Solo se dibujan los campos variables; el membrete se reutiliza con doForm
+    p.doForm(MEMBRETE)
+    p.setFillColor(BLACK)
+    p.setFont("Helvetica-Bold", 14)
+    p.drawCentredString(WIDTH / 2, HEIGHT - 140, titulo)
+
+    p.setFont("Helvetica-Bold", 12)
+    inicio_y = HEIGHT - 200
+    espacio = 20
+    for i, linea in enumerate(lineas):
+        p.drawString(100, inicio_y - i * espacio, linea)
+    p.showPage()
+
+
+def renderizar(paginas):
+    """
+    Renderiza una o varias páginas (titulo, lineas) en un mismo PDF.
+    El membrete se define una vez como form XObject y cada página lo referencia.
+    """
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=A4, invariant=1)
+    _dibujar_membrete(p)
+    for titulo, lineas in paginas:
+        _pagina(p, titulo, lineas)
+    p.save()
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _renderizar_cacheado(titulo, lineas):
+    return renderizar([(titulo, list(lineas))])
+
+
+def renderizar_comprobante(titulo, lineas):
+    # Los mismos datos producen el mismo PDF (invariant=1), así que se cachea
+    return BytesIO(_renderizar_cacheado(titulo, tuple(lineas)))
+
+
+def datos_suscripcion(doctor, fecha_inicio, precio_mensual=PRECIO_SUSCRIPCION, periodo="1 mes", metodo_pago="Tarjeta de crédito"):
+    return (
+        "COMPROBANTE DE SUSCRIPCIÓN MENSUAL",
+        [
+            f"Doctor: {doctor.user.first_name}",
+            f"Fecha inicio / Start Date: {fecha_inicio.strftime('%d/%m/%Y')}",
+            f"Precio mensual / Monthly Fee: ${precio_mensual:.2f}",
+            f"Periodo / Period: {periodo}",
+            f"Método de pago / Payment method: {metodo_pago}",
+        ],
+    )
+
+
+def datos_cita(cita):
+    lineas = [
+        f"Comprobante N° / Receipt No.: {cita.id}",
+        f"Paciente / Patient: {cita.nombre}",
+        f"Doctor: {cita.doctor_nombre}",
+        f"Fecha / Date: {cita.fecha.strftime('%d/%m/%Y') if hasattr(cita.fecha, 'strftime') else cita.fecha}",
+        f"Hora / Time: {cita.hora}",
+        f"Motivo / Reason: {cita.motivo_visita}",
+    ]
+    if cita.precio is not None:
+        lineas.append(f"Monto pagado / Amount paid: ${cita.precio:.2f}")
+    return "COMPROBANTE DE PAGO DE CITA MÉDICA", lineas
+
+
+def generar_comprobante_suscripcion_pdf(doctor, fecha_inicio, precio_mensual, periodo="1 mes", metodo_pago="Tarjeta de crédito"):
+    return renderizar_comprobante(*datos_suscripcion(doctor, fecha_inicio, precio_mensual, periodo, metodo_pago))
+
+
+def generar_comprobante_pdf(cita):
+    return renderizar_comprobante(*datos_cita(cita))
+
+
+def generar_comprobantes_citas_pdf(citas):
+    """Lote: todas las citas en un solo PDF (una página por cita, un solo membrete)."""
+    return BytesIO(renderizar([datos_cita(cita) for cita in citas]))
@@ -1,29 +1,11 @@
-from .models import Doctor,Paciente
+from django.utils.functional import SimpleLazyObject
 
-def doctor_context(request):
-    doctor = None
-    if request.user.is_authenticated:
-        try:
-            doctor = Doctor.objects.get(user=request.user)
-        except Doctor.DoesNotExist:
-            pass
-    return {'doctor': doctor}
-
-from .models import Doctor, Paciente
+from .middleware import obtener_perfil
 
 def navbar_context(request):
-    doctor = None
-    paciente = None
-    if request.user.is_authenticated:
-        try:
-            doctor = Doctor.objects.get(user=request.user)
-        except Doctor.DoesNotExist:
-            pass
-        try:
-            paciente = Paciente.objects.get(user=request.user)
-        except Paciente.DoesNotExist:
-            pass
+    # Perezoso: solo consulta si la plantilla usa doctor/paciente, y comparte
+    # la carga con la vista a través de obtener_perfil(request)
     return {
-        'doctor': doctor,
-        'paciente': paciente,
-    }
\ No newline at end of file
+        'doctor': SimpleLazyObject(lambda: obtener_perfil(request).doctor),
+        'paciente': SimpleLazyObject(lambda: obtener_perfil(request).paciente),
+    }
@@ -0,0 +1,126 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import CorreoPendiente
+
+logger = logging.getLogger(__name__)
+
+MAX_INTENTOS = 5
+LEASE_MINUTOS = 10
+
+
+def encolar_correo(asunto, cuerpo, destinatarios, remitente=None, adjunto=None, adjunto_nombre='', adjunto_mime='application/pdf', adjunto_ruta=''):
+    """
+    Guarda el correo en la cola en vez de enviarlo por SMTP dentro del
+    request. Lo entrega el comando `python manage.py enviar_correos`.
+    El adjunto puede ir como bytes (adjunto) o como archivo ya guardado en
+    MEDIA_ROOT (adjunto_ruta), que se comparte entre destinatarios.
+    """
+    tiene_adjunto = bool(adjunto or adjunto_ruta)
+    return CorreoPendiente.objects.create(
+        asunto=asunto,
+        cuerpo=cuerpo,
+        remitente=remitente or settings.DEFAULT_FROM_EMAIL,
+        destinatarios=list(destinatarios),
+        adjunto=adjunto,
+        adjunto_ruta=adjunto_ruta,
+        adjunto_nombre=adjunto_nombre if tiene_adjunto else '',
+        adjunto_mime=adjunto_mime if tiene_adjunto else '',
+    )
+
+
+def _leer_adjunto(ruta, cache):
+    # Un archivo se lee una sola vez por lote y el mismo objeto bytes se adjunta a todos
+    if ruta not in cache:
+        with default_storage.open(ruta, 'rb') as archivo:
+            cache[ruta] = archivo.read()
+    return cache[ruta]
+
+
+def _mensaje(correo, connection, adjuntos):
+    email = EmailMessage(
+        subject=correo.asunto,
+        body=correo.cuerpo,
+        from_email=correo.remitente,
+        to=correo.destinatarios,
+        connection=connection,
+    )
+    if correo.adjunto_ruta:
+        email.attach(correo.adjunto_nombre, _leer_adjunto(correo.adjunto_ruta, adjuntos), correo.adjunto_mime)
+    elif correo.adjunto:
+        email.attach(correo.adjunto_nombre, bytes(correo.adjunto), correo.adjunto_mime)
+    return email
+
+
+def _tomar_pendientes(limite):
+    # Toma los correos uno a uno con compare-and-swap para que dos workers no
+    # envíen el mismo. El 'enviando' caduca a los LEASE_MINUTOS por si el worker muere.
+    ahora = timezone.now()
+    candidatos = CorreoPendiente.objects.filter(
+        estado__in=[CorreoPendiente.PENDIENTE, CorreoPendiente.ENVIANDO],
+        proximo_intento__lte=ahora,
+    ).order_by('proximo_intento').values_list('id', 'estado', 'proximo_intento')[:limite]
+    tomados = [
+        correo_id for correo_id, estado, proximo in candidatos
+        if CorreoPendiente.objects.filter(id=correo_id, estado=estado, proximo_intento=proximo).update(
+            estado=CorreoPendiente.ENVIANDO,
+            proximo_intento=ahora + timedelta(minutes=LEASE_MINUTOS),
+        )
+    ]
+    return list(CorreoPendiente.objects.filter(id__in=tomados))
+
+
+def _registrar_error(correo, error):
+    logger.warning('Error enviando correo %s: %s', correo.id, error)
+    correo.intentos += 1
+    correo.ultimo_error = str(error)
+    if correo.intentos >= MAX_INTENTOS:
+        correo.estado = CorreoPendiente.FALLIDO
+    else:
+        correo.estado = CorreoPendiente.PENDIENTE
+        correo.proximo_intento = timezone.now() + timedelta(minutes=2 ** (correo.intentos - 1))
+    correo.save(update_fields=['intentos', 'ultimo_error', 'estado', 'proximo_intento'])
+
+
+def enviar_pendientes(limite=50, connection=None):
+    """
+    Envía un lote de la cola reutilizando una sola conexión SMTP.
+    Los fallos se reintentan con espera exponencial (1, 2, 4, 8... minutos).
+    Devuelve (enviados, fallidos).
+    """
+    correos = _tomar_pendientes(limite)
+    if not correos:
+        return 0, 0
+
+    connection = connection or get_connection()
+    enviados = fallidos = 0
+    try:
+        connection.open()
+    except Exception as e:
+        # Servidor de correo caído: se reintenta todo el lote más tarde
+        for correo in correos:
+            _registrar_error(correo, e)
+        return 0, len(correos)
+
+    adjuntos = {}
+    try:
+        for correo in correos:
+            try:
+                _mensaje(correo, connection, adjuntos).send()
+            except Exception as e:
+                _registrar_error(correo, e)
+                fallidos += 1
+            else:
+                correo.estado = CorreoPendiente.ENVIADO
+                correo.enviado_en = timezone.now()
+                correo.adjunto = None
+                correo.save(update_fields=['estado', 'enviado_en', 'adjunto'])
+                enviados += 1
+    finally:
+        connection.close()
+    return enviados, fallidos
@@ -0,0 +1,106 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_time
+
+from .models import SLOTS_POR_DIA, DisponibilidadDia, EstadoCita, HorarioDoctor, mascara_slots
+
+# Horario que se usa si el doctor no ha configurado el suyo: lunes a viernes de 8:00 a 17:00
+HORARIO_POR_DEFECTO = [
+    HorarioDoctor(dia_semana=dia, hora_inicio=time(8, 0), hora_fin=time(17, 0), duracion_minutos=30)
+    for dia in range(5)
+]
+MAX_DIAS_CONSULTA = 62
+
+
+def parsear_hora(valor):
+    try:
+        return parse_time((valor or '').strip())
+    except ValueError:
+        return None
+
+
+def horarios_por_dia(doctor):
+    horarios = list(doctor.horarios.all()) or HORARIO_POR_DEFECTO
+    por_dia = defaultdict(list)
+    for horario in horarios:
+        por_dia[horario.dia_semana].append(horario)
+    return por_dia
+
+
+def duracion_para(doctor, fecha, hora):
+    # Duración del slot según el bloque de horario del doctor que contiene esa hora
+    for horario in horarios_por_dia(doctor).get(fecha.weekday(), []):
+        if horario.hora_inicio <= hora < horario.hora_fin:
+            return horario.duracion_minutos
+    return 30
+
+
+def esta_libre(doctor, fecha, hora):
+    """
+    Si a esa hora empieza uno de los horarios libres del doctor: dentro de
+    su plantilla semanal (ni fuera de horario ni en días libres), sin citas
+    que lo ocupen y no en el pasado.
+    """
+    inicio = datetime.combine(fecha, hora)
+    return any(libre == inicio for libre, _ in slots_libres(doctor, fecha, fecha + timedelta(days=1)))
+
+
+def slots_libres(doctor, desde, hasta):
+    """
+    Horarios libres del doctor en [desde, hasta) como lista de
+    (inicio, fin) datetimes. Usa la plantilla semanal y los bitmaps de
+    DisponibilidadDia: una consulta por rango, sin recorrer las citas.
+    """
+    hasta = min(hasta, desde + timedelta(days=MAX_DIAS_CONSULTA))
+    por_dia = horarios_por_dia(doctor)
+    ocupados = {
+        dia.fecha: dia.bits
+        for dia in DisponibilidadDia.objects.filter(doctor=doctor, fecha__gte=desde, fecha__lt=hasta)
+    }
+    ahora = timezone.localtime().replace(tzinfo=None)
+
+    libres = []
+    fecha = desde
+    while fecha < hasta:
+        bits = ocupados.get(fecha, 0)
+        for horario in por_dia.get(fecha.weekday(), []):
+            paso = timedelta(minutes=horario.duracion_minutos)
+            inicio = datetime.combine(fecha, horario.hora_inicio)
+            limite = datetime.combine(fecha, horario.hora_fin)
+            while inicio + paso <= limite:
+                if inicio > ahora and not bits & mascara_slots(inicio.time(), horario.duracion_minutos):
+                    libres.append((inicio, inicio + paso))
+                inicio += paso
+        fecha += timedelta(days=1)
+    return libres
+
+
+def reconstruir_disponibilidad(Cita, DisponibilidadDia, doctor_id=None):
+    """
+    Recalcula los bitmaps a partir de las citas activas (las canceladas no
+    ocupan horario). Recibe los modelos para poder usarse con los de la
+    base de pruebas del benchmark.
+    """
+    citas = Cita.objects.exclude(estado_cita=EstadoCita.CANCELADA)
+    dias = DisponibilidadDia.objects.all()
+    if doctor_id is not None:
+        citas = citas.filter(doctor_id=doctor_id)
+        dias = dias.filter(doctor_id=doctor_id)
+
+    bitmaps = defaultdict(int)
+    for cita in citas.only('id', 'doctor_id', 'fecha', 'hora', 'hora_inicio', 'duracion_minutos'):
+        hora_inicio = cita.hora_inicio or parsear_hora(cita.hora)
+        if hora_inicio is None:
+            continue
+        if cita.hora_inicio is None:
+            Cita.objects.filter(pk=cita.pk).update(hora_inicio=hora_inicio)
+        bitmaps[(cita.doctor_id, cita.fecha)] |= mascara_slots(hora_inicio, cita.duracion_minutos)
+
+    dias.delete()
+    DisponibilidadDia.objects.bulk_create([
+        DisponibilidadDia(doctor_id=id_doctor, fecha=fecha, ocupados=bits.to_bytes(SLOTS_POR_DIA // 8, 'little'))
+        for (id_doctor, fecha), bits in bitmaps.items()
+    ], batch_size=500)
+    return len(bitmaps)
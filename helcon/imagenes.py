@@ -0,0 +1,133 @@
+import json
+import os
+from functools import lru_cache
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Miniaturas cuadradas de las fotos de perfil: 180px (tarjetas) y 360px (pantallas HiDPI)
+TAMANOS_MINIATURA = (180, 360)
+CALIDAD_WEBP = 80
+
+
+def ruta_miniatura(nombre, tamano):
+    base, _ = os.path.splitext(nombre)
+    return f'{base}_{tamano}.webp'
+
+
+def generar_miniaturas(foto):
+    """
+    Genera las miniaturas WebP de una foto (FieldFile) junto al original,
+    sin metadatos EXIF. Devuelve {tamaño: ruta} para Doctor.fotos_miniaturas.
+    """
+    with foto.open('rb') as archivo:
+        imagen = Image.open(archivo)
+        # Respeta la orientación de la cámara antes de descartar el EXIF
+        imagen = ImageOps.exif_transpose(imagen)
+        imagen = imagen.convert('RGBA' if imagen.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+    miniaturas = {}
+    for tamano in TAMANOS_MINIATURA:
+        recorte = ImageOps.fit(imagen, (tamano, tamano), Image.LANCZOS)
+        buffer = BytesIO()
+        # Al no pasar exif= ni icc_profile= Pillow no copia los metadatos
+        recorte.save(buffer, 'WEBP', quality=CALIDAD_WEBP, method=4)
+        ruta = ruta_miniatura(foto.name, tamano)
+        if default_storage.exists(ruta):
+            default_storage.delete(ruta)
+        miniaturas[str(tamano)] = default_storage.save(ruta, ContentFile(buffer.getvalue()))
+    return miniaturas
+
+
+# Variantes por ancho de las imágenes estáticas (helcon/static/images). Se generan
+# en helcon/static/images/variantes/ (ignorada por git) al correr collectstatic.
+STATIC_APP = os.path.join(os.path.dirname(__file__), 'static')
+ANCHOS_VARIANTES = (480, 960, 1600)
+CARPETA_VARIANTES = 'images/variantes'
+MANIFIESTO_VARIANTES = 'images/variantes/manifiesto.json'
+EXTENSIONES_IMAGEN = ('.webp', '.jpg', '.jpeg', '.png')
+
+
+def ruta_variante(ruta_estatica, ancho):
+    # 'images/sleep.webp' -> 'images/variantes/sleep_480.webp'
+    base, _ = os.path.splitext(os.path.basename(ruta_estatica))
+    return f'{CARPETA_VARIANTES}/{base}_{ancho}.webp'
+
+
+def anchos_para(ancho_original):
+    """
+    Anchos de variante de una imagen: los de ANCHOS_VARIANTES menores que el
+    original más uno al tamaño original (o al máximo), para no agrandar ni
+    anunciar en srcset un ancho que el archivo no tiene.
+    """
+    anchos = [a for a in ANCHOS_VARIANTES if a < ancho_original]
+    return anchos + [min(ancho_original, max(ANCHOS_VARIANTES))]
+
+
+def _guardar_variante(imagen, ancho, destino):
+    if imagen.width != ancho:
+        alto = round(imagen.height * ancho / imagen.width)
+        imagen = imagen.resize((ancho, alto), Image.LANCZOS)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    imagen.save(destino, 'WEBP', quality=CALIDAD_WEBP, method=4)
+
+
+def generar_variantes(origen=STATIC_APP, destino=STATIC_APP, forzar=False):
+    """
+    Crea las variantes por ancho de cada imagen de `origen` (la carpeta
+    static de la app) dentro de `destino`, y escribe el manifiesto con las
+    dimensiones originales y las rutas de cada variante. Solo regenera las
+    imágenes que cambiaron desde la última vez. Devuelve (total, generadas).
+    """
+    carpeta = os.path.join(origen, 'images')
+    manifiesto = {}
+    generadas = 0
+    for nombre in sorted(os.listdir(carpeta)):
+        ruta_origen = os.path.join(carpeta, nombre)
+        if not nombre.lower().endswith(EXTENSIONES_IMAGEN) or not os.path.isfile(ruta_origen):
+            continue
+        ruta_estatica = f'images/{nombre}'
+        modificado = os.path.getmtime(ruta_origen)
+        with Image.open(ruta_origen) as imagen:
+            ancho, alto = imagen.size
+            anchos = anchos_para(ancho)
+            pendientes = [
+                a for a in anchos
+                if forzar
+                or not os.path.exists(os.path.join(destino, ruta_variante(ruta_estatica, a)))
+                or os.path.getmtime(os.path.join(destino, ruta_variante(ruta_estatica, a))) < modificado
+            ]
+            if pendientes:
+                imagen = imagen.convert('RGBA' if imagen.mode in ('RGBA', 'LA', 'P') else 'RGB')
+                for a in pendientes:
+                    _guardar_variante(imagen, a, os.path.join(destino, ruta_variante(ruta_estatica, a)))
+                generadas += 1
+        manifiesto[ruta_estatica] = {
+            'ancho': ancho,
+            'alto': alto,
+            'variantes': {str(a): ruta_variante(ruta_estatica, a) for a in anchos},
+        }
+
+    ruta_manifiesto = os.path.join(destino, MANIFIESTO_VARIANTES)
+    os.makedirs(os.path.dirname(ruta_manifiesto), exist_ok=True)
+    with open(ruta_manifiesto, 'w') as archivo:
+        json.dump(manifiesto, archivo, indent=1, sort_keys=True)
+    return len(manifiesto), generadas
+
+
+def leer_manifiesto(destino=STATIC_APP):
+    # Se relee solo si el archivo cambió (p.ej. tras volver a correr el comando en desarrollo)
+    ruta = os.path.join(destino, MANIFIESTO_VARIANTES)
+    try:
+        modificado = os.path.getmtime(ruta)
+    except OSError:
+        return {}
+    return _cargar_manifiesto(ruta, modificado)
+
+
+@lru_cache(maxsize=4)
+def _cargar_manifiesto(ruta, modificado):
+    with open(ruta) as archivo:
+        return json.load(archivo)
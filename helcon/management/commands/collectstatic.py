@@ -0,0 +1,11 @@
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectstaticCommand
+from django.core.management import call_command
+
+
+class Command(CollectstaticCommand):
+    """collectstatic de Django, pero primero genera las variantes de las imágenes y los bundles JS/CSS."""
+
+    def handle(self, **options):
+        call_command('generar_variantes', verbosity=options['verbosity'])
+        call_command('construir_bundles', verbosity=options['verbosity'])
+        return super().handle(**options)
@@ -0,0 +1,159 @@
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Valores de SERVIDOR en gunicorn.conf.py
+MODOS = ('wsgi', 'asgi')
+
+CREAR_DOCTOR = (
+    "from django.contrib.auth.models import User; from helcon.models import Doctor; "
+    "u = User.objects.create_user('bench', 'bench@example.com', 'bench-123', first_name='Bench'); "
+    "print(Doctor.objects.create(user=u, id_number='bench', credential_number='bench').id)"
+)
+
+
+def _puerto_libre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _stripe_lento(demora):
+    """API de Stripe falsa que tarda `demora` segundos en crear cada Checkout Session."""
+    ids = itertools.count(1)
+
+    class Manejador(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            time.sleep(demora)
+            numero = next(ids)
+            cuerpo = json.dumps({
+                'id': f'cs_bench_{numero}', 'object': 'checkout.session',
+                'url': f'https://checkout.invalid/cs_bench_{numero}',
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', _puerto_libre()), Manejador)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def _esperar(puerto, segundos=30):
+    limite = time.monotonic() + segundos
+    while time.monotonic() < limite:
+        try:
+            socket.create_connection(('127.0.0.1', puerto), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f'El servidor no abrió el puerto {puerto} en {segundos} s.')
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara gunicorn.conf.py en modo WSGI (gthread) y ASGI (uvicorn) bajo concurrencia, con una '
+        'API de Stripe falsa y lenta. Usa una base sqlite temporal; no toca la base configurada.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modos', nargs='+', choices=MODOS, default=list(MODOS))
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--concurrencia', type=int, default=20, help='Peticiones simultáneas.')
+        parser.add_argument('--peticiones', type=int, default=100)
+        parser.add_argument('--demora', type=float, default=0.5, help='Segundos que tarda Stripe en responder.')
+        parser.add_argument('--json', dest='salida_json', help='Guardar los resultados en este archivo.')
+
+    def handle(self, *args, **options):
+        stripe_falso = _stripe_lento(options['demora'])
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        resultados = {}
+        with tempfile.TemporaryDirectory() as carpeta:
+            entorno = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{Path(carpeta) / 'bench.sqlite3'}",
+                STRIPE_API_BASE=f'http://127.0.0.1:{stripe_falso.server_port}',
+                STRIPE_REINTENTOS='0',
+                PAGOS_PASARELA='helcon.pasarela.PasarelaStripe',
+            )
+            manage = [sys.executable, str(settings.BASE_DIR / 'manage.py')]
+            subprocess.run([*manage, 'migrate', '-v', '0'], env=entorno, check=True)
+            doctor_id = subprocess.run(
+                [*manage, 'shell', '-v', '0', '-c', CREAR_DOCTOR], env=entorno, check=True, capture_output=True, text=True,
+            ).stdout.split()[-1]
+
+            for modo in options['modos']:
+                resultados[modo] = self._medir(modo, entorno, host, doctor_id, options)
+        stripe_falso.shutdown()
+
+        self.stdout.write(f"{'modo':<6}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errores':>9}")
+        for modo, r in resultados.items():
+            self.stdout.write(f"{modo:<6}{r['req_s']:>9.1f}{r['p50_ms']:>9.0f}{r['p99_ms']:>9.0f}{r['errores']:>9}")
+        if options['salida_json']:
+            Path(options['salida_json']).write_text(json.dumps({'opciones': {
+                k: options[k] for k in ('workers', 'concurrencia', 'peticiones', 'demora')
+            }, 'resultados': resultados}, indent=2))
+
+    def _medir(self, modo, entorno, host, doctor_id, options):
+        puerto = _puerto_libre()
+        base = f'http://127.0.0.1:{puerto}'
+        servidor = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-w', str(options['workers']), '-b', f'127.0.0.1:{puerto}',
+             '--timeout', '120', '--log-level', 'warning', '--access-logfile', '/dev/null'],
+            cwd=settings.BASE_DIR, env=dict(entorno, SERVIDOR=modo),
+        )
+        try:
+            _esperar(puerto)
+            url = f'{base}/pagar_doctor/{doctor_id}/'
+            sesion = requests.Session()
+            sesion.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=options['concurrencia']))
+
+            def pedir(_):
+                inicio = time.perf_counter()
+                respuesta = sesion.get(url, headers={'Host': host}, allow_redirects=False, timeout=120)
+                # Éxito = redirección a la Checkout Session del Stripe falso
+                return time.perf_counter() - inicio, respuesta.headers.get('Location', '').startswith('https://checkout.invalid/')
+
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(options['concurrencia']) as grupo:
+                medidas = list(grupo.map(pedir, range(options['peticiones'])))
+            total = time.perf_counter() - inicio
+        finally:
+            servidor.terminate()
+            servidor.wait()
+
+        tiempos = [t for t, ok in medidas if ok]
+        return {
+            'req_s': len(tiempos) / total,
+            'p50_ms': statistics.median(tiempos) * 1000 if tiempos else 0,
+            'p99_ms': _percentil(tiempos, 0.99) * 1000 if tiempos else 0,
+            'errores': len(medidas) - len(tiempos),
+        }
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from helcon.bundles import construir_bundles
+
+
+class Command(BaseCommand):
+    help = 'Junta y minifica los JS/CSS de cada página en helcon/static/bundles/ (ver helcon/bundles.py).'
+
+    def handle(self, *args, **options):
+        tamanos = construir_bundles()
+        for nombre, tamano in sorted(tamanos.items()):
+            self.stdout.write(f'{nombre:<24}{tamano / 1024:>8.1f} kB', style_func=None)
+        self.stdout.write(self.style.SUCCESS(f'{len(tamanos)} bundles construidos.'))
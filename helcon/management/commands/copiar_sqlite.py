@@ -0,0 +1,117 @@
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+ORIGEN = 'sqlite_origen'
+
+
+def _abrir_origen(ruta):
+    # Conexión extra de solo lectura: el archivo sqlite no se modifica (ni pasa a WAL)
+    config = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': f'file:{ruta}?mode=ro'}
+    connections.settings[ORIGEN] = connections.configure_settings({
+        DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+        ORIGEN: config,
+    })[ORIGEN]
+    return connections[ORIGEN]
+
+
+def _migraciones(conexion):
+    with conexion.cursor() as cursor:
+        cursor.execute('SELECT app, name FROM django_migrations')
+        return set(cursor.fetchall())
+
+
+def modelos_en_orden():
+    """
+    Modelos concretos ordenados para que cada tabla se cargue después de
+    las que referencia (incluye las tablas intermedias de los ManyToMany).
+    """
+    pendientes = [
+        m for m in apps.get_models(include_auto_created=True)
+        if m._meta.managed and not m._meta.proxy
+    ]
+    orden = []
+    while pendientes:
+        listos = [
+            m for m in pendientes
+            if all(
+                campo.related_model in orden or campo.related_model is m
+                for campo in m._meta.concrete_fields
+                if campo.is_relation and campo.related_model in pendientes
+            )
+        ]
+        # Ciclo de FKs: las restricciones son diferidas, así que se toma el resto tal cual
+        listos = listos or pendientes[:]
+        orden.extend(listos)
+        pendientes = [m for m in pendientes if m not in listos]
+    return orden
+
+
+class Command(BaseCommand):
+    help = (
+        'Copia todos los datos del db.sqlite3 local a la base configurada en DATABASE_URL. '
+        'La base destino debe estar migrada; sus tablas se vacían antes de copiar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--origen', default=str(settings.BASE_DIR / 'db.sqlite3'), help='Archivo sqlite de origen.')
+        parser.add_argument('--lote', type=int, default=1000, help='Filas por INSERT.')
+        parser.add_argument('--noinput', action='store_true', help='No pedir confirmación.')
+
+    def handle(self, *args, **options):
+        ruta = Path(options['origen']).resolve()
+        if not ruta.exists():
+            raise CommandError(f'No existe {ruta}.')
+
+        destino = connections[DEFAULT_DB_ALIAS]
+        if destino.vendor == 'sqlite' and Path(str(destino.settings_dict['NAME'])).resolve() == ruta:
+            raise CommandError('DATABASE_URL apunta al mismo archivo sqlite; define la base destino.')
+
+        origen = _abrir_origen(ruta)
+        faltan = _migraciones(origen) ^ _migraciones(destino)
+        if faltan:
+            pendientes = ', '.join(sorted(f'{app}.{nombre}' for app, nombre in faltan)[:5])
+            raise CommandError(
+                f'Origen y destino no tienen las mismas migraciones ({pendientes}...). '
+                'Ejecuta migrate en ambas bases antes de copiar.'
+            )
+
+        if not options['noinput']:
+            respuesta = input(f'Se vaciarán las tablas de "{destino.settings_dict["NAME"]}". ¿Continuar? [s/N] ')
+            if respuesta.strip().lower() not in ('s', 'si', 'sí', 'y', 'yes'):
+                raise CommandError('Cancelado.')
+
+        modelos = modelos_en_orden()
+        lote = options['lote']
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            # contenttypes y permisos ya los creó migrate con otros ids: se reemplazan por los del origen
+            for modelo in reversed(modelos):
+                modelo._base_manager.using(DEFAULT_DB_ALIAS).all().delete()
+
+            for modelo in modelos:
+                filas = modelo._base_manager.using(ORIGEN).order_by('pk').iterator(chunk_size=lote)
+                total = 0
+                bloque = []
+                for fila in filas:
+                    bloque.append(fila)
+                    if len(bloque) >= lote:
+                        modelo._base_manager.using(DEFAULT_DB_ALIAS).bulk_create(bloque)
+                        total += len(bloque)
+                        bloque = []
+                if bloque:
+                    modelo._base_manager.using(DEFAULT_DB_ALIAS).bulk_create(bloque)
+                    total += len(bloque)
+                self.stdout.write(f'{modelo._meta.label}: {total}')
+
+            # Las secuencias de PostgreSQL siguen en 1 tras insertar ids explícitos
+            sentencias = destino.ops.sequence_reset_sql(no_style(), modelos)
+            with destino.cursor() as cursor:
+                for sql in sentencias:
+                    cursor.execute(sql)
+
+        origen.close()
+        self.stdout.write(self.style.SUCCESS(f'{len(modelos)} tablas copiadas desde {ruta}.'))
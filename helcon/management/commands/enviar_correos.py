@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from helcon.correo import enviar_pendientes
+
+
+class Command(BaseCommand):
+    help = 'Envía los correos en cola (CorreoPendiente) reutilizando la conexión SMTP.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limite', type=int, default=50, help='Correos por lote.')
+        parser.add_argument('--loop', action='store_true', help='Seguir corriendo como worker.')
+        parser.add_argument('--intervalo', type=float, default=5, help='Segundos entre lotes con --loop.')
+
+    def handle(self, *args, **options):
+        while True:
+            # Fuera de un request nadie cierra las conexiones caducadas (CONN_MAX_AGE) o rotas
+            close_old_connections()
+            try:
+                enviados, fallidos = enviar_pendientes(limite=options['limite'])
+            except DatabaseError as e:
+                if not options['loop']:
+                    raise
+                # Base caída o bloqueada: el worker sigue y reintenta en el próximo lote
+                self.stderr.write(f'Error de base de datos: {e}')
+                time.sleep(options['intervalo'])
+                continue
+            if enviados or fallidos:
+                self.stdout.write(f'{enviados} enviados, {fallidos} con error.')
+            if not options['loop']:
+                break
+            # Si el lote vino lleno se sigue de inmediato
+            if enviados + fallidos < options['limite']:
+                time.sleep(options['intervalo'])
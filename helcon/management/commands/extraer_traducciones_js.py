@@ -0,0 +1,169 @@
+import ast
+import glob
+import os
+import re
+
+import polib
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.translation.template import templatize
+
+RE_BLOQUE = re.compile(r'^\s*(es|en)\s*:\s*\{', re.M)
+RE_CLAVE = re.compile(r'\s*([A-Za-z_$][\w$]*|\'[^\']*\'|"[^"]*")\s*:\s*')
+RE_ARCHIVO = re.compile(r'^[\w.()-]+\.(webp|png|jpe?g|svg|gif)$', re.I)  # nombres de imagen, no texto
+ESCAPES = {'n': '\n', 't': '\t', "'": "'", '"': '"', '`': '`', '\\': '\\'}
+# gettext('...') en la salida de templatize (lo mismo que lee makemessages) y _('...') en el código
+RE_GETTEXT = re.compile(r"""\b(?:gettext|_)\((u?'(?:[^'\\]|\\.)*'|u?"(?:[^"\\]|\\.)*")\)""")
+
+
+def _saltar_espacios(texto, i):
+    # Espacios y comentarios // o /* */
+    while i < len(texto):
+        if texto[i].isspace():
+            i += 1
+        elif texto.startswith('//', i):
+            i = texto.find('\n', i) if '\n' in texto[i:] else len(texto)
+        elif texto.startswith('/*', i):
+            i = texto.index('*/', i) + 2
+        else:
+            break
+    return i
+
+
+def _leer_cadena(texto, i):
+    comilla = texto[i]
+    valor = []
+    i += 1
+    while texto[i] != comilla:
+        if texto[i] == '\\':
+            valor.append(ESCAPES.get(texto[i + 1], texto[i + 1]))
+            i += 2
+        else:
+            valor.append(texto[i])
+            i += 1
+    return ''.join(valor), i + 1
+
+
+def leer_diccionario(texto, i):
+    """
+    Lee el objeto literal {clave: 'texto', ...} que empieza en texto[i] == '{'.
+    Solo guarda los valores que son una cadena simple (sin ${...} ni concatenaciones).
+    Devuelve ({clave: texto}, posición después de '}').
+    """
+    resultado = {}
+    i += 1
+    while True:
+        i = _saltar_espacios(texto, i)
+        if texto[i] == '}':
+            return resultado, i + 1
+        m = RE_CLAVE.match(texto, i)
+        clave = m.group(1).strip('\'"')
+        i = _saltar_espacios(texto, m.end())
+        if texto[i] in '\'"`':
+            comilla = texto[i]
+            valor, i = _leer_cadena(texto, i)
+            i = _saltar_espacios(texto, i)
+            simple = texto[i] in ',}' and not (comilla == '`' and '${' in valor)
+        else:
+            valor, simple = None, False
+        # Valor no literal: se salta hasta la siguiente coma al mismo nivel
+        profundidad = 0
+        while not (profundidad == 0 and texto[i] in ',}'):
+            if texto[i] in '\'"`':
+                _, i = _leer_cadena(texto, i)
+                continue
+            profundidad += {'(': 1, '[': 1, '{': 1, ')': -1, ']': -1, '}': -1}.get(texto[i], 0)
+            i += 1
+        if simple:
+            resultado[clave] = valor
+        if texto[i] == ',':
+            i += 1
+
+
+def diccionarios_js(ruta):
+    # {'es': {...}, 'en': {...}} de un archivo de helcon/static/js
+    with open(ruta, encoding='utf-8') as archivo:
+        texto = archivo.read()
+    idiomas = {}
+    for m in RE_BLOQUE.finditer(texto):
+        idiomas.setdefault(m.group(1), {}).update(leer_diccionario(texto, m.end() - 1)[0])
+    return idiomas
+
+
+def textos_usados(base):
+    """
+    msgids que usan las plantillas ({% translate %}, {% blocktranslate %}) y
+    el código Python de helcon. Solo esos van al catálogo: los textos de las
+    páginas que aún se traducen en el navegador se quedan en su JS.
+    """
+    usados = set()
+    carpeta = os.path.join(base, 'helcon')
+    for ruta in glob.glob(os.path.join(carpeta, 'templates', '**', '*.html'), recursive=True):
+        with open(ruta, encoding='utf-8') as archivo:
+            fuente = templatize(archivo.read(), origin=ruta)
+        usados.update(ast.literal_eval(m.group(1)) for m in RE_GETTEXT.finditer(fuente))
+    for ruta in glob.glob(os.path.join(carpeta, '**', '*.py'), recursive=True):
+        if f'{os.sep}migrations{os.sep}' in ruta:
+            continue
+        with open(ruta, encoding='utf-8') as archivo:
+            usados.update(ast.literal_eval(m.group(1)) for m in RE_GETTEXT.finditer(archivo.read()))
+    return usados
+
+
+class Command(BaseCommand):
+    help = (
+        'Pasa a locale/en/LC_MESSAGES/django.po la traducción de los textos que usan las plantillas '
+        '(msgid en español), tomándola de los diccionarios es/en de los JS de traducción, quita los que '
+        'ya no se usan y compila los .mo de todos los idiomas. Al pasar una página a {% translate %} '
+        'se corre este comando para llevar sus textos al catálogo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivos', nargs='*', help='JS a extraer (por defecto todos los de helcon/static/js).')
+
+    def handle(self, *args, **options):
+        base = settings.BASE_DIR
+        archivos = options['archivos'] or sorted(glob.glob(os.path.join(base, 'helcon', 'static', 'js', '*.js')))
+        ruta_po = os.path.join(settings.LOCALE_PATHS[0], 'en', 'LC_MESSAGES', 'django.po')
+        os.makedirs(os.path.dirname(ruta_po), exist_ok=True)
+        po = polib.pofile(ruta_po) if os.path.exists(ruta_po) else polib.POFile()
+        po.metadata.setdefault('Content-Type', 'text/plain; charset=UTF-8')
+        po.metadata.setdefault('Language', 'en')
+
+        usados = textos_usados(base)
+        nuevas = conflictos = 0
+        for ruta in archivos:
+            idiomas = diccionarios_js(ruta)
+            es, en = idiomas.get('es', {}), idiomas.get('en', {})
+            origen = os.path.relpath(ruta, base)
+            for clave, texto_es in es.items():
+                texto_en = en.get(clave)
+                if texto_es not in usados and texto_en and texto_es.replace('%', '%%') in usados:
+                    # {% translate %} busca el texto con los % duplicados
+                    texto_es, texto_en = texto_es.replace('%', '%%'), texto_en.replace('%', '%%')
+                if texto_es not in usados or not texto_en or texto_es == texto_en or RE_ARCHIVO.match(texto_es):
+                    continue
+                # polib solo separa números de línea, así que 'archivo.js:clave' va entero
+                referencia = (f'{origen}:{clave}', '')
+                entrada = po.find(texto_es)
+                if entrada is None:
+                    po.append(polib.POEntry(msgid=texto_es, msgstr=texto_en, occurrences=[referencia]))
+                    nuevas += 1
+                elif entrada.msgstr == texto_en:
+                    if referencia not in entrada.occurrences:
+                        entrada.occurrences.append(referencia)
+                else:
+                    # El mismo texto en español traducido distinto en otro archivo: gana el primero
+                    conflictos += 1
+                    self.stderr.write(f'{origen}:{clave}: "{texto_es}" ya se traduce como "{entrada.msgstr}"')
+        sobrantes = [entrada for entrada in po if entrada.msgid not in usados]
+        for entrada in sobrantes:
+            po.remove(entrada)
+        po.save(ruta_po)
+
+        for ruta in glob.glob(os.path.join(settings.LOCALE_PATHS[0], '*', 'LC_MESSAGES', '*.po')):
+            # polib en vez de msgfmt: compilemessages necesita gettext instalado en el sistema
+            polib.pofile(ruta).save_as_mofile(ruta[:-3] + '.mo')
+        self.stdout.write(self.style.SUCCESS(
+            f'{nuevas} textos nuevos, {len(sobrantes)} quitados, {conflictos} conflictos; .mo compilados.'
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from helcon.imagenes import generar_miniaturas
+from helcon.models import Doctor
+
+
+class Command(BaseCommand):
+    help = 'Genera las miniaturas WebP de las fotos de perfil de los doctores que aún no las tienen.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--todas', action='store_true', help='Regenerar también las que ya existen.')
+
+    def handle(self, *args, **options):
+        doctores = Doctor.objects.exclude(foto_perfil='').only('id', 'foto_perfil', 'fotos_miniaturas')
+        generadas = 0
+        for doctor in doctores.iterator():
+            if doctor.fotos_miniaturas and not options['todas']:
+                continue
+            try:
+                miniaturas = generar_miniaturas(doctor.foto_perfil)
+            except OSError as e:
+                self.stderr.write(f'Doctor {doctor.id}: {e}')
+                continue
+            Doctor.objects.filter(pk=doctor.pk).update(fotos_miniaturas=miniaturas)
+            generadas += 1
+        self.stdout.write(self.style.SUCCESS(f'{generadas} fotos procesadas.'))
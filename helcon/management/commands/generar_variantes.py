@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from helcon.imagenes import generar_variantes
+
+
+class Command(BaseCommand):
+    help = 'Genera las variantes por ancho de helcon/static/images y su manifiesto para {% responsive_image %}.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--forzar', action='store_true', help='Regenerar todas aunque no hayan cambiado.')
+
+    def handle(self, *args, **options):
+        total, generadas = generar_variantes(forzar=options['forzar'])
+        self.stdout.write(self.style.SUCCESS(f'{total} imágenes en el manifiesto, {generadas} regeneradas.'))
@@ -0,0 +1,15 @@
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+
+from helcon.cache import ALIAS_PAGINAS
+
+
+class Command(BaseCommand):
+    help = (
+        'Vacía la caché de páginas estáticas (p.ej. tras editar una plantilla sin cambiar RELEASE). '
+        'En un deploy no hace falta: las claves llevan el release.'
+    )
+
+    def handle(self, *args, **options):
+        caches[ALIAS_PAGINAS].clear()
+        self.stdout.write(self.style.SUCCESS('Caché de páginas vaciada.'))
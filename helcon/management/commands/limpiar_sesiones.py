@@ -0,0 +1,26 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Borra las sesiones vencidas (como clearsessions); con --loop corre como worker.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Seguir corriendo como worker.')
+        parser.add_argument('--intervalo', type=float, default=6 * 60 * 60, help='Segundos entre limpiezas con --loop.')
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        while True:
+            try:
+                # db y cached_db borran filas; cookies y caché expiran solas (no hace nada)
+                engine.SessionStore.clear_expired()
+            except NotImplementedError:
+                self.stdout.write(f'{settings.SESSION_ENGINE} no necesita limpieza.')
+                break
+            if not options['loop']:
+                break
+            time.sleep(options['intervalo'])
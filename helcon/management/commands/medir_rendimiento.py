@@ -0,0 +1,132 @@
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.utils import timezone
+
+from helcon.pasarela import obtener_pasarela
+from helcon.rendimiento import FLUJOS, FlujoFallido, medir, sembrar
+
+TAMANOS = [100, 10_000, 100_000]
+# Columnas de --comparar: (métrica, True si más alto es mejor, ancho)
+METRICAS_COMPARADAS = [('por_segundo', True, 9), ('p50_ms', False, 9), ('p99_ms', False, 9), ('consultas', False, 6)]
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark de punta a punta sin red: siembra una base de pruebas temporal con N doctores y N citas '
+        'y mide iteraciones/s, p50/p99 y consultas SQL de cada flujo con el cliente de pruebas de Django. '
+        'No toca la base configurada.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tamanos', nargs='+', type=int, default=TAMANOS, help='Doctores y citas a sembrar.')
+        parser.add_argument('--flujos', nargs='+', choices=list(FLUJOS), default=list(FLUJOS))
+        parser.add_argument('--iteraciones', type=int, default=50)
+        parser.add_argument('--calentamiento', type=int, default=3, help='Iteraciones sin medir antes de cada flujo.')
+        parser.add_argument('--semilla', type=int, default=0)
+        parser.add_argument('--json', dest='salida_json', help='Guardar los resultados en este archivo.')
+        parser.add_argument('--comparar', help='JSON de una corrida anterior (p.ej. de otro commit) para mostrar la diferencia.')
+
+    def handle(self, *args, **options):
+        anterior = None
+        if options['comparar']:
+            try:
+                anterior = json.loads(Path(options['comparar']).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f'No se pudo leer {options["comparar"]}: {e}')
+
+        resultados = {}
+        with tempfile.TemporaryDirectory() as carpeta, override_settings(
+            ALLOWED_HOSTS=['testserver'],
+            DEBUG=False,
+            PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa',
+            METRICAS_REQUEST=False,
+            MEDIA_ROOT=carpeta,
+            EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+        ):
+            for tamano in options['tamanos']:
+                resultados[str(tamano)] = self._medir_tamano(tamano, carpeta, options)
+
+        salida = {
+            'commit': _commit(),
+            'fecha': timezone.now().isoformat(timespec='seconds'),
+            'entorno': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'base': connection.vendor,
+                'plataforma': platform.platform(),
+            },
+            'opciones': {k: options[k] for k in ('iteraciones', 'calentamiento', 'semilla')},
+            'resultados': resultados,
+        }
+        self._imprimir(resultados, anterior)
+        if options['salida_json']:
+            Path(options['salida_json']).write_text(json.dumps(salida, indent=2, ensure_ascii=False))
+
+    def _medir_tamano(self, tamano, carpeta, options):
+        if connection.vendor == 'sqlite':
+            # En archivo (no en memoria) para medir con los mismos PRAGMA que producción
+            connection.settings_dict['TEST']['NAME'] = str(Path(carpeta) / f'rendimiento_{tamano}.sqlite3')
+        config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+        try:
+            for alias in ('default', 'paginas', 'reserva'):
+                caches[alias].clear()
+            obtener_pasarela().reiniciar()
+
+            inicio = time.perf_counter()
+            datos = sembrar(tamano, options['semilla'])
+            siembra_s = round(time.perf_counter() - inicio, 2)
+            self.stdout.write(f'{tamano} doctores y citas sembrados en {siembra_s} s')
+
+            flujos = {}
+            for nombre in options['flujos']:
+                try:
+                    flujos[nombre] = medir(FLUJOS[nombre], datos, options['iteraciones'], options['calentamiento'])
+                except FlujoFallido as e:
+                    raise CommandError(f'El flujo {nombre} falló con {tamano}: {e}')
+            return {'siembra_s': siembra_s, 'flujos': flujos}
+        finally:
+            teardown_databases(config, verbosity=0)
+
+    def _imprimir(self, resultados, anterior):
+        self.stdout.write(f"{'tamaño':>8} {'flujo':<14}{'it/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'SQL':>6}")
+        for tamano, resultado in resultados.items():
+            for nombre, r in resultado['flujos'].items():
+                self.stdout.write(
+                    f"{tamano:>8} {nombre:<14}{r['por_segundo']:>9.1f}{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['consultas']:>6.1f}"
+                )
+                previo = (anterior or {}).get('resultados', {}).get(tamano, {}).get('flujos', {}).get(nombre)
+                if previo:
+                    self.stdout.write(f"{'':>8} {'  vs ' + str(anterior.get('commit') or 'anterior'):<14}" + ''.join(
+                        self._diferencia(r[m], previo.get(m), mas_es_mejor, ancho)
+                        for m, mas_es_mejor, ancho in METRICAS_COMPARADAS
+                    ))
+
+    def _diferencia(self, actual, previo, mas_es_mejor, ancho):
+        if not previo:
+            return f"{'-':>{ancho}}"
+        cambio = (actual - previo) / previo * 100
+        texto = f"{f'{cambio:+.0f}%':>{ancho}}"
+        if abs(cambio) < 5:  # ruido entre corridas
+            return texto
+        mejor = cambio > 0 if mas_es_mejor else cambio < 0
+        return self.style.SUCCESS(texto) if mejor else self.style.ERROR(texto)
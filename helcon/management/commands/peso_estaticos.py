@@ -0,0 +1,70 @@
+import os
+import re
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.urls import resolve, reverse
+
+PAGINAS = [
+    'home', 'segpag', 'tercerapag', 'cuarpag', 'journal1', 'journal2', 'journal3',
+    'journal4', 'journal5', 'journal6', 'contacto', 'terms', 'privacy_policies', 'difamation',
+]
+
+RE_SCRIPT = re.compile(r'<script[^>]+src="([^"]+)"')
+RE_CSS = re.compile(r'<link[^>]+rel="stylesheet"[^>]*href="([^"]+)"|<link[^>]+href="([^"]+)"[^>]*rel="stylesheet"')
+RE_IMG = re.compile(r'<img[^>]+>')
+RE_SRC = re.compile(r'\ssrc="([^"]+)"')
+
+
+def _tamanos(url):
+    # (original, gzip, brotli) en bytes del archivo en STATIC_ROOT; None si no es un estático local
+    if not url.startswith(settings.STATIC_URL):
+        return None
+    ruta = os.path.join(settings.STATIC_ROOT, url[len(settings.STATIC_URL):].split('?')[0])
+    if not os.path.exists(ruta):
+        return None
+    original = os.path.getsize(ruta)
+    comprimidos = [os.path.getsize(ruta + ext) if os.path.exists(ruta + ext) else original for ext in ('.gz', '.br')]
+    return original, *comprimidos
+
+
+class Command(BaseCommand):
+    help = 'Reporta el peso de los JS, CSS e imágenes que descarga cada página pública (correr después de collectstatic).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paginas', nargs='*', help='Nombres de URL a medir (por defecto las páginas públicas).')
+
+    def handle(self, *args, **options):
+        if not os.path.exists(os.path.join(settings.STATIC_ROOT, 'staticfiles.json')):
+            raise CommandError('No hay manifiesto en STATIC_ROOT: corre primero `manage.py collectstatic`.')
+
+        factory = RequestFactory()
+        self.stdout.write(f"{'página':<18}{'JS':>10}{'CSS':>10}{'img':>10}{'diferidas':>11}{'externos':>10}{'total br':>11}")
+        # Con DEBUG=False {% static %} devuelve los nombres con hash, como en producción
+        with override_settings(DEBUG=False):
+            for nombre in options['paginas'] or PAGINAS:
+                url = reverse(nombre)
+                request = factory.get(url)
+                request.user = AnonymousUser()
+                html = resolve(url).func(request).content.decode()
+
+                scripts = RE_SCRIPT.findall(html)
+                estilos = [a or b for a, b in RE_CSS.findall(html)]
+                imagenes = RE_IMG.findall(html)
+                inmediatas = [m.group(1) for img in imagenes if 'loading="lazy"' not in img and (m := RE_SRC.search(img))]
+
+                pesos = {}
+                externos = 0
+                for tipo, urls in (('js', scripts), ('css', estilos), ('img', inmediatas)):
+                    tamanos = [_tamanos(u) for u in urls]
+                    externos += sum(1 for t in tamanos if t is None)
+                    # Se mide lo que viaja: Brotli para texto, el archivo tal cual para imágenes
+                    pesos[tipo] = sum(t[0] if tipo == 'img' else t[2] for t in tamanos if t)
+
+                total = sum(pesos.values())
+                self.stdout.write(
+                    f"{nombre:<18}{pesos['js'] / 1024:>8.1f}kB{pesos['css'] / 1024:>8.1f}kB{pesos['img'] / 1024:>8.1f}kB"
+                    f"{len(imagenes) - len(inmediatas):>11}{externos:>10}{total / 1024:>9.1f}kB"
+                )
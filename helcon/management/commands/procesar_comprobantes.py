@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from helcon.trabajos import crear_pool, procesar_trabajos
+
+
+class Command(BaseCommand):
+    help = 'Genera los PDF de comprobantes en cola con un pool de procesos y encola sus correos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limite', type=int, default=20, help='Trabajos por lote.')
+        parser.add_argument('--workers', type=int, default=2, help='Procesos para generar PDFs (0 = sin pool).')
+        parser.add_argument('--loop', action='store_true', help='Seguir corriendo como worker.')
+        parser.add_argument('--intervalo', type=float, default=2, help='Segundos entre lotes con --loop.')
+
+    def handle(self, *args, **options):
+        executor = crear_pool(options['workers']) if options['workers'] > 0 else None
+        try:
+            while True:
+                # Fuera de un request nadie cierra las conexiones caducadas (CONN_MAX_AGE) o rotas
+                close_old_connections()
+                try:
+                    listos, errores = procesar_trabajos(limite=options['limite'], executor=executor)
+                except DatabaseError as e:
+                    if not options['loop']:
+                        raise
+                    # Base caída o bloqueada: los trabajos tomados se retoman al vencer su lease
+                    self.stderr.write(f'Error de base de datos: {e}')
+                    time.sleep(options['intervalo'])
+                    continue
+                if listos or errores:
+                    self.stdout.write(f'{listos} comprobantes generados, {errores} con error.')
+                if not options['loop']:
+                    break
+                if listos + errores < options['limite']:
+                    time.sleep(options['intervalo'])
+        finally:
+            if executor:
+                executor.shutdown()
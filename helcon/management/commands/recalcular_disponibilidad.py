@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from helcon.disponibilidad import reconstruir_disponibilidad
+from helcon.models import Cita, DisponibilidadDia
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye los bitmaps de disponibilidad de los doctores a partir de las citas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--doctor', type=int, help='Solo recalcular este doctor (id).')
+
+    def handle(self, *args, **options):
+        dias = reconstruir_disponibilidad(Cita, DisponibilidadDia, doctor_id=options.get('doctor'))
+        self.stdout.write(self.style.SUCCESS(f'{dias} días de agenda recalculados.'))
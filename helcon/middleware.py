@@ -0,0 +1,253 @@
+import logging
+import time
+from contextvars import ContextVar
+from functools import partial, wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import Template as PlantillaDjango
+from django.utils.functional import SimpleLazyObject
+
+from .models import Doctor, Paciente
+
+# Clave de sesión donde se recuerda el rol del usuario ('doctor' o 'paciente')
+SESSION_ROL = 'perfil_rol'
+
+
+class Perfil:
+    def __init__(self, user_id=None, rol=None, doctor=None, paciente=None):
+        self.user_id = user_id
+        self.rol = rol
+        self.doctor = doctor
+        self.paciente = paciente
+
+    def __bool__(self):
+        return self.rol is not None
+
+
+def _buscar_perfil(user, rol):
+    # get() y no first(): user es único y first() agrega un ORDER BY id que obliga a ordenar
+    modelo = Doctor if rol == 'doctor' else Paciente
+    try:
+        encontrado = modelo.objects.select_related('user').get(user=user)
+    except modelo.DoesNotExist:
+        return None
+    return Perfil(user.pk, rol, **{rol: encontrado})
+
+
+def cargar_perfil(request, user=None):
+    """
+    Carga el doctor o paciente del usuario. Si el rol ya está guardado en la
+    sesión solo se consulta esa tabla; los anónimos no hacen ninguna consulta.
+    """
+    user = request.user if user is None else user
+    if not user.is_authenticated:
+        return Perfil()
+
+    session = getattr(request, 'session', None)
+    guardado = session.get(SESSION_ROL) if session is not None else None
+    roles = ['doctor', 'paciente']
+    if guardado and guardado.get('user') == user.pk and guardado.get('rol') in roles:
+        roles.remove(guardado['rol'])
+        roles.insert(0, guardado['rol'])
+
+    for rol in roles:
+        perfil = _buscar_perfil(user, rol)
+        if perfil:
+            if session is not None and guardado != {'user': user.pk, 'rol': rol}:
+                session[SESSION_ROL] = {'user': user.pk, 'rol': rol}
+            return perfil
+    return Perfil(user.pk)
+
+
+def obtener_perfil(request, user=None):
+    # Una sola carga por request (se recalcula si cambia el usuario, p.ej. tras login)
+    user = request.user if user is None else user
+    perfil = getattr(request, '_perfil', None)
+    if perfil is None or perfil.user_id != user.pk:
+        perfil = cargar_perfil(request, user)
+        request._perfil = perfil
+    return perfil
+
+
+async def aobtener_perfil(request):
+    # Vistas async: la sesión y las consultas corren en el hilo de sync_to_async.
+    # Con el usuario de auser() (ya cargado por login_required): request.user es
+    # otro objeto perezoso y lo volvería a consultar
+    return await sync_to_async(obtener_perfil)(request, await request.auser())
+
+
+def limpiar_perfil(request):
+    request.__dict__.pop('_perfil', None)
+    if hasattr(request, 'session'):
+        request.session.pop(SESSION_ROL, None)
+
+
+class PerfilMiddleware:
+    """
+    Expone request.perfil (doctor/paciente del usuario) de forma perezosa,
+    compartido por las vistas y los context processors. Las vistas async
+    usan `await request.aperfil()` (como request.auser()).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self._preparar(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self._preparar(request)
+        return await self.get_response(request)
+
+    def _preparar(self, request):
+        request.perfil = SimpleLazyObject(lambda: obtener_perfil(request))
+        request.aperfil = partial(aobtener_perfil, request)
+
+
+logger_metricas = logging.getLogger('helcon.metricas')
+_medicion = ContextVar('medicion_request', default=None)
+
+
+class PresupuestoExcedido(AssertionError):
+    """La vista hizo más consultas que su presupuesto en METRICAS_PRESUPUESTOS."""
+
+
+class Medicion:
+    def __init__(self):
+        self.consultas = 0
+        self.sql_ns = 0
+        self.plantillas_ns = 0
+        self.inicio_ns = time.perf_counter_ns()
+
+    def __call__(self, execute, sql, params, many, context):
+        # execute_wrapper de Django: cuenta y mide cada consulta
+        inicio = time.perf_counter_ns()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_ns += time.perf_counter_ns() - inicio
+            self.consultas += 1
+
+
+def _medir_consulta(execute, sql, params, many, context):
+    # Wrapper fijo de las conexiones: mide con la Medicion del request en curso, que
+    # viaja en el ContextVar (sync_to_async lo copia al hilo donde corre el ORM)
+    medicion = _medicion.get()
+    if medicion is None:
+        return execute(sql, params, many, context)
+    return medicion(execute, sql, params, many, context)
+
+
+def _instalar_en_conexion(connection, **kwargs):
+    # Las conexiones son por hilo: se instala en cada una que se abre y, por si ya
+    # estaba abierta, en las del hilo que atiende el request (_instalar_en_hilo)
+    if _medir_consulta not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_medir_consulta)
+
+
+def _instalar_en_hilo():
+    for conexion in connections.all():
+        _instalar_en_conexion(conexion)
+
+
+def _instrumentar_plantillas():
+    # Solo la plantilla principal: los {% include %} no pasan por el backend
+    original = PlantillaDjango.render
+    if getattr(original, 'instrumentado', False):
+        return
+
+    @wraps(original)
+    def render(self, context=None, request=None):
+        medicion = _medicion.get()
+        if medicion is None:
+            return original(self, context, request)
+        inicio = time.perf_counter_ns()
+        try:
+            return original(self, context, request)
+        finally:
+            medicion.plantillas_ns += time.perf_counter_ns() - inicio
+
+    render.instrumentado = True
+    PlantillaDjango.render = render
+
+
+class MetricasMiddleware:
+    """
+    Opcional (METRICAS_REQUEST=1). Mide por request las consultas SQL, su
+    tiempo, el render de la plantilla y el total; los devuelve en el header
+    Server-Timing (visible en las DevTools) y los registra en el logger
+    'helcon.metricas' con el nombre de la URL. Si la vista pasa su
+    presupuesto de consultas (METRICAS_PRESUPUESTOS) se registra un
+    warning, o falla con PresupuestoExcedido si METRICAS_PRESUPUESTO_ESTRICTO.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICAS_REQUEST:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        _instrumentar_plantillas()
+        connection_created.connect(_instalar_en_conexion, dispatch_uid='helcon.metricas')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        _instalar_en_hilo()
+        medicion = Medicion()
+        token = _medicion.set(medicion)
+        try:
+            response = self.get_response(request)
+        finally:
+            _medicion.reset(token)
+        return self._registrar(request, response, medicion)
+
+    async def __acall__(self, request):
+        # El ORM de las vistas async corre en el hilo de sync_to_async (thread_sensitive),
+        # no en el del event loop: ahí es donde hace falta el wrapper
+        await sync_to_async(_instalar_en_hilo)()
+        medicion = Medicion()
+        token = _medicion.set(medicion)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _medicion.reset(token)
+        return self._registrar(request, response, medicion)
+
+    def _registrar(self, request, response, medicion):
+        total_ms = (time.perf_counter_ns() - medicion.inicio_ns) / 1e6
+        sql_ms = medicion.sql_ns / 1e6
+        # El render incluye las consultas perezosas que se evalúan en la plantilla
+        plantillas_ms = medicion.plantillas_ns / 1e6
+        vista = request.resolver_match.view_name if request.resolver_match else '-'
+
+        response['Server-Timing'] = (
+            f'sql;dur={sql_ms:.1f};desc="{medicion.consultas} consultas", '
+            f'plantilla;dur={plantillas_ms:.1f}, total;dur={total_ms:.1f}'
+        )
+        logger_metricas.info(
+            '%s %s consultas=%d sql=%.1fms plantilla=%.1fms total=%.1fms',
+            vista, request.path, medicion.consultas, sql_ms, plantillas_ms, total_ms,
+        )
+
+        presupuesto = settings.METRICAS_PRESUPUESTOS.get(vista)
+        if presupuesto is not None and medicion.consultas > presupuesto:
+            mensaje = f'{vista} hizo {medicion.consultas} consultas (presupuesto: {presupuesto})'
+            if settings.METRICAS_PRESUPUESTO_ESTRICTO:
+                raise PresupuestoExcedido(mensaje)
+            logger_metricas.warning(mensaje)
+        return response
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:26
+
+import unicodedata
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Copia de helcon.search al momento de esta migración: no importar código de la
+# app, que puede cambiar después sin que esta migración lo haga
+FTS_TABLE = 'helcon_doctor_fts'
+
+
+def normalizar(texto):
+    texto = unicodedata.normalize('NFKD', texto or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.lower().split())
+
+
+def texto_busqueda(doctor):
+    partes = [
+        doctor.user.first_name,
+        doctor.user.last_name,
+        doctor.especialidad,
+        doctor.ubicacion,
+        doctor.descripcion,
+    ]
+    return normalizar(' '.join(p for p in partes if p))
+
+
+def crear_indice_busqueda(apps, schema_editor):
+    connection = schema_editor.connection
+    usar_fts = False
+    if connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS doctor_search_text_trgm_idx '
+            'ON helcon_doctor USING gin (search_text gin_trgm_ops)'
+        )
+    elif connection.vendor == 'sqlite':
+        try:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(search_text, tokenize='trigram')"
+            )
+            usar_fts = True
+        except Exception:
+            # SQLite sin FTS5/trigram: el buscador usa LIKE sobre search_text
+            pass
+
+    Doctor = apps.get_model('helcon', 'Doctor')
+    for doctor in Doctor.objects.select_related('user'):
+        doctor.search_text = texto_busqueda(doctor)
+        doctor.save(update_fields=['search_text'])
+        if usar_fts:
+            schema_editor.execute(
+                f'INSERT OR REPLACE INTO {FTS_TABLE}(rowid, search_text) VALUES (%s, %s)',
+                [doctor.pk, doctor.search_text],
+            )
+
+
+def borrar_indice_busqueda(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS doctor_search_text_trgm_idx')
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0032_doctor_preciobase'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='doctor',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['-recomendado', 'id'], name='doctor_recomendado_id_idx'),
+        ),
+        migrations.RunPython(crear_indice_busqueda, borrar_indice_busqueda),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:30
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.dateparse import parse_time
+
+# Copia de helcon.models / helcon.disponibilidad tal como estaban en esta migración
+# (las migraciones no deben importar código de la app, que puede cambiar después)
+SLOT_MINUTOS = 15
+SLOTS_POR_DIA = 24 * 60 // SLOT_MINUTOS
+
+
+def parsear_hora(valor):
+    try:
+        return parse_time((valor or '').strip())
+    except ValueError:
+        return None
+
+
+def mascara_slots(hora_inicio, duracion_minutos):
+    primero = (hora_inicio.hour * 60 + hora_inicio.minute) // SLOT_MINUTOS
+    cantidad = max(1, -(-duracion_minutos // SLOT_MINUTOS))
+    return (((1 << cantidad) - 1) << primero) & ((1 << SLOTS_POR_DIA) - 1)
+
+
+def llenar_disponibilidad(apps, schema_editor):
+    # Convierte las horas de texto a hora_inicio y arma los bitmaps con las citas existentes
+    Cita = apps.get_model('helcon', 'Cita')
+    DisponibilidadDia = apps.get_model('helcon', 'DisponibilidadDia')
+    bitmaps = defaultdict(int)
+    for cita in Cita.objects.exclude(estado_cita__iexact='cancelada').only('id', 'doctor_id', 'fecha', 'hora', 'duracion_minutos'):
+        hora_inicio = parsear_hora(cita.hora)
+        if hora_inicio is None:
+            continue
+        Cita.objects.filter(pk=cita.pk).update(hora_inicio=hora_inicio)
+        bitmaps[(cita.doctor_id, cita.fecha)] |= mascara_slots(hora_inicio, cita.duracion_minutos)
+    DisponibilidadDia.objects.bulk_create([
+        DisponibilidadDia(doctor_id=doctor_id, fecha=fecha, ocupados=bits.to_bytes(SLOTS_POR_DIA // 8, 'little'))
+        for (doctor_id, fecha), bits in bitmaps.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0034_cita_actualizada_en_indices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cita',
+            name='duracion_minutos',
+            field=models.PositiveSmallIntegerField(default=30),
+        ),
+        migrations.AddField(
+            model_name='cita',
+            name='hora_inicio',
+            field=models.TimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='HorarioDoctor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dia_semana', models.PositiveSmallIntegerField(choices=[(0, 'Lunes'), (1, 'Martes'), (2, 'Miércoles'), (3, 'Jueves'), (4, 'Viernes'), (5, 'Sábado'), (6, 'Domingo')])),
+                ('hora_inicio', models.TimeField()),
+                ('hora_fin', models.TimeField()),
+                ('duracion_minutos', models.PositiveSmallIntegerField(default=30)),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='horarios', to='helcon.doctor')),
+            ],
+            options={
+                'ordering': ['dia_semana', 'hora_inicio'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DisponibilidadDia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('ocupados', models.BinaryField(default=b'')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='disponibilidad', to='helcon.doctor')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('doctor', 'fecha'), name='disponibilidad_doctor_fecha_unica')],
+            },
+        ),
+        migrations.RunPython(llenar_disponibilidad, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0037_trabajocomprobante'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='doctor',
+            name='fotos_miniaturas',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:52
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+def cancelar_duplicadas(apps, schema_editor):
+    # Antes de la restricción única: de cada (doctor, fecha, hora) repetido se conserva la cita más antigua
+    Cita = apps.get_model('helcon', 'Cita')
+    vistos = set()
+    duplicadas = []
+    for cita_id, doctor_id, fecha, hora in (
+        Cita.objects.exclude(estado_cita='Cancelada')
+        .order_by('id')
+        .values_list('id', 'doctor_id', 'fecha', 'hora')
+    ):
+        clave = (doctor_id, fecha, hora)
+        if clave in vistos:
+            duplicadas.append(cita_id)
+        vistos.add(clave)
+    Cita.objects.filter(id__in=duplicadas).update(estado_cita='Cancelada')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0038_doctor_fotos_miniaturas'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cita',
+            name='cita_paciente_fecha_idx',
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['doctor', 'estado_cita', 'fecha', 'hora'], name='cita_doctor_estado_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['paciente', 'fecha', 'hora'], name='cita_paciente_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(django.db.models.functions.text.Lower('especialidad'), models.OrderBy(models.F('recomendado'), descending=True), models.F('id'), name='doctor_especialidad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nuevospacientes',
+            index=models.Index(fields=['nombre', 'fecha_cita'], name='nuevospac_nombre_fecha_idx'),
+        ),
+        migrations.RunPython(cancelar_duplicadas, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cita',
+            constraint=models.UniqueConstraint(condition=models.Q(('estado_cita', 'Cancelada'), _negated=True), fields=('doctor', 'fecha', 'hora'), name='cita_unica_activa'),
+        ),
+    ]
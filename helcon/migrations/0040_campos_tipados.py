@@ -0,0 +1,80 @@
+from django.db import migrations, models
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+
+# Los campos de texto se reemplazan por campos nuevos (agregar, copiar,
+# borrar y renombrar): PostgreSQL no puede convertir 'si'/'no' a boolean.
+
+TEXTO_ESTADO_CITA = {0: 'No confirmada', 1: 'Confirmada', 2: 'Cancelada'}
+TEXTO_ESTADO_SWITCH = {0: 'No acepta nuevos pacientes', 1: 'Aceptando nuevos pacientes'}
+
+
+def a_tipados(apps, schema_editor):
+    Doctor = apps.get_model('helcon', 'Doctor')
+    Paciente = apps.get_model('helcon', 'Paciente')
+    Cita = apps.get_model('helcon', 'Cita')
+
+    Doctor.objects.filter(Q(recomendado__iexact='si') | Q(recomendado__iexact='sí')).update(recomendado_nuevo=True)
+    Doctor.objects.filter(estado_switch__icontains='aceptando').update(estado_switch_nuevo=1)
+    Paciente.objects.exclude(cupon__iexact='si').update(cupon_nuevo=False)
+    for valor, texto in TEXTO_ESTADO_CITA.items():
+        Cita.objects.filter(estado_cita__iexact=texto).update(estado_cita_nuevo=valor)
+
+
+def a_texto(apps, schema_editor):
+    # Al revertir, los campos de texto vuelven con su default ('no', 'No confirmada'...)
+    Doctor = apps.get_model('helcon', 'Doctor')
+    Paciente = apps.get_model('helcon', 'Paciente')
+    Cita = apps.get_model('helcon', 'Cita')
+
+    Doctor.objects.filter(recomendado_nuevo=True).update(recomendado='si')
+    Doctor.objects.filter(estado_switch_nuevo=1).update(estado_switch=TEXTO_ESTADO_SWITCH[1])
+    Paciente.objects.filter(cupon_nuevo=False).update(cupon='no')
+    for valor, texto in TEXTO_ESTADO_CITA.items():
+        Cita.objects.filter(estado_cita_nuevo=valor).update(estado_cita=texto)
+
+
+CAMPOS = [
+    ('doctor', 'recomendado', models.BooleanField(default=False)),
+    ('doctor', 'estado_switch', models.PositiveSmallIntegerField(
+        choices=[(0, 'No acepta nuevos pacientes'), (1, 'Aceptando nuevos pacientes')], default=0)),
+    ('paciente', 'cupon', models.BooleanField(default=True)),
+    ('cita', 'estado_cita', models.PositiveSmallIntegerField(
+        choices=[(0, 'No confirmada'), (1, 'Confirmada'), (2, 'Cancelada')], default=0)),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0039_indices_consultas'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name='doctor', name='doctor_recomendado_id_idx'),
+        migrations.RemoveIndex(model_name='doctor', name='doctor_especialidad_idx'),
+        migrations.RemoveIndex(model_name='cita', name='cita_doctor_estado_idx'),
+        migrations.RemoveConstraint(model_name='cita', name='cita_unica_activa'),
+        *[migrations.AddField(model_name=m, name=f'{n}_nuevo', field=campo) for m, n, campo in CAMPOS],
+        migrations.RunPython(a_tipados, a_texto),
+        *[migrations.RemoveField(model_name=m, name=n) for m, n, campo in CAMPOS],
+        *[migrations.RenameField(model_name=m, old_name=f'{n}_nuevo', new_name=n) for m, n, campo in CAMPOS],
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['-recomendado', 'id'], name='doctor_recomendado_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(Lower('especialidad'), F('recomendado').desc(), F('id'), name='doctor_especialidad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['doctor', 'estado_cita', 'fecha', 'hora'], name='cita_doctor_estado_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='cita',
+            constraint=models.UniqueConstraint(
+                condition=~Q(estado_cita=2), fields=('doctor', 'fecha', 'hora'), name='cita_unica_activa',
+            ),
+        ),
+    ]
@@ -0,0 +1,114 @@
+from datetime import datetime, time, timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+from django.utils.dateparse import parse_time
+
+# Copia de helcon.disponibilidad.parsear_hora y helcon.models.intervalo_cita
+# (las migraciones no deben importar código de la app, que puede cambiar después)
+DURACION_MAXIMA = timedelta(days=1)
+
+
+def parsear_hora(valor):
+    try:
+        return parse_time((valor or '').strip())
+    except ValueError:
+        return None
+
+
+def intervalo_cita(fecha, hora_inicio, duracion_minutos):
+    if hora_inicio is None:
+        inicio = timezone.make_aware(datetime.combine(fecha, time.min))
+        return inicio, inicio + DURACION_MAXIMA
+    inicio = timezone.make_aware(datetime.combine(fecha, hora_inicio))
+    return inicio, inicio + min(timedelta(minutes=duracion_minutos), DURACION_MAXIMA)
+
+
+def calcular_intervalos(apps, schema_editor):
+    # inicio/fin con zona horaria (TIME_ZONE) a partir de fecha + hora de texto
+    Cita = apps.get_model('helcon', 'Cita')
+    citas = list(Cita.objects.only('id', 'fecha', 'hora', 'hora_inicio', 'duracion_minutos'))
+    for cita in citas:
+        cita.hora_inicio = cita.hora_inicio or parsear_hora(cita.hora)
+        cita.inicio, cita.fin = intervalo_cita(cita.fecha, cita.hora_inicio, cita.duracion_minutos)
+    Cita.objects.bulk_update(citas, ['hora_inicio', 'inicio', 'fin'], batch_size=500)
+
+
+def horas_a_time(apps, schema_editor):
+    for nombre in ('Paciente', 'NuevosPacientes'):
+        modelo = apps.get_model('helcon', nombre)
+        filas = list(modelo.objects.exclude(horacita='').only('id', 'horacita'))
+        for fila in filas:
+            fila.horacita_nueva = parsear_hora(fila.horacita)
+        modelo.objects.bulk_update(filas, ['horacita_nueva'], batch_size=500)
+
+
+def horas_a_texto(apps, schema_editor):
+    for nombre in ('Paciente', 'NuevosPacientes'):
+        modelo = apps.get_model('helcon', nombre)
+        filas = list(modelo.objects.exclude(horacita_nueva=None).only('id', 'horacita_nueva'))
+        for fila in filas:
+            fila.horacita = fila.horacita_nueva.strftime('%H:%M')
+        modelo.objects.bulk_update(filas, ['horacita'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0040_campos_tipados'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name='cita', name='cita_doctor_fecha_idx'),
+        migrations.RemoveIndex(model_name='cita', name='cita_paciente_fecha_idx'),
+        migrations.RemoveIndex(model_name='cita', name='cita_doctor_estado_idx'),
+        migrations.AddField(
+            model_name='cita',
+            name='inicio',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='cita',
+            name='fin',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(calcular_intervalos, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='cita',
+            name='inicio',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name='cita',
+            name='fin',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['doctor', 'inicio'], name='cita_doctor_inicio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['doctor', 'estado_cita', 'inicio'], name='cita_doctor_estado_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cita',
+            index=models.Index(fields=['paciente', 'inicio'], name='cita_paciente_inicio_idx'),
+        ),
+        # horacita: texto -> TimeField (agregar, copiar, borrar y renombrar, como en 0040)
+        migrations.AddField(
+            model_name='paciente',
+            name='horacita_nueva',
+            field=models.TimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='nuevospacientes',
+            name='horacita_nueva',
+            field=models.TimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(horas_a_time, horas_a_texto),
+        migrations.RemoveField(model_name='paciente', name='horacita'),
+        migrations.RemoveField(model_name='nuevospacientes', name='horacita'),
+        migrations.RenameField(model_name='paciente', old_name='horacita_nueva', new_name='horacita'),
+        migrations.RenameField(model_name='nuevospacientes', old_name='horacita_nueva', new_name='horacita'),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:59
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0041_cita_inicio_fin'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pago',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('tipo', models.CharField(choices=[('cita_nueva', 'Cita nueva'), ('cita', 'Cita'), ('suscripcion', 'Suscripción')], max_length=12)),
+                ('datos', models.JSONField(blank=True, default=dict)),
+                ('monto_centavos', models.PositiveIntegerField()),
+                ('stripe_session', models.CharField(blank=True, max_length=255)),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('pagado', 'Pagado'), ('conflicto', 'Conflicto')], default='pendiente', max_length=10)),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('procesado_en', models.DateTimeField(blank=True, null=True)),
+                ('cita', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='helcon.cita')),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='helcon.doctor')),
+                ('usuario', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
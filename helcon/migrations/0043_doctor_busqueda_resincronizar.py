@@ -0,0 +1,48 @@
+import unicodedata
+
+from django.db import migrations
+
+# Copia de helcon.search al momento de esta migración (no importar código de la app)
+FTS_TABLE = 'helcon_doctor_fts'
+
+
+def normalizar(texto):
+    texto = unicodedata.normalize('NFKD', texto or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.lower().split())
+
+
+def resincronizar(apps, schema_editor):
+    """
+    Antes search_text solo se actualizaba en Doctor.save(): un cambio de
+    nombre del User o un update() lo dejaban viejo, y los borrados en
+    cascada dejaban filas huérfanas en el índice FTS. Desde aquí lo
+    mantienen DoctorQuerySet, la señal de User y los triggers de SQLite
+    (creados en post_migrate, ver helcon/signals.py).
+    """
+    Doctor = apps.get_model('helcon', 'Doctor')
+    doctores = list(Doctor.objects.select_related('user'))
+    for doctor in doctores:
+        partes = [doctor.user.first_name, doctor.user.last_name, doctor.especialidad, doctor.ubicacion, doctor.descripcion]
+        doctor.search_text = normalizar(' '.join(p for p in partes if p))
+    Doctor.objects.bulk_update(doctores, ['search_text'], batch_size=500)
+
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        if FTS_TABLE not in connection.introspection.table_names(cursor):
+            return
+    schema_editor.execute(f'DELETE FROM {FTS_TABLE}')
+    schema_editor.execute(f'INSERT INTO {FTS_TABLE}(rowid, search_text) SELECT id, search_text FROM helcon_doctor')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0042_pago'),
+    ]
+
+    operations = [
+        migrations.RunPython(resincronizar, migrations.RunPython.noop),
+    ]
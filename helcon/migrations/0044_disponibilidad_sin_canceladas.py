@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+# Copia de helcon.models (SLOT_MINUTOS, mascara_slots, EstadoCita.CANCELADA)
+SLOT_MINUTOS = 15
+SLOTS_POR_DIA = 24 * 60 // SLOT_MINUTOS
+CANCELADA = 2
+
+
+def mascara_slots(hora_inicio, duracion_minutos):
+    primero = (hora_inicio.hour * 60 + hora_inicio.minute) // SLOT_MINUTOS
+    cantidad = max(1, -(-duracion_minutos // SLOT_MINUTOS))
+    return (((1 << cantidad) - 1) << primero) & ((1 << SLOTS_POR_DIA) - 1)
+
+
+def reconstruir(apps, schema_editor):
+    # Las citas canceladas y las editadas seguían ocupando slots: rehacer todos los bitmaps
+    Cita = apps.get_model('helcon', 'Cita')
+    DisponibilidadDia = apps.get_model('helcon', 'DisponibilidadDia')
+    bitmaps = defaultdict(int)
+    activas = Cita.objects.exclude(estado_cita=CANCELADA).exclude(hora_inicio=None)
+    for doctor_id, fecha, hora_inicio, duracion in activas.values_list('doctor_id', 'fecha', 'hora_inicio', 'duracion_minutos'):
+        bitmaps[(doctor_id, fecha)] |= mascara_slots(hora_inicio, duracion)
+    DisponibilidadDia.objects.all().delete()
+    DisponibilidadDia.objects.bulk_create([
+        DisponibilidadDia(doctor_id=doctor_id, fecha=fecha, ocupados=bits.to_bytes(SLOTS_POR_DIA // 8, 'little'))
+        for (doctor_id, fecha), bits in bitmaps.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('helcon', '0043_doctor_busqueda_resincronizar'),
+    ]
+
+    operations = [
+        migrations.RunPython(reconstruir, migrations.RunPython.noop),
+    ]
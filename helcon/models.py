@@ -1,5 +1,59 @@
-from django.db import models
+import uuid
+from datetime import datetime, time, timedelta
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_time
+from django.utils.translation import gettext_lazy as _
+
+from .search import texto_busqueda
+from .imagenes import generar_miniaturas
+
+class EstadoSwitch(models.IntegerChoices):
+    NO_ACEPTA = 0, _('No acepta nuevos pacientes')
+    ACEPTA = 1, _('Aceptando nuevos pacientes')
+
+
+class EstadoCita(models.IntegerChoices):
+    NO_CONFIRMADA = 0, _('No confirmada')
+    CONFIRMADA = 1, _('Confirmada')
+    CANCELADA = 2, _('Cancelada')  # no cuenta para la restricción de horario único
+
+
+# Campos de los que sale Doctor.search_text (ver search.texto_busqueda)
+CAMPOS_BUSQUEDA = {'user', 'user_id', 'especialidad', 'ubicacion', 'descripcion'}
+
+
+class DoctorQuerySet(models.QuerySet):
+    """
+    update() y bulk_create() no pasan por Doctor.save(): aquí también se
+    recalcula search_text (el índice FTS lo siguen los triggers de SQLite).
+    """
+
+    def update(self, **kwargs):
+        if 'search_text' in kwargs or not CAMPOS_BUSQUEDA & kwargs.keys():
+            return super().update(**kwargs)
+        ids = list(self.values_list('pk', flat=True))
+        filas = super().update(**kwargs)
+        self.model.objects.filter(pk__in=ids).actualizar_busqueda()
+        return filas
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for doctor in objs:
+            doctor.search_text = texto_busqueda(doctor)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def actualizar_busqueda(self):
+        doctores = list(self.select_related('user'))
+        for doctor in doctores:
+            doctor.search_text = texto_busqueda(doctor)
+        self.model.objects.bulk_update(doctores, ['search_text'], batch_size=500)
+        return len(doctores)
+
 
 class Doctor(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
@@ -12,10 +66,37 @@ class Doctor(models.Model):
     descripcion = models.TextField(blank=True)
     ubicacion = models.CharField(max_length=100, blank=True)
     foto_perfil = models.ImageField(upload_to='fotos_perfil/', blank=True, null=True)
-    estado_switch = models.CharField(max_length=20, default='No acepta nuevos pacientes')  # 👈 nuevo campo
-    recomendado = models.CharField(max_length=20, default='no',blank=True)  # 👈 nuevo campo
+    fotos_miniaturas = models.JSONField(default=dict, blank=True, editable=False)  # {"180": ruta, "360": ruta}
+    estado_switch = models.PositiveSmallIntegerField(choices=EstadoSwitch.choices, default=EstadoSwitch.NO_ACEPTA)
+    recomendado = models.BooleanField(default=False)
     preciobase = models.DecimalField(max_digits=8, decimal_places=2, blank= True,null=True)
- 
+    # Nombre, especialidad, ubicación y descripción normalizados (sin tildes, minúsculas) para el buscador
+    search_text = models.TextField(blank=True, default='', editable=False)
+
+    objects = DoctorQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-recomendado', 'id'], name='doctor_recomendado_id_idx'),
+            # Filtro por especialidad sin distinguir mayúsculas del buscador (search.buscar_doctores)
+            models.Index(Lower('especialidad'), F('recomendado').desc(), F('id'), name='doctor_especialidad_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.search_text = texto_busqueda(self)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'search_text' not in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['search_text']
+        # Foto recién subida (aún no guardada en el storage): hay que generar sus miniaturas
+        foto_nueva = bool(self.foto_perfil) and not self.foto_perfil._committed
+        super().save(*args, **kwargs)
+        if foto_nueva:
+            try:
+                self.fotos_miniaturas = generar_miniaturas(self.foto_perfil)
+            except OSError:
+                # Imagen que Pillow no puede leer: se sigue mostrando el original
+                self.fotos_miniaturas = {}
+            Doctor.objects.filter(pk=self.pk).update(fotos_miniaturas=self.fotos_miniaturas)
 
     def __str__(self):
         return f"{self.user.first_name} {self.user.last_name}"
@@ -37,8 +118,8 @@ class Paciente(models.Model):
     datos_consulta = models.TextField(blank=True)
     motivo_visita = models.TextField(blank=True)
     aseguradora = models.TextField(blank=True)
-    horacita = models.TextField(blank=True)
-    cupon = models.TextField(blank=True,default='si')
+    horacita = models.TimeField(null=True, blank=True)
+    cupon = models.BooleanField(default=True)  # True mientras no haya usado su cupón
 
     def __str__(self):
         return f"{self.user.first_name} - {self.id_number}"
@@ -52,12 +133,94 @@ class NuevosPacientes(models.Model):
     datos_consulta = models.TextField(blank=True)
     motivo_visita = models.TextField(blank=True)
     aseguradora = models.TextField(blank=True)
-    horacita = models.TextField(blank=True)
+    horacita = models.TimeField(null=True, blank=True)
     correo = models.EmailField(unique=True,blank=True)  
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['nombre', 'fecha_cita'], name='nuevospac_nombre_fecha_idx'),
+        ]
+
     def __str__(self):
         return f"{self.nombre} - {self.cedula}"
 
+# Una cita nunca dura más de un día; acota hacia atrás los rangos sobre 'inicio'
+DURACION_MAXIMA = timedelta(days=1)
+
+
+def intervalo_cita(fecha, hora_inicio, duracion_minutos):
+    """
+    (inicio, fin) con zona horaria de una cita. Si la hora no se pudo
+    interpretar, la cita ocupa el día completo.
+    """
+    if hora_inicio is None:
+        inicio = timezone.make_aware(datetime.combine(fecha, time.min))
+        return inicio, inicio + DURACION_MAXIMA
+    inicio = timezone.make_aware(datetime.combine(fecha, hora_inicio))
+    return inicio, inicio + min(timedelta(minutes=duracion_minutos), DURACION_MAXIMA)
+
+
+# Campos de los que depende qué slots ocupa una cita en DisponibilidadDia
+CAMPOS_HORARIO = {'doctor', 'doctor_id', 'fecha', 'hora', 'hora_inicio', 'duracion_minutos', 'estado_cita'}
+# Y de los que dependen inicio/fin
+CAMPOS_INTERVALO = {'fecha', 'hora', 'hora_inicio', 'duracion_minutos'}
+
+
+class CitaQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """
+        update() no pasa por Cita.save(), así que hace aquí lo mismo: marca
+        actualizada_en (ETag y deltas de api_citas), recalcula inicio/fin si
+        cambia la fecha o la hora y rehace los bitmaps de los días afectados.
+        """
+        ahora = kwargs.setdefault('actualizada_en', timezone.now())
+        if isinstance(kwargs.get('hora'), str) and 'hora_inicio' not in kwargs:
+            # Como en save(): 'hora' manda sobre hora_inicio si se puede leer
+            try:
+                hora_inicio = parse_time(kwargs['hora'].strip())
+            except ValueError:
+                hora_inicio = None
+            if hora_inicio is not None:
+                kwargs['hora_inicio'] = hora_inicio
+        if not CAMPOS_HORARIO & kwargs.keys():
+            return super().update(**kwargs)
+        with transaction.atomic():
+            ids = list(self.values_list('pk', flat=True))
+            dias = set(Cita.objects.filter(pk__in=ids).values_list('doctor_id', 'fecha'))
+            filas = super().update(**kwargs)
+            if CAMPOS_INTERVALO & kwargs.keys():
+                citas = list(Cita.objects.filter(pk__in=ids).only('fecha', 'hora_inicio', 'duracion_minutos'))
+                for cita in citas:
+                    cita.inicio, cita.fin = intervalo_cita(cita.fecha, cita.hora_inicio, cita.duracion_minutos)
+                    cita.actualizada_en = ahora
+                Cita.objects.bulk_update(citas, ['inicio', 'fin', 'actualizada_en'])
+            dias |= set(Cita.objects.filter(pk__in=ids).values_list('doctor_id', 'fecha'))
+            for doctor_id, fecha in sorted(dias):
+                DisponibilidadDia.recalcular(doctor_id, fecha)
+        return filas
+
+    def solapadas(self, desde=None, hasta=None):
+        """
+        Citas que se cruzan con [desde, hasta). Es un rango sobre 'inicio'
+        (índices *_inicio_idx): como ninguna dura más de DURACION_MAXIMA,
+        basta mirar desde (desde - DURACION_MAXIMA).
+        """
+        citas = self
+        if desde is not None:
+            citas = citas.filter(inicio__gte=desde - DURACION_MAXIMA, fin__gt=desde)
+        if hasta is not None:
+            citas = citas.filter(inicio__lt=hasta)
+        return citas
+
+    def del_dia(self, fecha):
+        # Agenda de un día (hora local), ordenada por hora de inicio
+        desde = timezone.make_aware(datetime.combine(fecha, time.min))
+        return self.solapadas(desde, desde + timedelta(days=1)).order_by('inicio')
+
+    def proximas(self, cantidad, desde=None):
+        return self.filter(inicio__gte=desde or timezone.now()).order_by('inicio')[:cantidad]
+
+
 class Cita(models.Model):
     paciente = models.ForeignKey(Paciente, on_delete=models.CASCADE, null=True, blank=True)
     doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE)
@@ -70,9 +233,285 @@ class Cita(models.Model):
     aseguradora = models.TextField(blank=True)
     fecha_cita = models.DateField(null=True, blank=True)  # 👈 Nueva fecha de la cita
     precio = models.DecimalField(max_digits=8, decimal_places=2, blank= True,null=True)
-    estado_cita = models.CharField(max_length=20, default='No confirmada')  # 👈 nuevo campo
+    estado_cita = models.PositiveSmallIntegerField(choices=EstadoCita.choices, default=EstadoCita.NO_CONFIRMADA)
+    actualizada_en = models.DateTimeField(auto_now=True, db_index=True)  # para ETag y deltas de /api/citas/
+    hora_inicio = models.TimeField(null=True, blank=True)  # versión tipada de 'hora'
+    duracion_minutos = models.PositiveSmallIntegerField(default=30)
+    # Calculados en save() a partir de fecha, hora_inicio y duracion_minutos
+    inicio = models.DateTimeField(editable=False)
+    fin = models.DateTimeField(editable=False)
+
+    objects = CitaQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Calendario (api_citas) y agenda del día: rangos sobre inicio
+            models.Index(fields=['doctor', 'inicio'], name='cita_doctor_inicio_idx'),
+            # Agenda del doctor por estado (home_doc) y citas del paciente (detalle_cita_paciente), ya ordenadas
+            models.Index(fields=['doctor', 'estado_cita', 'inicio'], name='cita_doctor_estado_idx'),
+            models.Index(fields=['paciente', 'inicio'], name='cita_paciente_inicio_idx'),
+        ]
+        constraints = [
+            # Un doctor no puede tener dos citas activas a la misma fecha y hora
+            models.UniqueConstraint(
+                fields=['doctor', 'fecha', 'hora'],
+                condition=~Q(estado_cita=EstadoCita.CANCELADA),
+                name='cita_unica_activa',
+            ),
+        ]
+
+    @property
+    def ocupa_horario(self):
+        # Las canceladas no cuentan (como en cita_unica_activa); sin hora legible no hay slots
+        return self.hora_inicio is not None and self.estado_cita != EstadoCita.CANCELADA
+
+    def choca_con_otra(self):
+        """Otra cita activa del doctor a la misma fecha y hora (lo que vigila cita_unica_activa)."""
+        return Cita.objects.filter(doctor_id=self.doctor_id, fecha=self.fecha, hora=self.hora).exclude(
+            estado_cita=EstadoCita.CANCELADA,
+        ).exclude(pk=self.pk).exists()
+
+    def save(self, *args, **kwargs):
+        # 'hora' es la que escribe el usuario: si se puede leer, manda sobre hora_inicio
+        if self.hora:
+            try:
+                self.hora_inicio = parse_time(str(self.hora).strip()) or self.hora_inicio
+            except ValueError:
+                pass
+        if isinstance(self.fecha, str):
+            self.fecha = parse_date(self.fecha)
+        self.inicio, self.fin = intervalo_cita(self.fecha, self.hora_inicio, int(self.duracion_minutos))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'inicio', 'fin'}
+            if not CAMPOS_HORARIO & set(update_fields):
+                return super().save(*args, **kwargs)
+
+        anterior = None
+        if not self._state.adding:
+            anterior = Cita.objects.filter(pk=self.pk).values('doctor_id', 'fecha', 'hora_inicio', 'duracion_minutos', 'estado_cita').first()
+            if anterior and all(getattr(self, campo) == valor for campo, valor in anterior.items()):
+                return super().save(*args, **kwargs)
+
+        # Guardar y rehacer el bitmap del día (y del día anterior si la cita se movió)
+        # en la misma transacción; si choca con otra cita se lanza HorarioOcupado
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                DisponibilidadDia.recalcular(self.doctor_id, self.fecha, cita=self)
+                if anterior and (anterior['doctor_id'], anterior['fecha']) != (self.doctor_id, self.fecha):
+                    DisponibilidadDia.recalcular(anterior['doctor_id'], anterior['fecha'])
+        except IntegrityError:
+            # cita_unica_activa: misma fecha y hora aunque la hora no se haya podido interpretar.
+            # Se comprueba con una consulta, no con el texto del error (cambia con la base)
+            if self.estado_cita != EstadoCita.CANCELADA and self.choca_con_otra():
+                raise HorarioOcupado('El doctor ya tiene una cita en ese horario.')
+            raise
 
     def __str__(self):
         return f'Cita de {self.nombre} con Dr. {self.doctor_nombre}'
 
 
+# ---- Disponibilidad de los doctores ----
+
+SLOT_MINUTOS = 15
+SLOTS_POR_DIA = 24 * 60 // SLOT_MINUTOS
+DIA_COMPLETO = (1 << SLOTS_POR_DIA) - 1
+
+
+class HorarioOcupado(Exception):
+    pass
+
+
+def mascara_slots(hora_inicio, duracion_minutos):
+    # Bits de los slots de 15 minutos que ocupa una cita que empieza a hora_inicio
+    primero = (hora_inicio.hour * 60 + hora_inicio.minute) // SLOT_MINUTOS
+    cantidad = max(1, -(-duracion_minutos // SLOT_MINUTOS))
+    return (((1 << cantidad) - 1) << primero) & DIA_COMPLETO
+
+
+class HorarioDoctor(models.Model):
+    """Plantilla semanal de atención: una fila por bloque de horario de cada día."""
+    DIAS = [(0, 'Lunes'), (1, 'Martes'), (2, 'Miércoles'), (3, 'Jueves'), (4, 'Viernes'), (5, 'Sábado'), (6, 'Domingo')]
+
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name='horarios')
+    dia_semana = models.PositiveSmallIntegerField(choices=DIAS)
+    hora_inicio = models.TimeField()
+    hora_fin = models.TimeField()
+    duracion_minutos = models.PositiveSmallIntegerField(default=30)
+
+    class Meta:
+        ordering = ['dia_semana', 'hora_inicio']
+
+    def __str__(self):
+        return f'{self.doctor} - {self.get_dia_semana_display()} {self.hora_inicio}-{self.hora_fin}'
+
+
+class DisponibilidadDia(models.Model):
+    """
+    Bitmap de slots ocupados de un doctor en un día (bit i = minuto i*15).
+    Se rehace al crear, editar o borrar citas (Cita.save, CitaQuerySet.update
+    y la señal post_delete) para no tener que recorrerlas al calcular
+    horarios libres. Las citas canceladas no ocupan slots.
+    """
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name='disponibilidad')
+    fecha = models.DateField()
+    ocupados = models.BinaryField(default=b'')
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['doctor', 'fecha'], name='disponibilidad_doctor_fecha_unica'),
+        ]
+
+    @property
+    def bits(self):
+        return int.from_bytes(bytes(self.ocupados or b''), 'little')
+
+    @staticmethod
+    def a_bytes(bits):
+        return bits.to_bytes(SLOTS_POR_DIA // 8, 'little')
+
+    @classmethod
+    def _actualizar(cls, doctor_id, fecha, cambiar, reintentos=5):
+        # Compare-and-swap sobre 'version': si otro proceso escribió antes, se reintenta
+        for _intento in range(reintentos):
+            dia = cls.objects.filter(doctor_id=doctor_id, fecha=fecha).first()
+            nuevos = cambiar(dia.bits if dia else 0)
+            if dia is None:
+                if not nuevos:
+                    # Nada ocupado: no hace falta la fila (p.ej. el doctor se está borrando en cascada)
+                    return 0
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(doctor_id=doctor_id, fecha=fecha, ocupados=cls.a_bytes(nuevos), version=1)
+                    return nuevos
+                except IntegrityError:
+                    continue  # otro proceso creó la fila del día: reintentar sobre ella
+            if cls.objects.filter(pk=dia.pk, version=dia.version).update(
+                ocupados=cls.a_bytes(nuevos), version=dia.version + 1
+            ):
+                return nuevos
+        raise HorarioOcupado('No se pudo reservar el horario, intente de nuevo.')
+
+    @classmethod
+    def recalcular(cls, doctor_id, fecha, cita=None):
+        """
+        Rehace el bitmap del día con las citas activas del doctor. Con
+        `cita` (ya guardada en esta transacción) lanza HorarioOcupado si se
+        cruza con otra. Las citas se leen dentro del compare-and-swap: si
+        otro proceso reservó mientras tanto, el reintento ya ve su cita.
+        """
+        def cambiar(_bits):
+            otras = propia = 0
+            activas = Cita.objects.filter(doctor_id=doctor_id, fecha=fecha, hora_inicio__isnull=False).exclude(
+                estado_cita=EstadoCita.CANCELADA,
+            ).values_list('pk', 'hora_inicio', 'duracion_minutos')
+            for pk, hora_inicio, duracion in activas:
+                mascara = mascara_slots(hora_inicio, duracion)
+                if cita is not None and pk == cita.pk:
+                    propia = mascara
+                else:
+                    otras |= mascara
+            if propia & otras:
+                raise HorarioOcupado('El doctor ya tiene una cita en ese horario.')
+            return otras | propia
+        return cls._actualizar(doctor_id, fecha, cambiar)
+
+    def __str__(self):
+        return f'{self.doctor} - {self.fecha}'
+
+
+class CorreoPendiente(models.Model):
+    """Correo en cola; lo envía el comando enviar_correos fuera del request."""
+    PENDIENTE = 'pendiente'
+    ENVIANDO = 'enviando'
+    ENVIADO = 'enviado'
+    FALLIDO = 'fallido'
+    ESTADOS = [(PENDIENTE, 'Pendiente'), (ENVIANDO, 'Enviando'), (ENVIADO, 'Enviado'), (FALLIDO, 'Fallido')]
+
+    asunto = models.CharField(max_length=255)
+    cuerpo = models.TextField()
+    remitente = models.CharField(max_length=255)
+    destinatarios = models.JSONField()
+    adjunto_nombre = models.CharField(max_length=255, blank=True)
+    adjunto_mime = models.CharField(max_length=100, blank=True)
+    adjunto = models.BinaryField(null=True, blank=True)
+    # Ruta relativa a MEDIA_ROOT de un PDF ya guardado (comprobantes); evita copiar el archivo por destinatario
+    adjunto_ruta = models.CharField(max_length=255, blank=True)
+    estado = models.CharField(max_length=10, choices=ESTADOS, default=PENDIENTE)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    proximo_intento = models.DateTimeField(default=timezone.now)
+    ultimo_error = models.TextField(blank=True)
+    creado_en = models.DateTimeField(auto_now_add=True)
+    enviado_en = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['estado', 'proximo_intento'], name='correo_estado_proximo_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.asunto} -> {", ".join(self.destinatarios)}'
+
+
+class TrabajoComprobante(models.Model):
+    """PDF de comprobante por generar; lo procesa el comando procesar_comprobantes."""
+    PENDIENTE = 'pendiente'
+    PROCESANDO = 'procesando'
+    LISTO = 'listo'
+    ERROR = 'error'
+    ESTADOS = [(PENDIENTE, 'Pendiente'), (PROCESANDO, 'Procesando'), (LISTO, 'Listo'), (ERROR, 'Error')]
+
+    usuario = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    titulo = models.CharField(max_length=255)
+    lineas = models.JSONField()  # copia de los datos: la cita puede borrarse antes de generar el PDF
+    nombre_archivo = models.CharField(max_length=255)
+    correos = models.JSONField(default=list)  # [{asunto, cuerpo, remitente, destinatarios}]
+    estado = models.CharField(max_length=10, choices=ESTADOS, default=PENDIENTE)
+    pdf_ruta = models.CharField(max_length=255, blank=True)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    proximo_intento = models.DateTimeField(default=timezone.now)
+    ultimo_error = models.TextField(blank=True)
+    creado_en = models.DateTimeField(auto_now_add=True)
+    terminado_en = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['estado', 'proximo_intento'], name='trabajo_estado_proximo_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.nombre_archivo} ({self.estado})'
+
+
+class Pago(models.Model):
+    """
+    Checkout de Stripe. Lo aplica el webhook (checkout.session.completed)
+    una sola vez: 'clave' es la idempotency key del checkout y el
+    client_reference_id que Stripe devuelve en el evento.
+    """
+    CITA_NUEVA = 'cita_nueva'  # crea la Cita con los datos de la agenda
+    CITA = 'cita'  # confirma una Cita existente
+    SUSCRIPCION = 'suscripcion'  # doctor recomendado
+    TIPOS = [(CITA_NUEVA, 'Cita nueva'), (CITA, 'Cita'), (SUSCRIPCION, 'Suscripción')]
+
+    PENDIENTE = 'pendiente'
+    PAGADO = 'pagado'
+    CONFLICTO = 'conflicto'  # pagado, pero el horario se ocupó mientras tanto
+    ESTADOS = [(PENDIENTE, 'Pendiente'), (PAGADO, 'Pagado'), (CONFLICTO, 'Conflicto')]
+
+    clave = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    tipo = models.CharField(max_length=12, choices=TIPOS)
+    usuario = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE)
+    cita = models.ForeignKey(Cita, on_delete=models.SET_NULL, null=True, blank=True)
+    datos = models.JSONField(default=dict, blank=True)  # copia de cita_data de la sesión al pagar
+    monto_centavos = models.PositiveIntegerField()
+    stripe_session = models.CharField(max_length=255, blank=True)
+    estado = models.CharField(max_length=10, choices=ESTADOS, default=PENDIENTE)
+    creado_en = models.DateTimeField(auto_now_add=True)
+    procesado_en = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.get_tipo_display()} {self.clave} ({self.estado})'
@@ -0,0 +1,162 @@
+import logging
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from .comprobantes import datos_suscripcion
+from .models import Cita, EstadoCita, HorarioOcupado, Pago, Paciente
+from .pasarela import obtener_pasarela
+from .trabajos import encolar_comprobante
+
+logger = logging.getLogger(__name__)
+
+# Eventos de Checkout que significan "cobrado" (los pagos asíncronos llegan con el segundo)
+EVENTOS_PAGADO = ('checkout.session.completed', 'checkout.session.async_payment_succeeded')
+
+
+async def acrear_checkout(request, tipo, doctor, monto_centavos, nombre, descripcion='', datos=None, cita=None):
+    """
+    Registra el Pago y abre la sesión de Stripe Checkout. Devuelve la URL
+    de Stripe. La clave del Pago va como idempotency key (un reintento de
+    la llamada no crea otra sesión) y como client_reference_id para que
+    el webhook sepa qué aplicar. Lanza PasarelaError si Stripe no
+    responde; el Pago queda pendiente y nunca se aplica.
+
+    Es async (ORM async + cliente httpx) para que con ASGI el worker no
+    quede bloqueado mientras Stripe responde.
+    """
+    usuario = await request.auser()
+    pago = await Pago.objects.acreate(**_campos_pago(usuario, tipo, doctor, monto_centavos, datos, cita))
+    session = await obtener_pasarela().acrear_checkout(
+        _params_checkout(request, pago, nombre, descripcion), idempotency_key=str(pago.clave),
+    )
+    await Pago.objects.filter(pk=pago.pk).aupdate(stripe_session=session.id)
+    return session.url
+
+
+def _campos_pago(usuario, tipo, doctor, monto_centavos, datos, cita):
+    return {
+        'tipo': tipo,
+        'usuario': usuario if usuario.is_authenticated else None,
+        'doctor': doctor,
+        'cita': cita,
+        'datos': datos or {},
+        'monto_centavos': monto_centavos,
+    }
+
+
+def _params_checkout(request, pago, nombre, descripcion):
+    producto = {'name': nombre}
+    if descripcion:
+        producto['description'] = descripcion
+    return {
+        'payment_method_types': ['card'],
+        'line_items': [{
+            'price_data': {
+                'currency': 'usd',
+                'product_data': producto,
+                'unit_amount': pago.monto_centavos,
+            },
+            'quantity': 1,
+        }],
+        'mode': 'payment',
+        'client_reference_id': str(pago.clave),
+        'metadata': {'pago': str(pago.clave), 'tipo': pago.tipo},
+        'success_url': request.build_absolute_uri(reverse('confirmar_pago')) + f'?pago={pago.clave}',
+        'cancel_url': request.build_absolute_uri(reverse('pago_cancelado')),
+    }
+
+
+def _crear_cita(pago):
+    datos = pago.datos
+    paciente = Paciente.objects.select_related('user').get(user_id=pago.usuario_id)
+    cita = Cita.objects.create(
+        paciente=paciente,
+        doctor=pago.doctor,
+        nombre=datos.get('nombre'),
+        doctor_nombre=pago.doctor.user.get_full_name(),
+        fecha=datos.get('fecha'),
+        hora=datos.get('hora'),
+        duracion_minutos=datos.get('duracion', 30),
+        motivo_visita=datos.get('motivo_visita'),
+        datos_consulta=datos.get('datos_consulta', ''),
+        aseguradora=datos.get('aseguradora', ''),
+        fecha_cita=datos.get('fecha'),
+        estado_cita=EstadoCita.NO_CONFIRMADA,
+        precio=Decimal(datos.get('precio')),
+    )
+    # El paciente ya no puede usar otro cupón
+    Paciente.objects.filter(pk=paciente.pk).update(cupon=False)
+    return cita
+
+
+def _activar_suscripcion(pago):
+    doctor = pago.doctor
+    doctor.recomendado = True
+    doctor.save(update_fields=['recomendado'])
+    titulo, lineas = datos_suscripcion(doctor, date.today(), Decimal(pago.monto_centavos) / 100)
+    encolar_comprobante(pago.usuario, titulo, lineas, f"comprobante_suscripcion_doctor_{doctor.id}.pdf", [
+        {
+            'asunto': "Comprobante de pago de su suscripción mensual",
+            'cuerpo': "Adjunto encontrará su comprobante de pago de suscripción.",
+            'remitente': "armadillomedico2025@gmail.com",
+            'destinatarios': [doctor.user.email],
+        },
+    ])
+
+
+def aplicar_pago(clave):
+    """
+    Aplica un pago cobrado exactamente una vez. El cambio de estado
+    'pendiente' -> 'pagado' es un compare-and-swap dentro de la misma
+    transacción que crea la cita: un reintento del webhook (o dos
+    entregas simultáneas) encuentra el pago ya aplicado y no hace nada.
+    Si algo falla se revierte todo y Stripe vuelve a enviar el evento.
+    """
+    with transaction.atomic():
+        if not Pago.objects.filter(clave=clave, estado=Pago.PENDIENTE).update(
+            estado=Pago.PAGADO, procesado_en=timezone.now()
+        ):
+            return Pago.objects.filter(clave=clave).first()
+
+        pago = Pago.objects.select_related('doctor__user').get(clave=clave)
+        if pago.tipo == Pago.CITA_NUEVA:
+            try:
+                with transaction.atomic():
+                    pago.cita = _crear_cita(pago)
+            except (HorarioOcupado, Paciente.DoesNotExist):
+                # Cobrado pero sin horario: queda registrado para reprogramar o reembolsar
+                logger.warning('Pago %s cobrado pero el horario ya estaba ocupado', clave)
+                pago.estado = Pago.CONFLICTO
+        elif pago.tipo == Pago.CITA and pago.cita_id:
+            Cita.objects.filter(pk=pago.cita_id).update(estado_cita=EstadoCita.CONFIRMADA)
+        elif pago.tipo == Pago.SUSCRIPCION:
+            _activar_suscripcion(pago)
+        pago.save(update_fields=['cita', 'estado'])
+        return pago
+
+
+def procesar_evento(payload, firma):
+    """
+    Verifica la firma del webhook con STRIPE_WEBHOOK_SECRET y aplica los
+    eventos de pago. Lanza ValueError (FirmaInvalida si la firma no
+    coincide) si el evento no es válido.
+    """
+    evento = obtener_pasarela().construir_evento(payload, firma)
+    if evento['type'] not in EVENTOS_PAGADO:
+        return None
+    session = evento['data']['object']
+    if session.get('payment_status') != 'paid':
+        # Pago asíncrono aún en curso: llegará async_payment_succeeded
+        return None
+    clave = session.get('client_reference_id') or (session.get('metadata') or {}).get('pago')
+    try:
+        clave = uuid.UUID(str(clave))
+    except ValueError:
+        # Checkout que no creó esta app (p.ej. un Payment Link del Dashboard)
+        return None
+    return aplicar_pago(clave)
@@ -0,0 +1,278 @@
+import asyncio
+import itertools
+import logging
+import threading
+import time
+import weakref
+from functools import lru_cache
+from types import SimpleNamespace
+
+import requests
+import stripe
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class PasarelaError(Exception):
+    """Error del proveedor de pagos; el mensaje se puede mostrar al usuario."""
+
+
+class PagoRechazado(PasarelaError):
+    """La tarjeta fue rechazada (no es una falla del servicio)."""
+
+
+class PasarelaNoDisponible(PasarelaError):
+    """Stripe no respondió a tiempo o el circuito está abierto."""
+
+
+class FirmaInvalida(ValueError):
+    pass
+
+
+class Interruptor:
+    """
+    Circuit breaker por proceso. Tras `fallos_para_abrir` fallas seguidas
+    se abre y rechaza las llamadas sin esperar a Stripe durante
+    `segundos_abierto`; luego deja pasar una de prueba (semiabierto) y se
+    cierra si sale bien.
+    """
+
+    def __init__(self, fallos_para_abrir=5, segundos_abierto=30, reloj=time.monotonic):
+        self.fallos_para_abrir = fallos_para_abrir
+        self.segundos_abierto = segundos_abierto
+        self.reloj = reloj
+        self.fallos = 0
+        self.abierto_hasta = None
+        self._prueba_en_curso = False
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self):
+        if self.abierto_hasta is None:
+            return 'cerrado'
+        return 'abierto' if self.reloj() < self.abierto_hasta else 'semiabierto'
+
+    def permitir(self):
+        with self._lock:
+            estado = self.estado
+            if estado == 'cerrado':
+                return True
+            if estado == 'semiabierto' and not self._prueba_en_curso:
+                self._prueba_en_curso = True
+                return True
+            return False
+
+    def exito(self):
+        with self._lock:
+            self.fallos = 0
+            self.abierto_hasta = None
+            self._prueba_en_curso = False
+
+    def fallo(self):
+        with self._lock:
+            self.fallos += 1
+            self._prueba_en_curso = False
+            if self.fallos >= self.fallos_para_abrir:
+                self.abierto_hasta = self.reloj() + self.segundos_abierto
+
+    def liberar(self):
+        # La llamada terminó sin decir nada de Stripe (error nuestro, cancelación):
+        # si era la de prueba, la próxima puede volver a probar
+        with self._lock:
+            self._prueba_en_curso = False
+
+
+class Pasarela:
+    def construir_evento(self, payload, firma):
+        # Solo verifica la firma HMAC, no llama a Stripe
+        try:
+            return stripe.Webhook.construct_event(payload, firma, settings.STRIPE_WEBHOOK_SECRET)
+        except stripe.SignatureVerificationError as e:
+            raise FirmaInvalida(str(e)) from e
+
+
+class PasarelaStripe(Pasarela):
+    """
+    Cliente de Stripe compartido por el proceso: una sesión HTTP con pool
+    de conexiones, timeouts estrictos de conexión/lectura, reintentos de
+    red con la misma idempotency key y un circuit breaker. Así una caída
+    o lentitud de Stripe no deja a los workers de gunicorn esperando 80 s
+    (el default de la librería). Los métodos a* son para las vistas async
+    y comparten el circuit breaker.
+    """
+
+    # Fallas del servicio (no del usuario): cuentan para abrir el circuito
+    FALLAS_SERVICIO = (stripe.APIConnectionError, stripe.APIError, stripe.RateLimitError)
+
+    def __init__(self):
+        sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=settings.STRIPE_POOL_CONEXIONES)
+        sesion.mount('https://', adaptador)
+        sesion.mount('http://', adaptador)  # STRIPE_API_BASE local (stripe-mock, benchmark)
+        self.cliente = self._nuevo_cliente(stripe.RequestsClient(
+            session=sesion,
+            timeout=(settings.STRIPE_TIMEOUT_CONEXION, settings.STRIPE_TIMEOUT_LECTURA),
+        ))
+        self._clientes_async = weakref.WeakKeyDictionary()  # event loop -> cliente httpx
+        self._lock_async = threading.Lock()
+        self.interruptor = Interruptor(settings.STRIPE_FALLOS_PARA_ABRIR, settings.STRIPE_SEGUNDOS_ABIERTO)
+
+    def _nuevo_cliente(self, http_client):
+        opciones = {}
+        if settings.STRIPE_API_BASE:
+            opciones['base_addresses'] = {'api': settings.STRIPE_API_BASE}
+        return stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=http_client,
+            max_network_retries=settings.STRIPE_REINTENTOS,
+            **opciones,
+        )
+
+    @property
+    def cliente_async(self):
+        # Cliente httpx para las vistas async, con su propio pool de conexiones.
+        # El pool pertenece a un event loop: uno por loop (con uvicorn, uno por
+        # worker); se suelta cuando el loop deja de existir.
+        loop = asyncio.get_running_loop()
+        with self._lock_async:
+            cliente = self._clientes_async.get(loop)
+            if cliente is None:
+                import httpx
+                cliente = self._clientes_async[loop] = self._nuevo_cliente(stripe.HTTPXClient(
+                    timeout=httpx.Timeout(settings.STRIPE_TIMEOUT_LECTURA, connect=settings.STRIPE_TIMEOUT_CONEXION),
+                ))
+        return cliente
+
+    @staticmethod
+    def _usar_async():
+        # Con WSGI cada vista async corre en un loop nuevo: un cliente httpx por
+        # petición no reutilizaría conexiones. Ahí se usa el cliente sync (pool de
+        # requests compartido) desde un hilo.
+        return settings.SERVIDOR == 'asgi'
+
+    def _llamar(self, operacion, *args, **kwargs):
+        self._verificar_interruptor()
+        try:
+            resultado = operacion(*args, **kwargs)
+        except stripe.StripeError as e:
+            raise self._traducir_error(e) from e
+        except BaseException:
+            # TypeError, CancelledError (el cliente cortó la conexión)...: sin soltar
+            # la llamada de prueba el circuito quedaría semiabierto para siempre
+            self.interruptor.liberar()
+            raise
+        self.interruptor.exito()
+        return resultado
+
+    async def _allamar(self, operacion, *args, **kwargs):
+        self._verificar_interruptor()
+        try:
+            resultado = await operacion(*args, **kwargs)
+        except stripe.StripeError as e:
+            raise self._traducir_error(e) from e
+        except BaseException:
+            # TypeError, CancelledError (el cliente cortó la conexión)...: sin soltar
+            # la llamada de prueba el circuito quedaría semiabierto para siempre
+            self.interruptor.liberar()
+            raise
+        self.interruptor.exito()
+        return resultado
+
+    def _verificar_interruptor(self):
+        if not self.interruptor.permitir():
+            raise PasarelaNoDisponible('El servicio de pagos no está disponible. Intenta en unos minutos.')
+
+    def _traducir_error(self, error):
+        # Excepción de la pasarela que corresponde al error de Stripe
+        if isinstance(error, self.FALLAS_SERVICIO):
+            self.interruptor.fallo()
+            logger.warning('Stripe no disponible (%s): %s', self.interruptor.estado, error)
+            return PasarelaNoDisponible('El servicio de pagos no está disponible. Intenta en unos minutos.')
+        # Tarjeta rechazada, petición inválida...: Stripe respondió, el circuito sigue cerrado
+        self.interruptor.exito()
+        mensaje = error.user_message or str(error)
+        return PagoRechazado(mensaje) if isinstance(error, stripe.CardError) else PasarelaError(mensaje)
+
+    def crear_checkout(self, params, idempotency_key):
+        return self._llamar(
+            self.cliente.checkout.sessions.create,
+            params=params, options={'idempotency_key': idempotency_key},
+        )
+
+    async def acrear_checkout(self, params, idempotency_key):
+        if not self._usar_async():
+            return await sync_to_async(self.crear_checkout)(params, idempotency_key)
+        return await self._allamar(
+            self.cliente_async.checkout.sessions.create_async,
+            params=params, options={'idempotency_key': idempotency_key},
+        )
+
+    def crear_payment_intent(self, params, idempotency_key=None):
+        opciones = {'idempotency_key': idempotency_key} if idempotency_key else {}
+        return self._llamar(self.cliente.payment_intents.create, params=params, options=opciones)
+
+    async def acrear_payment_intent(self, params, idempotency_key=None):
+        if not self._usar_async():
+            return await sync_to_async(self.crear_payment_intent)(params, idempotency_key)
+        opciones = {'idempotency_key': idempotency_key} if idempotency_key else {}
+        return await self._allamar(self.cliente_async.payment_intents.create_async, params=params, options=opciones)
+
+
+class PasarelaFalsa(Pasarela):
+    """
+    Pasarela en memoria para pruebas y desarrollo sin red
+    (PAGOS_PASARELA = 'helcon.pasarela.PasarelaFalsa'). Guarda las
+    llamadas y respeta las idempotency keys como Stripe.
+    """
+
+    def __init__(self):
+        self.llamadas = []
+        self.error = None  # excepción a lanzar en la próxima llamada, p.ej. PasarelaNoDisponible()
+        self._por_clave = {}
+        self._ids = itertools.count(1)
+
+    def _registrar(self, tipo, params, idempotency_key):
+        self.llamadas.append((tipo, params, idempotency_key))
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        if idempotency_key in self._por_clave:
+            return self._por_clave[idempotency_key]
+        numero = next(self._ids)
+        objeto = SimpleNamespace(
+            id=f'{tipo}_falso_{numero}',
+            url=f'https://pagos.invalid/{tipo}_falso_{numero}',
+            status='succeeded',
+        )
+        if idempotency_key:
+            self._por_clave[idempotency_key] = objeto
+        return objeto
+
+    def crear_checkout(self, params, idempotency_key):
+        return self._registrar('cs', params, idempotency_key)
+
+    def crear_payment_intent(self, params, idempotency_key=None):
+        return self._registrar('pi', params, idempotency_key)
+
+    async def acrear_checkout(self, params, idempotency_key):
+        return self.crear_checkout(params, idempotency_key)
+
+    async def acrear_payment_intent(self, params, idempotency_key=None):
+        return self.crear_payment_intent(params, idempotency_key)
+
+    def reiniciar(self):
+        self.__init__()
+
+
+@lru_cache(maxsize=None)
+def _pasarela(ruta):
+    return import_string(ruta)()
+
+
+def obtener_pasarela():
+    """Pasarela configurada en settings.PAGOS_PASARELA (una instancia por proceso)."""
+    return _pasarela(settings.PAGOS_PASARELA)
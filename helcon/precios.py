@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+
+# Precios en Decimal con 2 decimales; sin float ni consultas a la base de datos.
+CENTAVO = Decimal('0.01')
+CERO = Decimal('0.00')
+TARIFA_RESERVA = Decimal('0.02')              # lo que se cobra en línea sobre el precio base
+TARIFA_RESERVA_RECOMENDADO = Decimal('0.05')  # doctores recomendados (suscripción pagada)
+DESCUENTO_CUPON = Decimal('0.15')
+
+
+def redondear(valor):
+    return Decimal(valor).quantize(CENTAVO, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class Cotizacion:
+    precio_base: Decimal
+    tarifa: Decimal     # reserva antes del cupón
+    descuento: Decimal
+    total: Decimal      # lo que se cobra con Stripe
+
+    @property
+    def saldo(self):
+        # Lo que queda por pagar en el consultorio
+        return saldo_pendiente(self.precio_base, self.total)
+
+
+def descontar_cupon(monto):
+    """Devuelve (descuento, monto con descuento) del cupón del 15%."""
+    monto = redondear(monto)
+    descuento = redondear(monto * DESCUENTO_CUPON)
+    return descuento, monto - descuento
+
+
+def saldo_pendiente(precio_base, pagado):
+    return redondear((precio_base or CERO) - (pagado or CERO))
+
+
+@lru_cache(maxsize=1024)
+def _cotizar(precio_base, recomendado, cupon):
+    tarifa = redondear(precio_base * (TARIFA_RESERVA_RECOMENDADO if recomendado else TARIFA_RESERVA))
+    descuento, total = descontar_cupon(tarifa) if cupon else (CERO, tarifa)
+    return Cotizacion(precio_base, tarifa, descuento, total)
+
+
+def cotizar(precio_base, recomendado=False, cupon=False):
+    """
+    Cotización de la reserva. Es una función pura, así que se guarda en
+    caché por valor: el precio base entra en la llave, de modo que si el
+    doctor cambia su precio no se sirve una cotización vieja.
+    """
+    return _cotizar(redondear(precio_base or CERO), bool(recomendado), bool(cupon))
+
+
+def cotizar_doctor(doctor, cupon=False):
+    return cotizar(doctor.preciobase, doctor.recomendado, cupon)
@@ -0,0 +1,234 @@
+"""
+Benchmark de punta a punta (comando `medir_rendimiento`): siembra una base
+con N doctores y N citas y recorre los flujos principales con el cliente de
+pruebas de Django, sin red (Stripe es PAGOS_PASARELA = PasarelaFalsa).
+"""
+import random
+import statistics
+import time
+from datetime import date, time as hora_del_dia, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from .comprobantes import datos_cita
+from .disponibilidad import reconstruir_disponibilidad
+from .middleware import Medicion
+from .models import Cita, Doctor, DisponibilidadDia, EstadoCita, HorarioDoctor, Paciente, intervalo_cita
+from .pasarela import obtener_pasarela
+from .trabajos import encolar_comprobante, procesar_trabajos
+
+ESPECIALIDADES = ['Cardiología', 'Dermatología', 'Pediatría', 'Neurología', 'Ginecología', 'Oftalmología', 'Urología']
+NOMBRES = ['Ana', 'Luis', 'María', 'José', 'Carmen', 'Jorge', 'Lucía', 'Pedro', 'Elena', 'Raúl']
+APELLIDOS = ['Pérez', 'Gómez', 'Rodríguez', 'Díaz', 'Morales', 'Castillo', 'Herrera', 'Vargas', 'Ríos', 'Sánchez']
+CIUDADES = ['Panamá', 'Colón', 'David', 'Santiago', 'Chitré']
+
+# Las citas se reparten entre los primeros doctores (los que tienen agenda llena);
+# el doctor del benchmark es el primero y tiene ~N / DOCTORES_CON_CITAS citas
+DOCTORES_CON_CITAS = 100
+HORAS_POR_DIA = 24  # turnos de 30 minutos desde las 7:00
+LOTE = 2000
+
+
+def _hora(turno):
+    minutos = 7 * 60 + 30 * turno
+    return hora_del_dia(minutos // 60, minutos % 60)
+
+
+def _crear_usuarios(prefijo, cantidad, rng):
+    sin_clave = make_password(None)
+    usuarios = [
+        User(username=f'{prefijo}{i}', email=f'{prefijo}{i}@example.com', password=sin_clave,
+             first_name=rng.choice(NOMBRES), last_name=rng.choice(APELLIDOS))
+        for i in range(cantidad)
+    ]
+    User.objects.bulk_create(usuarios, batch_size=LOTE)
+    return list(User.objects.filter(username__startswith=prefijo).order_by('id'))
+
+
+def sembrar(tamano, semilla=0):
+    """
+    Crea `tamano` doctores y `tamano` citas (y un paciente por cada diez
+    citas) con bulk_create. Completa lo que Cita.save() haría una por una:
+    inicio/fin y los bitmaps de disponibilidad (search_text y el índice FTS
+    los mantiene DoctorQuerySet). Devuelve los objetos que usan los flujos.
+    """
+    rng = random.Random(semilla)
+    hoy = timezone.localdate()
+
+    usuarios = _crear_usuarios('bench_doc', tamano, rng)
+    doctores = []
+    for i, usuario in enumerate(usuarios):
+        doctor = Doctor(
+            user=usuario, id_number=f'D{i}', credential_number=f'C{i}',
+            especialidad=rng.choice(ESPECIALIDADES), ubicacion=rng.choice(CIUDADES),
+            descripcion=f'Consulta general y seguimiento de {rng.choice(ESPECIALIDADES).lower()}.',
+            recomendado=i == 0 or rng.random() < 0.1,
+            preciobase=Decimal(rng.randrange(20, 200)),
+        )
+        doctores.append(doctor)
+    # DoctorQuerySet.bulk_create calcula search_text y los triggers llenan el índice FTS
+    Doctor.objects.bulk_create(doctores, batch_size=LOTE)
+    # El doctor del benchmark atiende todos los días en los mismos turnos que las citas sembradas
+    HorarioDoctor.objects.bulk_create([
+        HorarioDoctor(doctor=doctores[0], dia_semana=dia, hora_inicio=_hora(0), hora_fin=_hora(HORAS_POR_DIA), duracion_minutos=30)
+        for dia in range(7)
+    ])
+
+    usuarios = _crear_usuarios('bench_pac', max(10, tamano // 10), rng)
+    pacientes = Paciente.objects.bulk_create([
+        Paciente(user=usuario, birthdate=date(1970 + i % 40, 1 + i % 12, 1), id_number=f'P{i}', phone='6000-0000')
+        for i, usuario in enumerate(usuarios)
+    ], batch_size=LOTE)
+
+    # Cita k: doctor k % D, turno k // D (sin choques de fecha y hora por doctor)
+    con_citas = doctores[:DOCTORES_CON_CITAS]
+    desde = hoy - timedelta(days=30)
+    citas = []
+    for k in range(tamano):
+        doctor = con_citas[k % len(con_citas)]
+        turno = k // len(con_citas)
+        paciente = pacientes[k % len(pacientes)]
+        fecha = desde + timedelta(days=turno // HORAS_POR_DIA)
+        hora = _hora(turno % HORAS_POR_DIA)
+        inicio, fin = intervalo_cita(fecha, hora, 30)
+        citas.append(Cita(
+            doctor=doctor, paciente=paciente, nombre=paciente.user.first_name,
+            doctor_nombre=f'{doctor.user.first_name} {doctor.user.last_name}',
+            fecha=fecha, hora=hora.strftime('%H:%M'), hora_inicio=hora, duracion_minutos=30,
+            inicio=inicio, fin=fin, motivo_visita='Control',
+            estado_cita=rng.choice([EstadoCita.NO_CONFIRMADA, EstadoCita.CONFIRMADA]),
+            precio=doctor.preciobase,
+        ))
+    Cita.objects.bulk_create(citas, batch_size=LOTE)
+    reconstruir_disponibilidad(Cita, DisponibilidadDia)
+
+    paciente = pacientes[0]
+    return SimpleNamespace(
+        doctor=doctores[0],
+        paciente=paciente,
+        citas_paciente=list(Cita.objects.filter(paciente=paciente).select_related('doctor__user')[:20]),
+        desde=desde,
+        # Las reservas del benchmark van después de las citas sembradas y desde mañana
+        # (agenda no acepta horarios que ya pasaron)
+        libre_desde=desde + timedelta(days=tamano // len(con_citas) // HORAS_POR_DIA + 31),
+    )
+
+
+class FlujoFallido(Exception):
+    pass
+
+
+def _pedir(cliente, metodo, url, esperado=200, **kwargs):
+    respuesta = getattr(cliente, metodo)(url, **kwargs)
+    if respuesta.status_code != esperado:
+        raise FlujoFallido(f'{metodo.upper()} {url}: {respuesta.status_code} (se esperaba {esperado})')
+    return respuesta
+
+
+def _clientes(datos):
+    paciente, doctor = Client(), Client()
+    paciente.force_login(datos.paciente.user)
+    doctor.force_login(datos.doctor.user)
+    return SimpleNamespace(paciente=paciente, doctor=doctor, anonimo=Client())
+
+
+def flujo_home_paciente(datos, clientes, i):
+    doctor = datos.doctor
+    variantes = [
+        {},
+        {'q': doctor.user.last_name},
+        {'especialidad': doctor.especialidad},
+        {'q': doctor.ubicacion, 'especialidad': doctor.especialidad},
+    ]
+    _pedir(clientes.paciente, 'get', reverse('home_paciente'), data=variantes[i % len(variantes)])
+
+
+def flujo_api_citas(datos, clientes, i):
+    # Vista semanal de FullCalendar; cada iteración otra semana
+    inicio = datos.desde + timedelta(weeks=i % 4)
+    _pedir(clientes.doctor, 'get', reverse('api_citas'),
+           data={'start': inicio.isoformat(), 'end': (inicio + timedelta(days=7)).isoformat()})
+
+
+def flujo_reserva(datos, clientes, i):
+    """agenda -> vistadecita -> pago_tarjeta (Stripe falso) -> confirmar_pago."""
+    cliente, doctor = clientes.paciente, datos.doctor
+    fecha = datos.libre_desde + timedelta(days=i // HORAS_POR_DIA)
+    _pedir(cliente, 'post', reverse('agenda', args=[doctor.id]), 302, data={
+        'nombre': 'Ana', 'horacita': _hora(i % HORAS_POR_DIA).strftime('%H:%M'),
+        'fecha_cita': fecha.isoformat(), 'motivo_visita': 'Control',
+    })
+    _pedir(cliente, 'get', reverse('vistadecita', args=[doctor.id]))
+    _pedir(cliente, 'post', reverse('pago_tarjeta'), 302)
+    clave = obtener_pasarela().llamadas[-1][1]['client_reference_id']
+    _pedir(cliente, 'get', reverse('confirmar_pago'), data={'pago': clave})
+
+
+def flujo_comprobantes(datos, clientes, i):
+    # Encolar como enviar_comprobante_pago y generar el PDF como el worker
+    cita = datos.citas_paciente[i % len(datos.citas_paciente)]
+    usuario = datos.paciente.user
+    titulo, lineas = datos_cita(cita)
+    encolar_comprobante(usuario, titulo, lineas, f'comprobante_cita_{cita.id}.pdf', [{
+        'asunto': 'Comprobante de pago de su cita médica',
+        'cuerpo': 'Adjunto encontrará su comprobante de pago.',
+        'destinatarios': [usuario.email],
+    }])
+    listos, errores = procesar_trabajos(limite=1)
+    if (listos, errores) != (1, 0):
+        raise FlujoFallido(f'procesar_trabajos: {listos} listos, {errores} con error')
+
+
+def flujo_journals(datos, clientes, i):
+    _pedir(clientes.anonimo, 'get', reverse(f'journal{i % 6 + 1}'))
+
+
+FLUJOS = {
+    'home_paciente': flujo_home_paciente,
+    'api_citas': flujo_api_citas,
+    'reserva': flujo_reserva,
+    'comprobantes': flujo_comprobantes,
+    'journals': flujo_journals,
+}
+
+
+def _percentil(ordenados, p):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def medir(flujo, datos, iteraciones, calentamiento=3):
+    """
+    Corre el flujo `calentamiento` veces sin medir y luego `iteraciones`
+    veces. Devuelve iteraciones por segundo, latencias (ms) y consultas SQL
+    por iteración.
+    """
+    clientes = _clientes(datos)
+    for i in range(calentamiento):
+        flujo(datos, clientes, i)
+
+    medicion = Medicion()
+    tiempos = []
+    with connection.execute_wrapper(medicion):
+        inicio = time.perf_counter()
+        for i in range(calentamiento, calentamiento + iteraciones):
+            antes = time.perf_counter()
+            flujo(datos, clientes, i)
+            tiempos.append(time.perf_counter() - antes)
+        total = time.perf_counter() - inicio
+
+    tiempos.sort()
+    return {
+        'iteraciones': iteraciones,
+        'por_segundo': round(iteraciones / total, 2),
+        'media_ms': round(statistics.fmean(tiempos) * 1000, 2),
+        'p50_ms': round(_percentil(tiempos, 0.5) * 1000, 2),
+        'p99_ms': round(_percentil(tiempos, 0.99) * 1000, 2),
+        'consultas': round(medicion.consultas / iteraciones, 1),
+    }
@@ -0,0 +1,73 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import caches
+from django.urls import get_script_prefix
+
+# Borrador de la cita mientras el paciente pasa por agenda -> vistadecita -> pago.
+# Se guarda en la caché 'reserva' (en disco, compartida por los workers) y la
+# cookie solo lleva una clave aleatoria: ni datos del paciente ni escrituras en
+# la base. Cada paso hace a lo sumo una escritura en la caché.
+COOKIE_RESERVA = 'reserva_id'
+ALIAS_CACHE = 'reserva'
+# Los pasos que leen el borrador cuelgan de /reserva/ (helcon/urls.py); la cookie
+# no se manda al resto del sitio
+RUTA_COOKIE = 'reserva/'
+VERSION = 1  # subir si cambian los campos: los borradores viejos se descartan
+DURACION_SEGUNDOS = 2 * 60 * 60
+
+
+def ruta_cookie():
+    return get_script_prefix() + RUTA_COOKIE
+
+
+class BorradorCita:
+    def __init__(self, user_id, datos, cupon=False, clave=None):
+        self.user_id = user_id
+        self.datos = datos
+        self.cupon = cupon
+        self.clave = clave
+
+    @property
+    def doctor_id(self):
+        return self.datos.get('doctor_id')
+
+    @classmethod
+    def desde_request(cls, request):
+        """Borrador del usuario actual, o None si no hay, expiró o es de otra versión."""
+        clave = request.COOKIES.get(COOKIE_RESERVA)
+        carga = caches[ALIAS_CACHE].get(clave) if clave else None
+        return cls._cargar(clave, carga, request.user.pk)
+
+    @classmethod
+    async def adesde_request(cls, request):
+        clave = request.COOKIES.get(COOKIE_RESERVA)
+        carga = await caches[ALIAS_CACHE].aget(clave) if clave else None
+        return cls._cargar(clave, carga, (await request.auser()).pk)
+
+    @classmethod
+    def _cargar(cls, clave, carga, user_id):
+        if not carga or carga.get('v') != VERSION or carga.get('u') != user_id:
+            return None
+        return cls(carga['u'], carga['d'], carga['c'], clave=clave)
+
+    def guardar(self, response):
+        if self.clave is None:
+            self.clave = secrets.token_urlsafe(32)
+        carga = {'v': VERSION, 'u': self.user_id, 'd': self.datos, 'c': self.cupon}
+        caches[ALIAS_CACHE].set(self.clave, carga, DURACION_SEGUNDOS)
+        response.set_cookie(
+            COOKIE_RESERVA, self.clave, max_age=DURACION_SEGUNDOS, path=ruta_cookie(), httponly=True,
+            samesite='Lax', secure=settings.SESSION_COOKIE_SECURE,
+        )
+
+    @staticmethod
+    def borrar(request, response):
+        clave = request.COOKIES.get(COOKIE_RESERVA)
+        if clave:
+            caches[ALIAS_CACHE].delete(clave)
+            response.delete_cookie(COOKIE_RESERVA, path=ruta_cookie(), samesite='Lax')
+
+    def datos_pago(self, cotizacion):
+        # Lo que se copia en Pago.datos para que el webhook cree la cita
+        return dict(self.datos, precio=str(cotizacion.total), descuento=str(cotizacion.descuento))
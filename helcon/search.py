@@ -0,0 +1,129 @@
+import unicodedata
+
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+from django.db.models.expressions import RawSQL
+
+# Tabla FTS5 (solo SQLite) con tokenizador trigram; en PostgreSQL se usa un
+# índice GIN pg_trgm sobre Doctor.search_text (ver migración 0033).
+FTS_TABLE = 'helcon_doctor_fts'
+TAMANO_PAGINA = 20
+
+_fts_disponible = {}
+
+
+def normalizar(texto):
+    # Minúsculas y sin tildes: "Cardiología" -> "cardiologia"
+    texto = unicodedata.normalize('NFKD', texto or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.lower().split())
+
+
+def texto_busqueda(doctor):
+    partes = [
+        doctor.user.first_name,
+        doctor.user.last_name,
+        doctor.especialidad,
+        doctor.ubicacion,
+        doctor.descripcion,
+    ]
+    return normalizar(' '.join(p for p in partes if p))
+
+
+def fts_disponible():
+    if connection.vendor != 'sqlite':
+        return False
+    if connection.alias not in _fts_disponible:
+        with connection.cursor() as cursor:
+            _fts_disponible[connection.alias] = FTS_TABLE in connection.introspection.table_names(cursor)
+    return _fts_disponible[connection.alias]
+
+
+# El índice FTS lo mantiene SQLite con triggers: cubre save(), update(),
+# bulk_create() y los borrados en cascada (p.ej. al borrar el User).
+TRIGGERS_FTS = {
+    'helcon_doctor_fts_insert': (
+        f'AFTER INSERT ON helcon_doctor BEGIN '
+        f'INSERT OR REPLACE INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END'
+    ),
+    'helcon_doctor_fts_update': (
+        f'AFTER UPDATE OF search_text ON helcon_doctor BEGIN '
+        f'INSERT OR REPLACE INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END'
+    ),
+    'helcon_doctor_fts_delete': (
+        f'AFTER DELETE ON helcon_doctor BEGIN DELETE FROM {FTS_TABLE} WHERE rowid = old.id; END'
+    ),
+}
+
+
+def crear_triggers_fts(conexion):
+    """
+    Crea los triggers si falta alguno. Se llama en post_migrate porque
+    SQLite rehace la tabla helcon_doctor en varias migraciones (AlterField)
+    y al hacerlo se pierden sus triggers.
+    """
+    if conexion.vendor != 'sqlite':
+        return
+    with conexion.cursor() as cursor:
+        if FTS_TABLE not in conexion.introspection.table_names(cursor):
+            return
+        for nombre, cuerpo in TRIGGERS_FTS.items():
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {nombre} {cuerpo}')
+
+
+def filtrar_texto(queryset, query):
+    tokens = normalizar(query).split()
+    # El tokenizador trigram necesita al menos 3 caracteres por término
+    largos = [t for t in tokens if len(t) >= 3]
+    if largos and fts_disponible():
+        expresion = ' '.join('"%s"' % t.replace('"', '""') for t in largos)
+        queryset = queryset.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [expresion]
+        ))
+        tokens = [t for t in tokens if len(t) < 3]
+    for token in tokens:
+        queryset = queryset.filter(search_text__contains=token)
+    return queryset
+
+
+def leer_cursor(valor):
+    # Formato "<recomendado>:<id>", p.ej. "1:42"
+    try:
+        recomendado, doctor_id = valor.split(':')
+        if recomendado not in ('0', '1'):
+            return None
+        return recomendado == '1', int(doctor_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def buscar_doctores(queryset, query=None, especialidad=None, cursor=None, limite=TAMANO_PAGINA):
+    """
+    Busca doctores y devuelve una página (doctores, siguiente_cursor).
+    Orden: recomendados primero y luego por id, paginado por keyset para
+    que el costo no crezca con el número de página.
+    """
+    if query:
+        queryset = filtrar_texto(queryset, query)
+
+    if especialidad:
+        # LOWER(especialidad) = LOWER(%s) usa el índice doctor_especialidad_idx (iexact no puede)
+        queryset = queryset.alias(especialidad_min=Lower('especialidad')).filter(
+            especialidad_min=Lower(Value(especialidad))
+        )
+
+    posicion = leer_cursor(cursor)
+    if posicion:
+        recomendado, doctor_id = posicion
+        queryset = queryset.filter(
+            Q(recomendado__lt=recomendado) | Q(recomendado=recomendado, id__gt=doctor_id)
+        )
+
+    doctores = list(queryset.order_by('-recomendado', 'id')[:limite + 1])
+    siguiente = None
+    if len(doctores) > limite:
+        doctores = doctores[:limite]
+        ultimo = doctores[-1]
+        siguiente = f'{int(ultimo.recomendado)}:{ultimo.id}'
+    return doctores, siguiente
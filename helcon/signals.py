@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Cita, DisponibilidadDia, Doctor
+from .search import crear_triggers_fts
+
+
+@receiver(post_save, sender=User)
+def actualizar_busqueda_doctor(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # search_text incluye el nombre del usuario; el login solo guarda last_login
+    if raw or created:
+        return
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    Doctor.objects.filter(user=instance).actualizar_busqueda()
+
+
+@receiver(post_delete, sender=Cita)
+def liberar_horario(sender, instance, **kwargs):
+    # También en borrados por queryset y en cascada (Paciente, Doctor, User)
+    if instance.ocupa_horario:
+        DisponibilidadDia.recalcular(instance.doctor_id, instance.fecha)
+
+
+def crear_triggers_busqueda(sender, using, **kwargs):
+    crear_triggers_fts(connections[using])
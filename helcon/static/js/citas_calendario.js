@@ -0,0 +1,47 @@
+// Fuente de eventos de FullCalendar para /api/citas/ que solo descarga lo que cambió.
+// La primera vez pide la ventana completa; después manda ?updated_since=<X-Citas-Ultima>
+// y mezcla las citas por id. Si el total no cuadra con X-Citas-Total (se borró una cita
+// o salió de la ventana) vuelve a pedir la ventana completa. Cada URL la revalida el
+// navegador con su ETag: si nada cambió recibe 304 sin cuerpo.
+function fuenteCitas(url) {
+  var ventanas = {};
+
+  function pedir(info, desde) {
+    var params = new URLSearchParams({ start: info.startStr, end: info.endStr });
+    if (desde) params.set('updated_since', desde);
+    return fetch(url + '?' + params.toString(), { credentials: 'same-origin' }).then(function (r) {
+      if (!r.ok) throw new Error('HTTP ' + r.status);
+      return r.json().then(function (eventos) {
+        return {
+          eventos: eventos,
+          total: parseInt(r.headers.get('X-Citas-Total'), 10),
+          ultima: r.headers.get('X-Citas-Ultima'),
+        };
+      });
+    });
+  }
+
+  return function (info, exito, fallo) {
+    var clave = info.startStr + '|' + info.endStr;
+    var previa = ventanas[clave];
+
+    function guardar(respuesta, porId) {
+      porId = porId || new Map();
+      respuesta.eventos.forEach(function (evento) { porId.set(evento.id, evento); });
+      ventanas[clave] = { porId: porId, ultima: respuesta.ultima };
+      return porId;
+    }
+
+    var pedido;
+    if (previa && previa.ultima) {
+      pedido = pedir(info, previa.ultima).then(function (delta) {
+        var porId = guardar(delta, new Map(previa.porId));
+        if (porId.size === delta.total) return porId;
+        return pedir(info).then(function (completo) { return guardar(completo); });
+      });
+    } else {
+      pedido = pedir(info).then(function (completo) { return guardar(completo); });
+    }
+    pedido.then(function (porId) { exito(Array.from(porId.values())); }).catch(fallo);
+  };
+}
@@ -270,6 +270,8 @@ document.addEventListener('DOMContentLoaded', function() {
                         changeLanguage(selectedLang);
                         
                         localStorage.setItem('selectedLanguage', selectedLang);
+                        
+                        document.cookie = `django_language=${selectedLang};path=/;max-age=31536000;samesite=lax`; // idioma para las páginas traducidas en el servidor
                     });
                 });
             } else {
@@ -457,7 +459,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
             // --- Blog specific content ---
             const blogMainImage = document.querySelector('img[data-image-key="blog_main_image"]');
-            if (blogMainImage) blogMainImage.src = `/static/images/${texts.blog_main_image}`;
+            if (blogMainImage) cambiarImagen(blogMainImage, texts.blog_main_image);
 
             const section2H2 = document.querySelector('h2[data-text-key="section2_h2"]');
             if (section2H2) section2H2.textContent = texts.section2_h2;
@@ -465,7 +467,7 @@ document.addEventListener('DOMContentLoaded', function() {
             if (section2P) section2P.textContent = texts.section2_p;
 
             const sleepImage = document.querySelector('img[data-image-key="sleep_image"]');
-            if (sleepImage) sleepImage.src = `/static/images/${texts.sleep_image}`;
+            if (sleepImage) cambiarImagen(sleepImage, texts.sleep_image);
             const sleepH2 = document.querySelector('h2[data-text-key="sleep_h2"]');
             if (sleepH2) sleepH2.textContent = texts.sleep_h2;
             const sleepP1 = document.querySelector('p[data-text-key="sleep_p1"]');
@@ -478,12 +480,12 @@ document.addEventListener('DOMContentLoaded', function() {
             if (sleepP4) sleepP4.textContent = texts.sleep_p4;
 
             const exerciseImage = document.querySelector('img[data-image-key="exercise_image"]');
-            if (exerciseImage) exerciseImage.src = `/static/images/${texts.exercise_image}`;
+            if (exerciseImage) cambiarImagen(exerciseImage, texts.exercise_image);
             const exerciseH2 = document.querySelector('h2[data-text-key="exercise_h2"]');
             if (exerciseH2) exerciseH2.textContent = texts.exercise_h2;
 
             const stressImage = document.querySelector('img[data-image-key="stress_image"]');
-            if (stressImage) stressImage.src = `/static/images/${texts.stress_image}`;
+            if (stressImage) cambiarImagen(stressImage, texts.stress_image);
             const stressH2 = document.querySelector('h2[data-text-key="stress_h2"]');
             if (stressH2) stressH2.textContent = texts.stress_h2;
 
@@ -494,15 +496,15 @@ document.addEventListener('DOMContentLoaded', function() {
             const preventiveCareP2 = document.querySelector('p[data-text-key="preventive_care_p2"]');
             if (preventiveCareP2) preventiveCareP2.textContent = texts.preventive_care_p2;
             const preventionImage = document.querySelector('img[data-image-key="prevention_image"]');
-            if (preventionImage) preventionImage.src = `/static/images/${texts.preventive_care_image}`;
+            if (preventionImage) cambiarImagen(preventionImage, texts.preventive_care_image);
 
             const selfmedicationImage = document.querySelector('img[data-image-key="selfmedication_image"]');
-            if (selfmedicationImage) selfmedicationImage.src = `/static/images/${texts.selfmedication_image}`;
+            if (selfmedicationImage) cambiarImagen(selfmedicationImage, texts.selfmedication_image);
             const selfmedicationH2 = document.querySelector('h2[data-text-key="selfmedication_h2"]');
             if (selfmedicationH2) selfmedicationH2.textContent = texts.selfmedication_h2;
 
             const lifestyleImage = document.querySelector('img[data-image-key="lifestyle_image"]');
-            if (lifestyleImage) lifestyleImage.src = `/static/images/${texts.lifestyle_image}`;
+            if (lifestyleImage) cambiarImagen(lifestyleImage, texts.lifestyle_image);
             const lifestyleH2 = document.querySelector('h2[data-text-key="lifestyle_h2"]');
             if (lifestyleH2) lifestyleH2.textContent = texts.lifestyle_h2;
 
@@ -347,6 +347,8 @@ document.addEventListener('DOMContentLoaded', function() {
                   changeLanguage(selectedLang); // Change page language
                   
                   localStorage.setItem('selectedLanguage', selectedLang); // Save preference
+                  
+                  document.cookie = `django_language=${selectedLang};path=/;max-age=31536000;samesite=lax`; // idioma para las páginas traducidas en el servidor
               });
           });
       } else {
@@ -613,7 +615,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
       // --- Content specific to segundapaginaa.html ---
       const mainFunctionalitiesImage = document.querySelector('img[data-image-key="main_functionalities_image"]');
-      if (mainFunctionalitiesImage) mainFunctionalitiesImage.src = `/static/images/${texts.main_functionalities_image}`;
+      if (mainFunctionalitiesImage) cambiarImagen(mainFunctionalitiesImage, texts.main_functionalities_image);
 
       const mainTitleH2 = document.querySelector('h2[data-text-key="main_title_h2"]');
       if (mainTitleH2) mainTitleH2.innerHTML = texts.main_title_h2 + `<span data-text-key="main_title_span">${texts.main_title_span}</span>`;
@@ -628,7 +630,7 @@ document.addEventListener('DOMContentLoaded', function() {
       if (whatYouCanDoP2) whatYouCanDoP2.textContent = texts.what_you_can_do_p2;
 
       const placeholderImage = document.querySelector('img[data-image-key="placeholder_image"]');
-      if (placeholderImage) placeholderImage.src = `/static/images/${texts.placeholder_image}`;
+      if (placeholderImage) cambiarImagen(placeholderImage, texts.placeholder_image);
 
       const benefitsPatientsH2 = document.querySelector('h2[data-text-key="benefits_patients_h2"]');
       if (benefitsPatientsH2) benefitsPatientsH2.textContent = texts.benefits_patients_h2;
@@ -638,7 +640,7 @@ document.addEventListener('DOMContentLoaded', function() {
       });
 
       const whoWeAreImage = document.querySelector('img[data-image-key="who_we_are_image"]');
-      if (whoWeAreImage) whoWeAreImage.src = `/static/images/${texts.who_we_are_image}`;
+      if (whoWeAreImage) cambiarImagen(whoWeAreImage, texts.who_we_are_image);
 
       const benefitsDoctorsH2 = document.querySelector('h2[data-text-key="benefits_doctors_h2"]');
       if (benefitsDoctorsH2) benefitsDoctorsH2.textContent = texts.benefits_doctors_h2;
@@ -659,7 +661,7 @@ document.addEventListener('DOMContentLoaded', function() {
       if (findDoctorContactButton) findDoctorContactButton.textContent = texts.find_doctor_contact_button;
 
       const contactDoctorImage = document.querySelector('img[data-image-key="contact_doctor_image"]');
-      if (contactDoctorImage) contactDoctorImage.src = `/static/images/${texts.contact_doctor_image}`;
+      if (contactDoctorImage) cambiarImagen(contactDoctorImage, texts.contact_doctor_image);
 
       // --- End content specific to segundapaginaa.html ---
 
@@ -676,7 +678,7 @@ document.addEventListener('DOMContentLoaded', function() {
       const aboutP2 = document.querySelector('p[data-text-key="about_p2"]');
       if (aboutP2) aboutP2.textContent = texts.about_p2;
       const imageAppointment = document.querySelector('img[data-image-key="image_appointment"]');
-      if (imageAppointment) imageAppointment.src = `/static/images/${texts.image_appointment}`;
+      if (imageAppointment) cambiarImagen(imageAppointment, texts.image_appointment);
 
 
       // Main content: mission-section (for tercerapagina.html, maintained for completeness)
@@ -687,7 +689,7 @@ document.addEventListener('DOMContentLoaded', function() {
       const missionP2 = document.querySelector('p[data-text-key="mission_p2"]');
       if (missionP2) missionP2.textContent = texts.mission_p2;
       const imageMission = document.querySelector('img[data-image-key="image_mission"]');
-      if (imageMission) imageMission.src = `/static/images/${texts.image_mission}`;
+      if (imageMission) cambiarImagen(imageMission, texts.image_mission);
 
       // Main content: purpose-section (for tercerapagina.html, maintained for completeness)
       const purposeH2 = document.querySelector('h2[data-text-key="purpose_h2"]');
@@ -699,7 +701,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
       // Privacy section (for tercerapagina.html, maintained for completeness)
       const imagePrivacy = document.querySelector('img[data-image-key="image_privacy"]');
-      if (imagePrivacy) imagePrivacy.src = `/static/images/${texts.image_privacy}`;
+      if (imagePrivacy) cambiarImagen(imagePrivacy, texts.image_privacy);
 
       // Groups intro (for tercerapagina.html, maintained for completeness)
       const groupsH2 = document.querySelector('h2[data-text-key="groups_h2"]');
@@ -718,9 +720,9 @@ document.addEventListener('DOMContentLoaded', function() {
           const titleKey = 'team_title_' + (cardIndex === 1 ? 'design' : cardIndex === 2 ? 'htmlcss' : cardIndex === 3 ? 'javascript' : 'database');
           const namesKey = 'team_names_' + (cardIndex === 1 ? 'design' : cardIndex === 2 ? 'htmlcss' : cardIndex === 3 ? 'javascript' : 'database');
 
-          if (bgImage && texts[bgKey]) bgImage.src = `/static/images/${texts[bgKey]}`;
-          if (titleImage && texts[titleKey]) titleImage.src = `/static/images/${texts[titleKey]}`;
-          if (namesImage && texts[namesKey]) namesImage.src = `/static/images/${texts[namesKey]}`;
+          if (bgImage && texts[bgKey]) cambiarImagen(bgImage, texts[bgKey]);
+          if (titleImage && texts[titleKey]) cambiarImagen(titleImage, texts[titleKey]);
+          if (namesImage && texts[namesKey]) cambiarImagen(namesImage, texts[namesKey]);
       });
 
 
@@ -0,0 +1,57 @@
+// ============================================================================================================
+// Menú de idioma de las páginas que se traducen en el servidor (Django i18n, ver locale/).
+// Guarda el idioma en la cookie django_language y recarga la página ya traducida.
+// ============================================================================================================
+
+document.addEventListener('DOMContentLoaded', function() {
+  // Va en comun.js: las páginas que aún traducen en el navegador
+  // (<html data-traduccion="navegador">) manejan su propio menú
+  if (document.documentElement.dataset.traduccion === 'navegador') return;
+
+  const languageButton = document.getElementById('language-button');
+  const languageMenu = document.getElementById('language-menu');
+  const idiomaActual = document.documentElement.lang;
+
+  function cambiarIdioma(lang) {
+    // Las páginas que todavía traducen en el navegador leen localStorage
+    localStorage.setItem('selectedLanguage', lang);
+    document.cookie = `django_language=${lang};path=/;max-age=31536000;samesite=lax`;
+    if (lang !== idiomaActual) window.location.reload();
+  }
+
+  // Preferencia elegida en otra página antes de que existiera la cookie. Si el
+  // navegador bloquea las cookies la recarga no cambia el idioma, así que se
+  // intenta una sola vez por sesión (si no, recargaría en cada visita)
+  const guardado = localStorage.getItem('selectedLanguage');
+  if (guardado && guardado !== idiomaActual && !document.cookie.includes('django_language=')
+      && !sessionStorage.getItem('idiomaRecargado')) {
+    sessionStorage.setItem('idiomaRecargado', '1');
+    cambiarIdioma(guardado);
+    return;
+  }
+
+  if (!languageButton || !languageMenu) return;
+
+  languageButton.addEventListener('click', function(e) {
+    e.stopPropagation();
+    languageMenu.classList.toggle('show');
+  });
+
+  document.addEventListener('click', function(e) {
+    if (!languageButton.contains(e.target) && !languageMenu.contains(e.target)) {
+      languageMenu.classList.remove('show');
+    }
+  });
+
+  document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') languageMenu.classList.remove('show');
+  });
+
+  languageMenu.querySelectorAll('.dropdown-item[data-lang]').forEach(item => {
+    item.addEventListener('click', function(e) {
+      e.preventDefault();
+      languageMenu.classList.remove('show');
+      cambiarIdioma(this.getAttribute('data-lang'));
+    });
+  });
+});
@@ -0,0 +1,17 @@
+// Cambia la imagen de un <img> (p.ej. al traducir la página) sin perder sus
+// variantes por ancho. Las imágenes con {% responsive_image %} traen
+// data-anchos y sus variantes están en /static/images/variantes/.
+function cambiarImagen(img, archivo) {
+  if (!img || !archivo) return;
+  const anchos = (img.dataset.anchos || '').split(' ').filter(Boolean);
+  if (!anchos.length) {
+    // Sin variantes (no se generaron o el <img> no usa el tag): el original
+    img.removeAttribute('srcset');
+    img.src = '/static/images/' + archivo;
+    return;
+  }
+  const base = archivo.replace(/\.[^.]+$/, '');
+  const variante = ancho => `/static/images/variantes/${base}_${ancho}.webp`;
+  img.srcset = anchos.map(ancho => `${variante(ancho)} ${ancho}w`).join(', ');
+  img.src = variante(anchos[anchos.length - 1]);
+}
@@ -0,0 +1,263 @@
+// ============================================================================================================
+// Animaciones compartidas por los journal 3 a 6 (bundle journal.js)
+// Clase AnimationController: Gestiona las animaciones de elementos al hacer scroll y hover
+// ============================================================================================================
+class AnimationController {
+    constructor(elementsConfig) {
+        this.elementsConfig = elementsConfig; // [{selector, animation, direction, distance}] de la página
+        this.animatedElements = new Set(); // Almacena elementos ya animados para evitar re-animación
+        this.observer = null; // Observador de intersección para detectar elementos en la vista
+        this.init(); // Inicializa la configuración
+    }
+
+    // Inicializa el controlador, esperando a que el DOM esté completamente cargado
+    init() {
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', () => this.setup());
+        } else {
+            this.setup();
+        }
+    }
+
+    // Configura el Intersection Observer, prepara elementos y listeners
+    setup() {
+        this.setupIntersectionObserver();
+        this.prepareElements();
+        this.setupEventListeners();
+        this.animateHeader(); // Anima el encabezado al cargar la página
+    }
+
+    // Configura el Intersection Observer para detectar cuando los elementos entran en la vista
+    setupIntersectionObserver() {
+        const options = {
+            root: null, // El viewport es el elemento raíz
+            rootMargin: '0px 0px -10% 0px', // Un margen inferior para que la animación se dispare un poco antes de que el elemento esté completamente visible
+            threshold: [0.1, 0.3, 0.5] // Dispara el callback cuando el 10%, 30% o 50% del elemento es visible
+        };
+
+        this.observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                // Si el elemento está intersectando y no ha sido animado aún
+                if (entry.isIntersecting && !this.animatedElements.has(entry.target)) {
+                    this.animateElement(entry.target); // Anima el elemento
+                    this.animatedElements.add(entry.target); // Añade a los elementos animados
+                }
+            });
+        }, options);
+    }
+
+    // Prepara los elementos a animar, estableciendo sus estilos iniciales y observándolos
+    prepareElements() {
+
+        this.elementsConfig.forEach(config => {
+            const element = document.querySelector(config.selector);
+            if (element) {
+                this.prepareElement(element, config); // Prepara el estilo inicial del elemento
+                this.observer.observe(element); // Empieza a observar el elemento
+            }
+        });
+    }
+
+    // Establece los estilos iniciales de opacidad y transformación para un elemento
+    prepareElement(element, config) {
+        element.style.opacity = '0';
+        element.style.transition = 'transform 0.7s ease-out, opacity 0.7s ease-out';
+        element.dataset.animationType = config.animation;
+
+        switch (config.direction) {
+            case 'up':
+                element.style.transform = `translateY(${config.distance}px)`;
+                break;
+            case 'right':
+                element.style.transform = `translateX(-${config.distance}px)`;
+                break;
+            case 'stagger':
+                this.prepareStaggerElement(element); // Prepara los hijos para animación escalonada
+                break;
+            default:
+                element.style.transform = `translateY(${config.distance || 20}px)`;
+        }
+    }
+
+    // Prepara los elementos hijos para una animación escalonada
+    prepareStaggerElement(element) {
+        // Selecciona todos los elementos de texto dentro del contenedor
+        const children = element.querySelectorAll('h1, h2, h3, p, li');
+        children.forEach((child, index) => {
+            child.style.opacity = '0'; // Inicialmente oculto
+            // Alterna la dirección inicial de la transformación para un efecto de "zig-zag"
+            child.style.transform = index % 2 === 0 ? 'translateX(-30px)' : 'translateX(30px)';
+            child.style.transition = 'transform 0.6s ease-out, opacity 0.6s ease-out'; // Transición suave
+            child.dataset.staggerIndex = index; // Almacena el índice para el retardo
+        });
+    }
+
+    // Anima un elemento dependiendo de su tipo de animación
+    animateElement(element) {
+        const animationType = element.dataset.animationType;
+        if (animationType === 'custom') {
+            this.animateStaggerElement(element); // Llama a la animación escalonada
+        } else {
+            this.animateStandardElement(element); // Llama a la animación estándar
+        }
+        // También anima elementos de lista si existen dentro del elemento principal
+        this.animateListItems(element);
+    }
+
+    // Anima un elemento con una transición estándar (fade in y translate)
+    animateStandardElement(element) {
+        requestAnimationFrame(() => {
+            element.style.opacity = '1';
+            element.style.transform = 'translate(0, 0)'; // Vuelve a la posición original
+            // Si usa clases de Animate.css, las añade
+            if (element.dataset.animationType && element.dataset.animationType.includes('animate__')) {
+                element.classList.add('animate__animated', element.dataset.animationType);
+            }
+        });
+    }
+
+    // Anima elementos hijos de forma escalonada
+    animateStaggerElement(element) {
+        element.style.opacity = '1'; // Asegura que el contenedor principal sea visible
+        const children = element.querySelectorAll('[data-stagger-index]');
+        children.forEach((child, index) => {
+            setTimeout(() => {
+                requestAnimationFrame(() => {
+                    child.style.opacity = '1';
+                    child.style.transform = 'translateX(0)'; // Vuelve a la posición original
+                });
+            }, index * 150); // Retardo escalonado
+        });
+    }
+
+    // Anima elementos de lista (ol, ul) de forma escalonada
+    animateListItems(element) {
+        // Animar elementos de listas ordenadas (ol li)
+        const olItems = element.querySelectorAll('ol li');
+        if (olItems.length > 0 && !element.hasAttribute('data-ol-animated')) {
+            element.setAttribute('data-ol-animated', 'true'); // Marca para evitar doble animación
+            this.staggerAnimate(olItems, 200, 'translateX(-20px)'); // Retardo y transformación inicial
+        }
+
+        // Animar elementos de listas no ordenadas (ul li)
+        const ulItems = element.querySelectorAll('ul li');
+        if (ulItems.length > 0 && !element.hasAttribute('data-ul-animated')) {
+            element.setAttribute('data-ul-animated', 'true'); // Marca para evitar doble animación
+            this.staggerAnimate(ulItems, 150, 'translateY(20px)'); // Retardo y transformación inicial
+        }
+    }
+
+    // Función genérica para animación escalonada de elementos de lista
+    staggerAnimate(items, delay, initialTransform) {
+        items.forEach((item, index) => {
+            item.style.opacity = '0';
+            item.style.transform = initialTransform;
+            item.style.transition = 'transform 0.6s ease-out, opacity 0.6s ease-out';
+            setTimeout(() => {
+                requestAnimationFrame(() => {
+                    item.style.opacity = '1';
+                    item.style.transform = 'translate(0, 0)';
+                });
+            }, index * delay + 300); // Retardo con un offset inicial
+        });
+    }
+
+    // Anima el encabezado de la página al cargar
+    animateHeader() {
+        const header = document.querySelector('header');
+        if (header) {
+            header.style.opacity = '0';
+            header.style.transform = 'translateY(-20px)';
+            header.style.transition = 'transform 0.8s ease-out, opacity 0.8s ease-out';
+            setTimeout(() => {
+                requestAnimationFrame(() => {
+                    header.style.opacity = '1';
+                    header.style.transform = 'translateY(0)';
+                });
+            }, 100);
+        }
+    }
+
+    // Configura los event listeners para scroll y redimensionado, y animaciones de hover
+    setupEventListeners() {
+        let ticking = false; // Bandera para optimizar el evento scroll
+        window.addEventListener('scroll', () => {
+            if (!ticking) {
+                requestAnimationFrame(() => {
+                    this.handleScroll(); // Llama a la función de manejo de scroll
+                    ticking = false;
+                });
+                ticking = true;
+            }
+        }, { passive: true }); // Usar { passive: true } para mejorar el rendimiento del scroll
+
+        this.setupHoverAnimations(); // Configura animaciones de hover
+
+        window.addEventListener('resize', this.debounce(() => {
+            this.handleResize(); // Llama a la función de manejo de redimensionado
+        }, 250));
+    }
+
+    // Función de manejo de scroll (puede estar vacía si el observer hace todo el trabajo)
+    handleScroll() {}
+
+    // Función de manejo de redimensionado
+    handleResize() {}
+
+    // Configura animaciones de hover para botones y enlaces de navegación
+    setupHoverAnimations() {
+        const buttons = document.querySelectorAll('button');
+        buttons.forEach(button => {
+            button.addEventListener('mouseenter', () => {
+                button.style.transform = 'scale(1.05)';
+                button.style.transition = 'transform 0.2s ease';
+            });
+            button.addEventListener('mouseleave', () => {
+                button.style.transform = 'scale(1)';
+            });
+        });
+
+        const navLinks = document.querySelectorAll('.barra-navegacion a');
+        navLinks.forEach(link => {
+            link.addEventListener('mouseenter', () => {
+                link.style.transform = 'translateY(-2px)';
+                link.style.transition = 'transform 0.2s ease';
+            });
+            link.addEventListener('mouseleave', () => {
+                link.style.transform = 'translateY(0)';
+            });
+        });
+    }
+
+    // Función debounce para limitar la frecuencia de ejecución de funciones (ej. en resize)
+    debounce(func, wait) {
+        let timeout;
+        return function (...args) {
+            clearTimeout(timeout);
+            timeout = setTimeout(() => func(...args), wait);
+        };
+    }
+
+    // Desconecta el observer y limpia elementos animados al destruir el controlador
+    destroy() {
+        if (this.observer) {
+            this.observer.disconnect();
+        }
+        this.animatedElements.clear();
+    }
+
+    // Permite añadir dinámicamente elementos a observar
+    addElement(selector, config) {
+        const element = document.querySelector(selector);
+        if (element) {
+            this.prepareElement(element, config);
+            this.observer.observe(element);
+        }
+    }
+}
+
+// Instancia global del controlador de animaciones. Los elementos a animar de cada
+// journal van en la plantilla: <script type="application/json" id="animaciones-journal">
+const animacionesJournal = document.getElementById('animaciones-journal');
+const animationController = new AnimationController(animacionesJournal ? JSON.parse(animacionesJournal.textContent) : []);
+window.AnimationController = animationController;
@@ -77,6 +77,8 @@ document.addEventListener('DOMContentLoaded', function() {
                     changeLanguage(selectedLang);
 
                     localStorage.setItem('selectedLanguage', selectedLang);
+
+                    document.cookie = `django_language=${selectedLang};path=/;max-age=31536000;samesite=lax`; // idioma para las páginas traducidas en el servidor
                 });
             });
         } else {
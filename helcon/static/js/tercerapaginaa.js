@@ -339,6 +339,8 @@ document.addEventListener('DOMContentLoaded', function() {
                   changeLanguage(selectedLang); // Cambiar el idioma de la página
                   
                   localStorage.setItem('selectedLanguage', selectedLang); // Guardar preferencia
+                  
+                  document.cookie = `django_language=${selectedLang};path=/;max-age=31536000;samesite=lax`; // idioma para las páginas traducidas en el servidor
               });
           });
       } else {
@@ -722,7 +724,7 @@ document.addEventListener('DOMContentLoaded', function() {
   console.log(` Imagen detectada: ${imageKey} → ${imageFile}`);
 
   if (imageFile) {
-    img.src = `/static/images/${imageFile}`;
+    cambiarImagen(img, imageFile);
   } else {
     console.warn(` Imagen no encontrada para "${imageKey}"`);
   }
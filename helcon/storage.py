@@ -0,0 +1,19 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticComprimido(CompressedManifestStaticFilesStorage):
+    """
+    Estáticos con hash en el nombre (cache de un año, immutable) y copias
+    .gz/.br generadas en collectstatic, que WhiteNoise sirve según el
+    Accept-Encoding. Los originales sin hash se conservan porque el JS de
+    traducción arma rutas /static/images/... a mano.
+    """
+
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Archivo que no pasó por collectstatic (o que no existe): se sirve sin hash
+            return name
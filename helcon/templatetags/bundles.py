@@ -0,0 +1,36 @@
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from helcon.bundles import BUNDLES, ruta_bundle
+
+register = template.Library()
+
+
+@lru_cache(maxsize=None)
+def _bundle_construido(nombre):
+    return finders.find(ruta_bundle(nombre)) is not None
+
+
+def _etiqueta(ruta):
+    if ruta.endswith('.css'):
+        return format_html('<link rel="stylesheet" href="{}">', static(ruta))
+    return format_html('<script src="{}"></script>', static(ruta))
+
+
+@register.simple_tag
+def bundle(nombre):
+    """
+    <link>/<script> de un bundle de helcon/bundles.py. En DEBUG, o si aún no
+    se corrió `manage.py construir_bundles`, se incluyen los archivos
+    originales por separado para poder editarlos sin reconstruir.
+    """
+    if nombre not in BUNDLES:
+        raise template.TemplateSyntaxError(f'Bundle desconocido: {nombre}')
+    if not settings.DEBUG and _bundle_construido(nombre):
+        return _etiqueta(ruta_bundle(nombre))
+    return format_html_join('\n', '{}', ((_etiqueta(ruta),) for ruta in BUNDLES[nombre]))
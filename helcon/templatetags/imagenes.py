@@ -0,0 +1,64 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.translation import get_language
+
+from helcon.imagenes import leer_manifiesto
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def foto_doctor(doctor, ancho=180):
+    """
+    Atributos src/srcset/sizes de la foto de perfil de un doctor usando
+    sus miniaturas WebP. Uso: <img {% foto_doctor doctor 50 %} alt="...">
+    """
+    miniaturas = getattr(doctor, 'fotos_miniaturas', None) or {}
+    if not miniaturas:
+        return format_html('src="{}" loading="lazy"', doctor.foto_perfil.url)
+
+    urls = {int(t): default_storage.url(ruta) for t, ruta in miniaturas.items()}
+    # La más pequeña que cubra el ancho mostrado sirve de src por defecto
+    src = urls[min((t for t in urls if t >= ancho), default=max(urls))]
+    srcset = ', '.join(f'{urls[t]} {t}w' for t in sorted(urls))
+    return format_html(
+        'src="{}" srcset="{}" sizes="{}px" width="{}" height="{}" loading="lazy"',
+        src, srcset, ancho, ancho, ancho,
+    )
+
+
+@register.simple_tag
+def responsive_image(ruta, sizes='100vw', loading='lazy'):
+    """
+    Atributos de una imagen estática con sus variantes por ancho, según el
+    manifiesto que genera `manage.py generar_variantes`. Uso:
+    <img {% responsive_image 'images/sleep.webp' '50vw' %} alt="...">
+    Para la imagen principal de la página conviene loading='eager'.
+    """
+    datos = leer_manifiesto().get(ruta)
+    if not datos:
+        # Sin variantes generadas (p.ej. en desarrollo): la imagen original
+        return format_html('src="{}" loading="{}"', static(ruta), loading)
+
+    urls = {int(a): static(variante) for a, variante in datos['variantes'].items()}
+    srcset = ', '.join(f'{urls[a]} {a}w' for a in sorted(urls))
+    return format_html(
+        'src="{}" srcset="{}" sizes="{}" width="{}" height="{}" loading="{}" decoding="async" data-anchos="{}"',
+        urls[max(urls)], srcset, sizes, datos['ancho'], datos['alto'], loading,
+        ' '.join(str(a) for a in sorted(urls)),
+    )
+
+
+@register.filter
+def por_idioma(ruta):
+    # 'images/cupon1_{idioma}.webp' -> la versión _esp o _eng según el idioma activo
+    return ruta.replace('{idioma}', 'eng' if (get_language() or '').startswith('en') else 'esp')
+
+
+@register.filter
+def en_espanol(ruta_en, ruta_es):
+    # 'images/pause.webp'|en_espanol:'images/PAUSA_esp.webp' -> para las imágenes que no siguen el _esp/_eng
+    return ruta_en if (get_language() or '').startswith('en') else ruta_es
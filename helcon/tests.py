@@ -1,3 +1,1708 @@
-from django.test import TestCase
+import asyncio
+import gc
+import hashlib
+import hmac
+import io
+import os
+import json
+import random
+import re
+import runpy
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time as reloj
+from importlib import import_module
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import polib
+import stripe
+from PIL import Image
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core import mail
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.db.utils import ConnectionHandler
+from django.db.models import F
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template import Context, Template, TemplateSyntaxError
+from django.templatetags.static import static
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .bundles import BUNDLES, construir_bundles
+from .cache import pagina_cacheada
+from .comprobantes import _renderizar_cacheado, datos_suscripcion, renderizar, renderizar_comprobante
+from .correo import MAX_INTENTOS, encolar_correo, enviar_pendientes
+from .disponibilidad import reconstruir_disponibilidad
+from .management.commands.extraer_traducciones_js import textos_usados
+from .imagenes import STATIC_APP, generar_variantes, leer_manifiesto
+from .middleware import SESSION_ROL, MetricasMiddleware, PerfilMiddleware, PresupuestoExcedido, obtener_perfil
+from .models import (
+    Cita, CorreoPendiente, DisponibilidadDia, Doctor, EstadoCita, HorarioDoctor, HorarioOcupado, NuevosPacientes, Paciente, Pago,
+    TrabajoComprobante, mascara_slots,
+)
+from .pasarela import PagoRechazado, PasarelaNoDisponible, PasarelaStripe, obtener_pasarela
+from .precios import CERO, Cotizacion, cotizar
+from .rendimiento import FLUJOS, medir, sembrar
+from .reserva import COOKIE_RESERVA, BorradorCita
+from .search import FTS_TABLE, buscar_doctores, fts_disponible
+from .storage import StaticComprimido
+from .templatetags import bundles as tag_bundles
+from .templatetags.imagenes import foto_doctor, responsive_image
+from .trabajos import MAX_INTENTOS as MAX_INTENTOS_TRABAJO, _tomar_trabajos, crear_pool, encolar_comprobante, procesar_trabajos
+
+
+def crear_doctor(usuario, **campos):
+    user = User.objects.create_user(usuario, f'{usuario}@example.com', 'clave-segura-123', first_name=usuario.title())
+    return Doctor.objects.create(user=user, id_number=usuario, credential_number=usuario, **campos)
+
+
+def crear_paciente(usuario):
+    user = User.objects.create_user(usuario, f'{usuario}@example.com', 'clave-segura-123', first_name=usuario.title())
+    return Paciente.objects.create(user=user, birthdate=date(1990, 1, 1), id_number=usuario, phone='6000-0000')
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN es de SQLite')
+class IndicesConsultasTests(TestCase):
+    """
+    Las consultas de las vistas más usadas deben resolverse con índices:
+    EXPLAIN QUERY PLAN (SQLite) no puede mostrar un SCAN completo de la
+    tabla ni un ordenamiento en memoria (USE TEMP B-TREE).
+    """
+    TABLAS = ('helcon_cita', 'helcon_doctor', 'helcon_nuevospacientes')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house', especialidad='Cardiología', recomendado=True)
+        crear_doctor('wilson', especialidad='Pediatría')
+        cls.paciente = crear_paciente('ana')
+        for dia in range(1, 6):
+            Cita.objects.create(
+                doctor=cls.doctor, paciente=cls.paciente, nombre='Ana', doctor_nombre='House',
+                fecha=date(2030, 1, dia), hora='10:00', motivo_visita='Control',
+            )
+        cls.sin_cuenta = Cita.objects.create(
+            doctor=cls.doctor, nombre='Luis', doctor_nombre='House',
+            fecha=date(2030, 2, 1), hora='11:00', motivo_visita='Dolor',
+        )
+        NuevosPacientes.objects.create(
+            nombre='Luis', fecha_nacimiento=date(1980, 5, 5), fecha_cita=date(2030, 2, 1),
+            cedula='8-888-888', telefono='6000-0001', correo='luis@example.com',
+        )
+
+    def planes(self, queries):
+        for query in queries:
+            sql = query['sql']
+            if not sql.startswith('SELECT') or not any(f'"{t}"' in sql for t in self.TABLAS):
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                yield sql, '\n'.join(fila[-1] for fila in cursor.fetchall())
+
+    def assertUsaIndices(self, respuesta_fn, tablas):
+        with CaptureQueriesContext(connection) as contexto:
+            respuesta_fn()
+        revisadas = set()
+        for sql, plan in self.planes(contexto.captured_queries):
+            for tabla in self.TABLAS:
+                if re.search(rf'\bSCAN {tabla}$', plan, re.MULTILINE):
+                    self.fail(f'Recorrido completo de {tabla}:\n{sql}\n{plan}')
+                if f'"{tabla}"' in sql:
+                    revisadas.add(tabla)
+            self.assertNotIn('USE TEMP B-TREE', plan, f'Ordenamiento sin índice:\n{sql}\n{plan}')
+        self.assertTrue(set(tablas) <= revisadas, f'No se consultaron {set(tablas) - revisadas}')
+
+    def test_home_doctor(self):
+        self.client.force_login(self.doctor.user)
+        self.assertUsaIndices(lambda: self.client.get(reverse('home_doctor')), ['helcon_cita'])
+
+    def test_citas_del_paciente(self):
+        self.client.force_login(self.paciente.user)
+        self.assertUsaIndices(lambda: self.client.get(reverse('detalle_cita_paciente')), ['helcon_cita'])
+
+    def test_busqueda_por_especialidad(self):
+        self.client.force_login(self.paciente.user)
+        self.assertUsaIndices(
+            lambda: self.client.get(reverse('home_paciente'), {'especialidad': 'cardiología'}),
+            ['helcon_doctor'],
+        )
+        respuesta = self.client.get(reverse('home_paciente'), {'especialidad': 'cardiología'})
+        self.assertEqual([d.pk for d in respuesta.context['doctores']], [self.doctor.pk])
+
+    def test_cancelar_cita_sin_cuenta(self):
+        self.client.force_login(self.doctor.user)
+        self.assertUsaIndices(
+            lambda: self.client.post(reverse('detalle_cita', args=[self.sin_cuenta.pk]), {'accion': 'cancelar'}),
+            ['helcon_nuevospacientes'],
+        )
+        self.assertFalse(Cita.objects.filter(pk=self.sin_cuenta.pk).exists())
+
+
+class PerfilMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house')
+        cls.paciente = crear_paciente('ana')
+
+    def preparar(self, user, session=None):
+        request = RequestFactory().get('/')
+        request.user = user
+        # Como AuthenticationMiddleware: las vistas async piden el usuario con auser()
+        request.auser = sync_to_async(lambda: user)
+        request.session = SessionStore() if session is None else session
+        PerfilMiddleware(lambda r: HttpResponse())(request)
+        return request
+
+    def test_anonimo_no_consulta(self):
+        request = self.preparar(AnonymousUser())
+        with self.assertNumQueries(0):
+            self.assertFalse(request.perfil)
+            self.assertIsNone(request.perfil.doctor)
+
+    def test_perfil_se_carga_una_vez_y_recuerda_el_rol(self):
+        request = self.preparar(self.doctor.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(request.perfil.doctor, self.doctor)
+            self.assertIsNone(request.perfil.paciente)
+            self.assertEqual(obtener_perfil(request).rol, 'doctor')
+        self.assertEqual(request.session[SESSION_ROL], {'user': self.doctor.user.pk, 'rol': 'doctor'})
+
+    def test_rol_guardado_consulta_solo_su_tabla(self):
+        session = SessionStore()
+        session[SESSION_ROL] = {'user': self.paciente.user.pk, 'rol': 'paciente'}
+        request = self.preparar(self.paciente.user, session)
+        with CaptureQueriesContext(connection) as consultas:
+            self.assertEqual(request.perfil.paciente, self.paciente)
+        self.assertEqual(len(consultas), 1)
+        self.assertIn('helcon_paciente', consultas[0]['sql'])
+
+    def test_rol_de_otro_usuario_se_ignora(self):
+        session = SessionStore()
+        session[SESSION_ROL] = {'user': self.doctor.user.pk, 'rol': 'doctor'}
+        request = self.preparar(self.paciente.user, session)
+        self.assertEqual(request.perfil.paciente, self.paciente)
+        self.assertEqual(request.session[SESSION_ROL], {'user': self.paciente.user.pk, 'rol': 'paciente'})
+
+    async def test_aperfil_en_vistas_async(self):
+        request = await sync_to_async(self.preparar)(self.paciente.user)
+        perfil = await request.aperfil()
+        self.assertEqual((perfil.rol, perfil.paciente.pk), ('paciente', self.paciente.pk))
+        # Comparte la carga con request.perfil
+        self.assertIs(await request.aperfil(), perfil)
+
+
+class BuscadorDoctoresTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.abel = crear_doctor('abel', especialidad='Cardiología', ubicacion='Panamá', recomendado=True)
+        cls.luis = crear_doctor('luis', especialidad='Cardiología', ubicacion='David')
+        cls.rosa = crear_doctor('rosa', especialidad='Pediatría', ubicacion='Colón')
+
+    def buscar(self, **kwargs):
+        doctores, siguiente = buscar_doctores(Doctor.objects.select_related('user'), **kwargs)
+        return [d.pk for d in doctores], siguiente
+
+    def filas_fts(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT rowid, search_text FROM {FTS_TABLE}')
+            return dict(cursor.fetchall())
+
+    def test_paginacion_por_cursor_sin_repetir_ni_saltar(self):
+        for i in range(4):
+            crear_doctor(f'extra{i}', recomendado=i % 2 == 0)
+        esperado = list(Doctor.objects.order_by('-recomendado', 'id').values_list('pk', flat=True))
+        vistos, cursor = [], None
+        while True:
+            pagina, cursor = self.buscar(cursor=cursor, limite=2)
+            vistos += pagina
+            if cursor is None:
+                break
+        self.assertEqual(vistos, esperado)
+        # Un cursor inválido vuelve a la primera página
+        self.assertEqual(self.buscar(cursor='x:1', limite=2)[0], esperado[:2])
+
+    def test_terminos_cortos_por_like_y_largos_por_fts(self):
+        self.assertTrue(fts_disponible())
+        # 'cardiologia' (sin tilde) va por FTS; 'ab' tiene menos de 3 letras y va por LIKE
+        self.assertEqual(self.buscar(query='Cardiologia')[0], [self.abel.pk, self.luis.pk])
+        self.assertEqual(self.buscar(query='cardio ab')[0], [self.abel.pk])
+        self.assertEqual(self.buscar(query='lu')[0], [self.luis.pk])
+
+    def test_filtro_de_especialidad_sin_distinguir_mayusculas(self):
+        self.assertEqual(self.buscar(especialidad='cardiología')[0], [self.abel.pk, self.luis.pk])
+        self.assertEqual(self.buscar(query='colon', especialidad='Pediatría')[0], [self.rosa.pk])
+        self.assertEqual(self.buscar(query='colon', especialidad='Cardiología')[0], [])
+
+    def test_cambios_fuera_de_save_actualizan_el_indice(self):
+        # Cambio de nombre en el User
+        self.luis.user.first_name = 'Gregorio'
+        self.luis.user.save()
+        self.assertEqual(self.buscar(query='gregorio')[0], [self.luis.pk])
+        # update() del queryset
+        Doctor.objects.filter(pk=self.rosa.pk).update(ubicacion='Chitré')
+        self.assertEqual(self.buscar(query='chitre')[0], [self.rosa.pk])
+        self.assertEqual(self.buscar(query='colon')[0], [])
+        # bulk_create
+        user = User.objects.create_user('nuevo', first_name='Ximena')
+        nuevo, = Doctor.objects.bulk_create([Doctor(user=user, id_number='n', credential_number='n', especialidad='Urología')])
+        self.assertEqual(self.buscar(query='ximena urologia')[0], [nuevo.pk])
+        self.assertEqual(self.filas_fts(), dict(Doctor.objects.values_list('pk', 'search_text')))
+
+    def test_borrar_el_user_borra_la_fila_fts(self):
+        self.rosa.user.delete()
+        self.assertNotIn(self.rosa.pk, self.filas_fts())
+        self.assertEqual(self.buscar(query='pediatria')[0], [])
+
+
+class CitaUnicaTests(TestCase):
+    def test_misma_hora_no_se_puede_reservar_dos_veces(self):
+        doctor = crear_doctor('house')
+        datos = dict(doctor=doctor, nombre='Ana', doctor_nombre='House', fecha=date(2030, 1, 1), motivo_visita='x')
+        # 'a las diez' no se puede interpretar como hora: solo la restricción única lo detecta
+        Cita.objects.create(hora='a las diez', **datos)
+        with self.assertRaises(HorarioOcupado):
+            Cita.objects.create(hora='a las diez', **datos)
+
+    def test_una_cita_cancelada_libera_el_horario(self):
+        doctor = crear_doctor('house')
+        datos = dict(doctor=doctor, nombre='Ana', doctor_nombre='House', fecha=date(2030, 1, 1), motivo_visita='x')
+        Cita.objects.create(hora='sin hora', estado_cita=EstadoCita.CANCELADA, **datos)
+        Cita.objects.create(hora='sin hora', **datos)
+        self.assertEqual(Cita.objects.count(), 2)
+
+
+class DisponibilidadTests(TestCase):
+    LUNES = date(2030, 1, 7)
+
+    def setUp(self):
+        self.doctor = crear_doctor('house')
+        self.paciente = crear_paciente('ana')
+
+    def reservar(self, hora, fecha=LUNES, **campos):
+        return Cita.objects.create(
+            doctor=campos.pop('doctor', self.doctor), paciente=self.paciente, nombre='Ana', doctor_nombre='House',
+            fecha=fecha, hora=hora, motivo_visita='x', **campos,
+        )
+
+    def ocupados(self, fecha=LUNES, doctor=None):
+        dia = DisponibilidadDia.objects.filter(doctor=doctor or self.doctor, fecha=fecha).first()
+        return dia.bits if dia else 0
+
+    def slot(self, hora, minutos=30):
+        return mascara_slots(hora, minutos)
+
+    def test_reservar_ocupa_los_slots(self):
+        self.reservar('10:00', duracion_minutos=45)
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0), 45))
+
+    def test_no_se_puede_reservar_un_horario_que_se_cruza(self):
+        self.reservar('10:00', duracion_minutos=45)
+        with self.assertRaises(HorarioOcupado):
+            self.reservar('10:30')
+        self.assertEqual(Cita.objects.count(), 1)
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0), 45))
+
+    def test_editar_mueve_los_slots(self):
+        cita = self.reservar('10:00')
+        cita.hora, cita.fecha = '11:00', self.LUNES + timedelta(days=1)
+        cita.save()
+        self.assertEqual(self.ocupados(), 0)
+        self.assertEqual(self.ocupados(self.LUNES + timedelta(days=1)), self.slot(time(11, 0)))
+        self.assertEqual(cita.hora_inicio, time(11, 0))
+
+    def test_editar_hacia_un_horario_ocupado_no_cambia_nada(self):
+        self.reservar('10:00')
+        cita = self.reservar('12:00')
+        cita.hora = '10:15'
+        with self.assertRaises(HorarioOcupado):
+            cita.save()
+        cita.refresh_from_db()
+        self.assertEqual(cita.hora, '12:00')
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0)) | self.slot(time(12, 0)))
+
+    def test_cancelar_libera_el_horario(self):
+        cita = self.reservar('10:00')
+        cita.estado_cita = EstadoCita.CANCELADA
+        cita.save()
+        self.assertEqual(self.ocupados(), 0)
+        # Y otra cita puede tomar el horario; la cancelada no lo vuelve a bloquear
+        self.reservar('10:00')
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0)))
+
+    def test_update_por_queryset_rehace_el_bitmap(self):
+        self.reservar('10:00')
+        Cita.objects.filter(doctor=self.doctor).update(estado_cita=EstadoCita.CANCELADA)
+        self.assertEqual(self.ocupados(), 0)
+        Cita.objects.filter(doctor=self.doctor).update(estado_cita=EstadoCita.CONFIRMADA)
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0)))
+
+    def test_update_por_queryset_recalcula_inicio_y_fin(self):
+        cita = self.reservar('10:00', duracion_minutos=45)
+        antes = cita.actualizada_en
+        Cita.objects.filter(pk=cita.pk).update(hora='11:30')
+        cita.refresh_from_db()
+        self.assertEqual(cita.hora_inicio, time(11, 30))
+        self.assertEqual(timezone.localtime(cita.inicio).time(), time(11, 30))
+        self.assertEqual(cita.fin - cita.inicio, timedelta(minutes=45))
+        self.assertGreater(cita.actualizada_en, antes)
+        self.assertEqual(self.ocupados(), self.slot(time(11, 30), 45))
+
+    def test_borrar_libera_el_horario(self):
+        cita = self.reservar('10:00')
+        self.reservar('11:00')
+        cita.delete()
+        self.assertEqual(self.ocupados(), self.slot(time(11, 0)))
+        Cita.objects.filter(doctor=self.doctor).delete()
+        self.assertEqual(self.ocupados(), 0)
+
+    def test_borrado_en_cascada_libera_el_horario(self):
+        otro = crear_paciente('luis')
+        self.reservar('10:00')
+        Cita.objects.create(doctor=self.doctor, paciente=otro, nombre='Luis', doctor_nombre='House',
+                            fecha=self.LUNES, hora='11:00', motivo_visita='x')
+        self.paciente.user.delete()
+        self.assertEqual(self.ocupados(), self.slot(time(11, 0)))
+        self.doctor.user.delete()
+        self.assertFalse(DisponibilidadDia.objects.exists())
+
+    def test_reconstruir_ignora_las_canceladas(self):
+        self.reservar('10:00')
+        self.reservar('11:00', estado_cita=EstadoCita.CANCELADA)
+        DisponibilidadDia.objects.all().delete()
+        self.assertEqual(reconstruir_disponibilidad(Cita, DisponibilidadDia), 1)
+        self.assertEqual(self.ocupados(), self.slot(time(10, 0)))
+
+    def test_compare_and_swap_reintenta_si_otro_escribio(self):
+        self.reservar('10:00')
+        dia = DisponibilidadDia.objects.get(doctor=self.doctor, fecha=self.LUNES)
+        llamadas = []
+
+        def cambiar(bits):
+            llamadas.append(bits)
+            if len(llamadas) == 1:
+                # Otro proceso escribe entre la lectura y el update
+                DisponibilidadDia.objects.filter(pk=dia.pk).update(version=dia.version + 1)
+            return bits | self.slot(time(15, 0))
+
+        DisponibilidadDia._actualizar(self.doctor.id, self.LUNES, cambiar)
+        dia.refresh_from_db()
+        self.assertEqual(len(llamadas), 2)
+        self.assertEqual(dia.version, 3)
+        self.assertEqual(dia.bits, self.slot(time(10, 0)) | self.slot(time(15, 0)))
+
+    def test_compare_and_swap_se_rinde_tras_los_reintentos(self):
+        self.reservar('10:00')
+
+        def siempre_pisado(bits):
+            DisponibilidadDia.objects.filter(doctor=self.doctor).update(version=F('version') + 1)
+            return bits
+
+        with self.assertRaises(HorarioOcupado):
+            DisponibilidadDia._actualizar(self.doctor.id, self.LUNES, siempre_pisado, reintentos=3)
+
+    def test_api_disponibilidad_excluye_los_ocupados(self):
+        self.reservar('10:00', duracion_minutos=60)
+        self.client.force_login(self.paciente.user)
+        url = reverse('api_disponibilidad', args=[self.doctor.id])
+        eventos = self.client.get(url, {'start': '2030-01-07', 'end': '2030-01-08'}).json()
+        inicios = [e['start'] for e in eventos]
+        # Horario por defecto: de 8:00 a 17:00 en turnos de 30 minutos, menos 10:00 y 10:30
+        self.assertEqual(len(inicios), 16)
+        self.assertNotIn('2030-01-07T10:00', inicios)
+        self.assertNotIn('2030-01-07T10:30', inicios)
+        self.assertIn('2030-01-07T11:00', inicios)
+
+
+class IntervalosCitaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house')
+        datos = dict(doctor=cls.doctor, nombre='Ana', doctor_nombre='House', motivo_visita='x')
+        cls.manana = Cita.objects.create(fecha=date(2030, 1, 1), hora='09:00', duracion_minutos=45, **datos)
+        cls.tarde = Cita.objects.create(fecha=date(2030, 1, 1), hora='15:30', **datos)
+        cls.sin_hora = Cita.objects.create(fecha=date(2030, 1, 2), hora='por la tarde', **datos)
+
+    def local(self, fecha, hora):
+        return timezone.make_aware(datetime.combine(fecha, hora))
+
+    def test_inicio_y_fin_con_zona_horaria(self):
+        self.assertEqual(self.manana.inicio, self.local(date(2030, 1, 1), time(9, 0)))
+        self.assertEqual(self.manana.fin - self.manana.inicio, timedelta(minutes=45))
+        # Hora ilegible: ocupa el día completo
+        self.assertEqual(self.sin_hora.inicio, self.local(date(2030, 1, 2), time.min))
+        self.assertEqual(self.sin_hora.fin, self.local(date(2030, 1, 3), time.min))
+
+    def test_solapadas(self):
+        citas = Cita.objects.filter(doctor=self.doctor)
+        rango = citas.solapadas(self.local(date(2030, 1, 1), time(9, 30)), self.local(date(2030, 1, 1), time(15, 30)))
+        self.assertEqual(list(rango), [self.manana])
+        self.assertEqual(list(citas.solapadas(desde=self.local(date(2030, 1, 2), time(23, 0)))), [self.sin_hora])
+
+    def test_agenda_del_dia_y_proximas(self):
+        citas = Cita.objects.filter(doctor=self.doctor)
+        self.assertEqual(list(citas.del_dia(date(2030, 1, 1))), [self.manana, self.tarde])
+        self.assertEqual(list(citas.proximas(2, desde=self.local(date(2030, 1, 1), time(10, 0)))), [self.tarde, self.sin_hora])
+
+    @skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN es de SQLite')
+    def test_rangos_usan_el_indice_de_inicio(self):
+        citas = Cita.objects.filter(doctor=self.doctor)
+        for consulta in (citas.del_dia(date(2030, 1, 1)), citas.proximas(5)):
+            plan = consulta.explain()
+            self.assertRegex(plan, r'SEARCH helcon_cita USING INDEX cita_doctor_(inicio|estado)_idx \(doctor_id=\? AND inicio[<>]')
+            self.assertNotIn('USE TEMP B-TREE', plan)
+
+    def test_api_citas_devuelve_inicio_y_fin(self):
+        self.client.force_login(self.doctor.user)
+        eventos = self.client.get(reverse('api_citas'), {'start': '2030-01-01', 'end': '2030-01-02'}).json()
+        self.assertEqual(
+            [(e['start'], e['end'], e['allDay']) for e in eventos],
+            [
+                ('2030-01-01T09:00:00-05:00', '2030-01-01T09:45:00-05:00', False),
+                ('2030-01-01T15:30:00-05:00', '2030-01-01T16:00:00-05:00', False),
+            ],
+        )
+
+    async def test_api_citas_async_revalida_con_etag(self):
+        # Mismo camino que con ASGI: middleware y vista async, ORM async
+        await self.async_client.aforce_login(self.doctor.user)
+        url = reverse('api_citas')
+        respuesta = await self.async_client.get(url, {'start': '2030-01-01', 'end': '2030-01-03'})
+        self.assertEqual((respuesta.status_code, respuesta['X-Citas-Total']), (200, '3'))
+
+        etag = respuesta['ETag']
+        respuesta = await self.async_client.get(url, {'start': '2030-01-01', 'end': '2030-01-03'}, headers={'If-None-Match': etag})
+        self.assertEqual((respuesta.status_code, respuesta['ETag']), (304, etag))
+
+
+class ApiCitasTests(TestCase):
+    VENTANA = {'start': '2030-01-01', 'end': '2030-01-08'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house')
+        cls.paciente = crear_paciente('ana')
+        datos = dict(doctor=cls.doctor, paciente=cls.paciente, nombre='Ana', doctor_nombre='House', motivo_visita='x')
+        cls.vieja = Cita.objects.create(fecha=date(2030, 1, 1), hora='09:00', **datos)
+        cls.nueva = Cita.objects.create(fecha=date(2030, 1, 2), hora='10:00', **datos)
+        cls.fuera = Cita.objects.create(fecha=date(2030, 2, 1), hora='10:00', **datos)
+        cls.corte = timezone.now()
+        Cita.objects.filter(pk=cls.vieja.pk).update(actualizada_en=cls.corte - timedelta(hours=1))
+        Cita.objects.filter(pk__in=[cls.nueva.pk, cls.fuera.pk]).update(actualizada_en=cls.corte + timedelta(hours=1))
+
+    def setUp(self):
+        self.client.force_login(self.doctor.user)
+
+    def pedir(self, **extra):
+        return self.client.get(reverse('api_citas'), {**self.VENTANA, **extra.pop('params', {})}, **extra)
+
+    def test_304_con_el_mismo_etag_y_200_si_algo_cambia(self):
+        respuesta = self.pedir()
+        etag = respuesta['ETag']
+        self.assertEqual(respuesta['Cache-Control'], 'private, no-cache')
+        self.assertEqual(self.pedir(headers={'If-None-Match': etag}).status_code, 304)
+
+        self.nueva.motivo_visita = 'Control'
+        self.nueva.save()
+        respuesta = self.pedir(headers={'If-None-Match': etag})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertNotEqual(respuesta['ETag'], etag)
+
+    def test_el_etag_depende_del_usuario(self):
+        etag = self.pedir()['ETag']
+        self.client.force_login(self.paciente.user)
+        self.assertEqual(self.pedir(headers={'If-None-Match': etag}).status_code, 200)
+
+    def test_delta_solo_trae_lo_modificado_de_la_ventana(self):
+        completa = self.pedir()
+        self.assertEqual([e['id'] for e in completa.json()], [self.vieja.pk, self.nueva.pk])
+        self.assertEqual(completa['X-Citas-Total'], '2')
+        self.assertEqual(parse_datetime(completa['X-Citas-Ultima']), self.corte + timedelta(hours=1))
+
+        delta = self.pedir(params={'updated_since': self.corte.isoformat()})
+        self.assertEqual([e['id'] for e in delta.json()], [self.nueva.pk])
+        # El total sigue siendo el de la ventana para que el cliente detecte borrados
+        self.assertEqual(delta['X-Citas-Total'], '2')
+        self.assertEqual(self.pedir(params={'updated_since': completa['X-Citas-Ultima']}).json(), [])
+
+    def test_update_por_queryset_cambia_el_etag_y_entra_en_el_delta(self):
+        # Sin fechas en el futuro: como en producción, la última edición es anterior a ahora
+        Cita.objects.filter(pk=self.nueva.pk).update(actualizada_en=self.corte - timedelta(hours=1))
+        etag = self.pedir()['ETag']
+        Cita.objects.filter(pk=self.vieja.pk).update(estado_cita=EstadoCita.CONFIRMADA)
+        respuesta = self.pedir(headers={'If-None-Match': etag})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertNotEqual(respuesta['ETag'], etag)
+        delta = self.pedir(params={'updated_since': self.corte.isoformat()})
+        self.assertEqual([e['id'] for e in delta.json()], [self.vieja.pk])
+
+
+SECRETO_WEBHOOK = 'whsec_pruebas'
+
+
+def evento_checkout(pago, tipo='checkout.session.completed', pagado=True):
+    # Mismo formato que envía Stripe (y `stripe trigger`): solo se usan los campos que lee pagos.py
+    return {
+        'id': 'evt_prueba',
+        'object': 'event',
+        'type': tipo,
+        'data': {'object': {
+            'id': 'cs_test_prueba',
+            'object': 'checkout.session',
+            'client_reference_id': str(pago.clave),
+            'metadata': {'pago': str(pago.clave), 'tipo': pago.tipo},
+            'payment_status': 'paid' if pagado else 'unpaid',
+        }},
+    }
+
+
+def firmar(payload, secreto=SECRETO_WEBHOOK):
+    # Cabecera Stripe-Signature: t=<timestamp>,v1=HMAC-SHA256(secreto, "<t>.<payload>")
+    t = int(reloj.time())
+    firma = hmac.new(secreto.encode(), f'{t}.{payload}'.encode(), hashlib.sha256).hexdigest()
+    return f't={t},v1={firma}'
+
+
+@override_settings(STRIPE_WEBHOOK_SECRET=SECRETO_WEBHOOK)
+class WebhookStripeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house')
+        cls.paciente = crear_paciente('ana')
+        cls.datos = {
+            'nombre': 'Ana', 'fecha': '2030-01-07', 'hora': '10:00', 'duracion': 30,
+            'motivo_visita': 'Control', 'precio': '12.50', 'doctor_id': cls.doctor.id,
+        }
+
+    def nuevo_pago(self, tipo=Pago.CITA_NUEVA, **campos):
+        campos.setdefault('usuario', self.paciente.user)
+        return Pago.objects.create(tipo=tipo, doctor=self.doctor, monto_centavos=1250, **campos)
+
+    def enviar(self, evento, secreto=SECRETO_WEBHOOK):
+        payload = json.dumps(evento)
+        return self.client.post(
+            reverse('stripe_webhook'), payload, content_type='application/json',
+            HTTP_STRIPE_SIGNATURE=firmar(payload, secreto),
+        )
+
+    def test_crea_la_cita_una_sola_vez(self):
+        pago = self.nuevo_pago(datos=self.datos)
+        for _ in range(3):  # Stripe reintenta: las entregas repetidas no duplican nada
+            self.assertEqual(self.enviar(evento_checkout(pago)).status_code, 200)
+
+        pago.refresh_from_db()
+        self.assertEqual(pago.estado, Pago.PAGADO)
+        cita = Cita.objects.get()
+        self.assertEqual((pago.cita, cita.paciente, cita.precio), (cita, self.paciente, Decimal('12.50')))
+        self.paciente.refresh_from_db()
+        self.assertFalse(self.paciente.cupon)
+
+    def test_firma_invalida(self):
+        pago = self.nuevo_pago(datos=self.datos)
+        self.assertEqual(self.enviar(evento_checkout(pago), secreto='whsec_otro').status_code, 400)
+        self.assertFalse(Cita.objects.exists())
+        self.assertEqual(Pago.objects.get().estado, Pago.PENDIENTE)
+
+    def test_pago_asincrono_sin_cobrar(self):
+        pago = self.nuevo_pago(datos=self.datos)
+        self.enviar(evento_checkout(pago, pagado=False))
+        self.assertFalse(Cita.objects.exists())
+        self.enviar(evento_checkout(pago, tipo='checkout.session.async_payment_succeeded'))
+        self.assertTrue(Cita.objects.exists())
+
+    def test_horario_ocupado_queda_en_conflicto(self):
+        Cita.objects.create(
+            doctor=self.doctor, nombre='Otro', doctor_nombre='House',
+            fecha=date(2030, 1, 7), hora='10:00', motivo_visita='x',
+        )
+        pago = self.nuevo_pago(datos=self.datos)
+        self.assertEqual(self.enviar(evento_checkout(pago)).status_code, 200)
+        self.assertEqual(Pago.objects.get().estado, Pago.CONFLICTO)
+        self.assertEqual(Cita.objects.count(), 1)
+
+    def test_suscripcion(self):
+        pago = self.nuevo_pago(Pago.SUSCRIPCION, usuario=self.doctor.user)
+        self.enviar(evento_checkout(pago))
+        self.enviar(evento_checkout(pago))
+        self.doctor.refresh_from_db()
+        self.assertTrue(self.doctor.recomendado)
+        self.assertEqual(TrabajoComprobante.objects.count(), 1)
+        # El comprobante lleva el monto cobrado
+        self.assertIn('Precio mensual / Monthly Fee: $12.50', TrabajoComprobante.objects.get().lineas)
+
+    def test_pagina_de_exito_solo_consulta_el_estado(self):
+        pago = self.nuevo_pago(datos=self.datos)
+        self.client.force_login(self.paciente.user)
+        self.client.get(reverse('confirmar_pago'), {'pago': pago.clave})
+        self.client.get(reverse('confirmar_pago'), {'pago': pago.clave})
+        self.assertFalse(Cita.objects.exists())
+        self.assertEqual(self.client.get(reverse('estado_pago', args=[pago.clave])).json()['estado'], Pago.PENDIENTE)
+
+        self.enviar(evento_checkout(pago))
+        estado = self.client.get(reverse('estado_pago', args=[pago.clave])).json()
+        self.assertEqual((estado['estado'], estado['listo']), (Pago.PAGADO, True))
+
+    def preparar_borrador(self):
+        Doctor.objects.filter(pk=self.doctor.pk).update(preciobase=Decimal('1000.00'))
+        self.client.force_login(self.paciente.user)
+        respuesta = HttpResponse()
+        BorradorCita(self.paciente.user_id, dict(self.datos)).guardar(respuesta)
+        self.client.cookies[COOKIE_RESERVA] = respuesta.cookies[COOKIE_RESERVA].value
+
+    @override_settings(PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa')
+    def test_checkout_usa_la_clave_como_idempotency_key(self):
+        pasarela = obtener_pasarela()
+        pasarela.reiniciar()
+        self.preparar_borrador()
+        respuesta = self.client.post(reverse('pago_tarjeta'))
+
+        self.assertRedirects(respuesta, 'https://pagos.invalid/cs_falso_1', fetch_redirect_response=False)
+        pago = Pago.objects.get()
+        tipo, params, idempotency_key = pasarela.llamadas[0]
+        self.assertEqual(idempotency_key, str(pago.clave))
+        self.assertEqual(params['client_reference_id'], str(pago.clave))
+        self.assertEqual((pago.stripe_session, pago.datos['hora']), ('cs_falso_1', '10:00'))
+        # El monto se recotiza en el servidor (2% de 1000), no se toma del borrador
+        self.assertEqual((pago.monto_centavos, pago.datos['precio']), (2000, '20.00'))
+
+    @override_settings(PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa')
+    def test_stripe_no_disponible(self):
+        pasarela = obtener_pasarela()
+        pasarela.reiniciar()
+        pasarela.error = PasarelaNoDisponible('El servicio de pagos no está disponible.')
+        self.preparar_borrador()
+        respuesta = self.client.post(reverse('pago_tarjeta'))
+
+        self.assertRedirects(respuesta, reverse('home'), fetch_redirect_response=False)
+        self.assertEqual(Pago.objects.get().estado, Pago.PENDIENTE)
+
+    @override_settings(PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa')
+    def test_pagar_cita_solo_las_del_paciente(self):
+        obtener_pasarela().reiniciar()
+        otro = crear_paciente('beto')
+        propia, ajena = [
+            Cita.objects.create(
+                doctor=self.doctor, paciente=paciente, nombre=paciente.user.first_name, doctor_nombre='House',
+                fecha=date(2030, 1, 7), hora=hora, motivo_visita='x',
+            )
+            for paciente, hora in ((self.paciente, '10:00'), (otro, '11:00'))
+        ]
+        self.client.force_login(self.paciente.user)
+
+        for cita_id in (ajena.id, ajena.id + propia.id):  # de otro paciente e inexistente
+            with self.subTest(cita_id=cita_id):
+                self.assertEqual(self.client.get(reverse('pagar_cita', args=[cita_id])).status_code, 404)
+        self.assertFalse(Pago.objects.exists())
+
+        respuesta = self.client.get(reverse('pagar_cita', args=[propia.id]))
+        self.assertRedirects(respuesta, 'https://pagos.invalid/cs_falso_1', fetch_redirect_response=False)
+        self.assertEqual(Pago.objects.get().cita, propia)
+
+    @override_settings(PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa')
+    def test_payment_intent_sin_cobrar_no_es_exito(self):
+        pasarela = obtener_pasarela()
+        pasarela.reiniciar()
+        self.client.force_login(self.paciente.user)
+
+        def pedir():
+            return self.client.post(reverse('procesar_pago'), {'payment_method_id': 'pm_1'}, content_type='application/json')
+
+        self.assertEqual(pedir().json()['status'], 'success')
+
+        pendiente = SimpleNamespace(id='pi_1', status='requires_action')
+        with mock.patch.object(pasarela, 'crear_payment_intent', return_value=pendiente):
+            respuesta = pedir()
+        self.assertEqual((respuesta.status_code, respuesta.json()['status']), (402, 'failed'))
+
+
+@override_settings(STRIPE_FALLOS_PARA_ABRIR=2, STRIPE_SEGUNDOS_ABIERTO=30)
+class PasarelaStripeTests(TestCase):
+    def setUp(self):
+        self.ahora = 1000.0
+        self.pasarela = PasarelaStripe()
+        self.pasarela.interruptor.reloj = lambda: self.ahora
+
+    def caida(self):
+        raise stripe.APIConnectionError('timeout')
+
+    def test_timeouts_y_reintentos_del_cliente(self):
+        requestor = self.pasarela.cliente._requestor
+        self.assertEqual(requestor._client._timeout, (2, 8))
+        self.assertEqual(requestor._options.max_network_retries, 1)
+        # Una sola sesión HTTP con pool, reutilizada entre peticiones
+        self.assertEqual(requestor._client._session.get_adapter('https://api.stripe.com')._pool_maxsize, 10)
+
+    def test_el_circuito_se_abre_y_falla_rapido(self):
+        for _ in range(2):
+            with self.assertRaises(PasarelaNoDisponible):
+                self.pasarela._llamar(self.caida)
+        self.assertEqual(self.pasarela.interruptor.estado, 'abierto')
+
+        operacion = mock.Mock()
+        with self.assertRaises(PasarelaNoDisponible):
+            self.pasarela._llamar(operacion)
+        operacion.assert_not_called()
+
+    def test_semiabierto_deja_pasar_una_prueba(self):
+        for _ in range(2):
+            with self.assertRaises(PasarelaNoDisponible):
+                self.pasarela._llamar(self.caida)
+        self.ahora += 31
+        self.assertEqual(self.pasarela.interruptor.estado, 'semiabierto')
+        self.assertTrue(self.pasarela.interruptor.permitir())
+        self.assertFalse(self.pasarela.interruptor.permitir())
+
+        self.pasarela.interruptor.exito()
+        self.assertEqual(self.pasarela._llamar(lambda: 'ok'), 'ok')
+        self.assertEqual(self.pasarela.interruptor.estado, 'cerrado')
+
+    def abrir_y_esperar(self):
+        for _ in range(2):
+            with self.assertRaises(PasarelaNoDisponible):
+                self.pasarela._llamar(self.caida)
+        self.ahora += 31
+
+    def test_una_prueba_con_error_ajeno_a_stripe_no_bloquea_el_circuito(self):
+        self.abrir_y_esperar()
+        with self.assertRaises(TypeError):
+            self.pasarela._llamar(mock.Mock(side_effect=TypeError('parámetro inesperado')))
+        # Sigue semiabierto pero la siguiente llamada puede probar (y lo cierra)
+        self.assertEqual(self.pasarela.interruptor.estado, 'semiabierto')
+        self.assertEqual(self.pasarela._llamar(lambda: 'ok'), 'ok')
+        self.assertEqual(self.pasarela.interruptor.estado, 'cerrado')
+
+    async def test_una_prueba_cancelada_no_bloquea_el_circuito(self):
+        await sync_to_async(self.abrir_y_esperar)()
+
+        async def cancelada():
+            raise asyncio.CancelledError
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self.pasarela._allamar(cancelada)
+
+        async def ok():
+            return 'ok'
+
+        self.assertEqual(await self.pasarela._allamar(ok), 'ok')
+        self.assertEqual(self.pasarela.interruptor.estado, 'cerrado')
+
+    def test_tarjeta_rechazada_no_abre_el_circuito(self):
+        def rechazo():
+            raise stripe.CardError('Tarjeta rechazada', None, 'card_declined')
+        for _ in range(3):
+            with self.assertRaises(PagoRechazado):
+                self.pasarela._llamar(rechazo)
+        self.assertEqual(self.pasarela.interruptor.estado, 'cerrado')
+
+    @override_settings(SERVIDOR='asgi')
+    def test_un_cliente_async_por_event_loop(self):
+        async def clientes():
+            return self.pasarela.cliente_async, self.pasarela.cliente_async
+
+        a1, a2 = asyncio.run(clientes())
+        b1, _ = asyncio.run(clientes())
+        self.assertIs(a1, a2)
+        self.assertIsNot(a1, b1)
+        # Los loops terminados no dejan su cliente en el diccionario
+        gc.collect()
+        self.assertEqual(len(self.pasarela._clientes_async), 0)
+
+    @override_settings(SERVIDOR='wsgi')
+    def test_con_wsgi_las_vistas_async_usan_el_cliente_sync(self):
+        with mock.patch.object(self.pasarela, 'crear_checkout', return_value='cs') as crear:
+            self.assertEqual(asyncio.run(self.pasarela.acrear_checkout({'mode': 'payment'}, 'clave')), 'cs')
+        crear.assert_called_once_with({'mode': 'payment'}, 'clave')
+        self.assertEqual(len(self.pasarela._clientes_async), 0)
+
+
+class PreciosTests(SimpleTestCase):
+    def test_valores_conocidos(self):
+        self.assertEqual(cotizar(Decimal('100')), Cotizacion(Decimal('100.00'), Decimal('2.00'), Decimal('0.00'), Decimal('2.00')))
+        self.assertEqual(cotizar(Decimal('100'), recomendado=True).total, Decimal('5.00'))
+        cotizacion = cotizar(Decimal('100'), cupon=True)
+        self.assertEqual((cotizacion.descuento, cotizacion.total, cotizacion.saldo), (Decimal('0.30'), Decimal('1.70'), Decimal('98.30')))
+        self.assertEqual(cotizar(None).total, Decimal('0.00'))
+
+    def test_propiedades(self):
+        # Propiedades sobre precios aleatorios (semilla fija para que sea reproducible)
+        azar = random.Random(2025)
+        for _ in range(2000):
+            precio = Decimal(azar.randint(0, 99999999)) / 100
+            recomendado, cupon = azar.random() < 0.5, azar.random() < 0.5
+            c = cotizar(precio, recomendado, cupon)
+            for valor in (c.precio_base, c.tarifa, c.descuento, c.total):
+                self.assertEqual(valor.as_tuple().exponent, -2)
+            self.assertEqual(c.total + c.descuento, c.tarifa)
+            self.assertTrue(CERO <= c.total <= c.tarifa <= c.precio_base)
+            self.assertEqual(c.descuento == CERO, not cupon or c.tarifa < Decimal('0.04'))
+            self.assertGreaterEqual(cotizar(precio, True, cupon).tarifa, cotizar(precio, False, cupon).tarifa)
+            self.assertEqual(c.saldo, c.precio_base - c.total)
+
+    def test_misma_cotizacion_para_el_mismo_precio(self):
+        # '80', '80.0' y 80 son el mismo precio: una sola entrada en la caché
+        self.assertIs(cotizar('80', True, True), cotizar(Decimal('80.00'), 1, 'si'))
+        self.assertIs(cotizar(80), cotizar(Decimal('80.0')))
+
+
+class CuponTests(TestCase):
+    def test_el_cupon_se_aplica_una_sola_vez(self):
+        doctor = crear_doctor('house', preciobase=Decimal('100.00'))
+        paciente = crear_paciente('ana')
+        cita = Cita.objects.create(
+            doctor=doctor, paciente=paciente, nombre='Ana', doctor_nombre='House',
+            fecha=date(2030, 1, 1), hora='09:00', motivo_visita='x', precio=Decimal('2.00'),
+        )
+        url = reverse('aplicar_cupon', args=[cita.id])
+        self.client.post(url, {'cupon': '1'})
+        self.client.post(url, {'cupon': '1'})
+
+        cita.refresh_from_db()
+        paciente.refresh_from_db()
+        self.assertEqual((cita.precio, paciente.cupon), (Decimal('1.70'), False))
+
+
+class BorradorCitaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house', preciobase=Decimal('100.00'))
+        cls.paciente = crear_paciente('ana')
+
+    def setUp(self):
+        self.client.force_login(self.paciente.user)
+
+    def agendar(self, **extra):
+        datos = {'nombre': 'Ana', 'horacita': '10:00', 'fecha_cita': '2030-01-07', 'motivo_visita': 'Control', **extra}
+        return self.client.post(reverse('agenda', args=[self.doctor.id]), datos)
+
+    def borrador(self):
+        return caches['reserva'].get(self.client.cookies[COOKIE_RESERVA].value)
+
+    def test_solo_se_agenda_un_horario_libre_del_doctor(self):
+        HorarioDoctor.objects.create(doctor=self.doctor, dia_semana=0, hora_inicio=time(9, 0), hora_fin=time(12, 0))
+        Cita.objects.create(doctor=self.doctor, paciente=self.paciente, nombre='Ana', doctor_nombre='House',
+                            fecha=date(2030, 1, 7), hora='11:00', motivo_visita='Control')
+        for extra in ({'horacita': '13:00'}, {'fecha_cita': '2030-01-08'}, {'horacita': '11:00'}, {'fecha_cita': '2020-01-06'}):
+            with self.subTest(**extra):
+                respuesta = self.agendar(**extra)
+                self.assertEqual(respuesta.status_code, 200)
+                self.assertIn('no está disponible', respuesta.context['error'])
+                self.assertNotIn(COOKIE_RESERVA, self.client.cookies)
+        self.assertEqual(self.agendar(horacita='09:30').status_code, 302)
+
+    def test_el_asistente_no_escribe_la_sesion(self):
+        # La primera visita guarda el rol en la sesión (una vez por login)
+        self.client.get(reverse('agenda', args=[self.doctor.id]))
+        with CaptureQueriesContext(connection) as consultas:
+            self.assertRedirects(self.agendar(), reverse('vistadecita', args=[self.doctor.id]), fetch_redirect_response=False)
+            self.client.get(reverse('vistadecita', args=[self.doctor.id]))
+            respuesta = self.client.post(reverse('vistadecita', args=[self.doctor.id]), {'aplicar_cupon': '1', 'cupon': '1'})
+        escrituras = [q['sql'] for q in consultas.captured_queries
+                      if 'django_session' in q['sql'] and not q['sql'].startswith('SELECT')]
+        self.assertEqual(escrituras, [])
+        self.assertEqual((respuesta.context['porcentaje2'], respuesta.context['descuento']), (Decimal('1.70'), Decimal('0.30')))
+        self.assertTrue(self.borrador()['c'])
+
+    def test_la_cookie_solo_lleva_una_clave(self):
+        self.agendar(motivo_visita='Dolor de pecho')
+        cookie = self.client.cookies[COOKIE_RESERVA]
+        self.assertEqual(cookie['path'], '/reserva/')
+        self.assertTrue(cookie['httponly'])
+        self.assertNotIn('Dolor', cookie.value)
+        self.assertEqual(self.borrador()['d']['motivo_visita'], 'Dolor de pecho')
+        for nombre in ('vistadecita', 'pago_tarjeta', 'confirmar_pago'):
+            ruta = reverse(nombre, args=[self.doctor.id]) if nombre == 'vistadecita' else reverse(nombre)
+            self.assertTrue(ruta.startswith(cookie['path']), ruta)
+
+        # Al confirmar el pago se borra el borrador del servidor
+        clave = cookie.value
+        with override_settings(PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa'):
+            pasarela = obtener_pasarela()
+            pasarela.reiniciar()
+            self.client.post(reverse('pago_tarjeta'))
+        self.client.get(reverse('confirmar_pago'), {'pago': pasarela.llamadas[-1][1]['client_reference_id']})
+        self.assertIsNone(caches['reserva'].get(clave))
+        self.assertEqual(self.client.cookies[COOKIE_RESERVA].value, '')
+
+    def test_borrador_de_otra_version_o_usuario(self):
+        self.agendar()
+        valor = self.client.cookies[COOKIE_RESERVA].value
+        self.assertEqual(self.borrador()['d']['hora'], '10:00')
+
+        otro = crear_paciente('beto')
+        self.client.force_login(otro.user)
+        self.client.cookies[COOKIE_RESERVA] = valor
+        self.assertRedirects(self.client.get(reverse('vistadecita', args=[self.doctor.id])), reverse('home'),
+                             fetch_redirect_response=False)
+
+        with mock.patch('helcon.reserva.VERSION', 2):
+            self.client.force_login(self.paciente.user)
+            self.client.cookies[COOKIE_RESERVA] = valor
+            self.assertRedirects(self.client.get(reverse('vistadecita', args=[self.doctor.id])), reverse('home'),
+                                 fetch_redirect_response=False)
+
+    def test_clave_inventada(self):
+        self.client.cookies[COOKIE_RESERVA] = 'no-existe'
+        self.assertRedirects(self.client.get(reverse('vistadecita', args=[self.doctor.id])), reverse('home'),
+                             fetch_redirect_response=False)
+
+
+class SesionesTests(TestCase):
+    def test_logout_cierra_la_sesion_para_todos_los_workers(self):
+        paciente = crear_paciente('ana')
+        self.client.force_login(paciente.user)
+        clave = self.client.session.session_key
+        motor = import_module(settings.SESSION_ENGINE)
+        self.assertEqual(motor.SessionStore(clave).load()[SESSION_KEY], str(paciente.user_id))
+
+        self.client.get(reverse('logout'))
+        # Un store nuevo (como el de otro worker) ya no encuentra la sesión
+        self.assertEqual(motor.SessionStore(clave).load(), {})
+        otro = Client()
+        otro.cookies[settings.SESSION_COOKIE_NAME] = clave
+        self.assertEqual(otro.get(reverse('detalle_cita_paciente')).status_code, 302)
+
+    def test_sin_cache_por_proceso(self):
+        # cached_db con locmem deja sesiones cerradas vivas en los otros workers
+        if 'cache' in settings.SESSION_ENGINE:
+            self.assertNotIsInstance(caches[settings.SESSION_CACHE_ALIAS], LocMemCache)
+
+
+@override_settings(METRICAS_REQUEST=True, METRICAS_PRESUPUESTO_ESTRICTO=True, ALLOWED_HOSTS=['testserver'])
+class PresupuestoConsultasTests(TestCase):
+    """
+    Con MetricasMiddleware en modo estricto, una vista que pasa su presupuesto
+    de consultas (METRICAS_PRESUPUESTOS) hace fallar el test. Hay varias citas
+    para que un N+1 en la vista o en la plantilla se note.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = crear_doctor('house', especialidad='Cardiología', recomendado=True)
+        crear_doctor('wilson', especialidad='Pediatría')
+        cls.paciente = crear_paciente('ana')
+        for dia in range(1, 11):
+            Cita.objects.create(
+                doctor=cls.doctor, paciente=cls.paciente, nombre='Ana', doctor_nombre='House',
+                fecha=date(2030, 1, dia), hora='10:00', motivo_visita='Control',
+            )
+
+    def _pedir(self, usuario, nombre, **parametros):
+        self.client.force_login(usuario)
+        respuesta = self.client.get(reverse(nombre), parametros)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertRegex(respuesta['Server-Timing'], r'sql;dur=[\d.]+;desc="\d+ consultas", plantilla;dur=[\d.]+, total;dur=[\d.]+')
+        return respuesta
+
+    def test_vistas_del_paciente_dentro_del_presupuesto(self):
+        self._pedir(self.paciente.user, 'home_paciente')
+        self._pedir(self.paciente.user, 'home_paciente', especialidad='Cardiología')
+        self._pedir(self.paciente.user, 'detalle_cita_paciente')
+
+    def test_vistas_del_doctor_dentro_del_presupuesto(self):
+        self._pedir(self.doctor.user, 'home_doctor')
+        self._pedir(self.doctor.user, 'api_citas', start='2030-01-01', end='2030-02-01')
+
+    # Sin WhiteNoise (solo síncrono) la cadena queda async, como en ASGI
+    @override_settings(MIDDLEWARE=[
+        'helcon.middleware.MetricasMiddleware',
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'helcon.middleware.PerfilMiddleware',
+    ])
+    async def test_vista_async_con_asgi_cuenta_sus_consultas(self):
+        parametros = {'start': '2030-01-01', 'end': '2030-02-01'}
+        await self.async_client.aforce_login(self.doctor.user)
+        await self.async_client.get(reverse('api_citas'), parametros)  # guarda el rol en la sesión
+
+        respuesta = await self.async_client.get(reverse('api_citas'), parametros)
+        self.assertEqual(len(respuesta.json()), 10)
+        # sesión, usuario, perfil y las dos de la vista (aggregate y values)
+        self.assertIn('"5 consultas"', respuesta['Server-Timing'])
+
+    async def test_cuenta_las_consultas_de_otros_hilos(self):
+        # Una conexión que se abre en otro hilo durante el request también se mide
+        def consultar():
+            # SELECT 1: las tablas están bloqueadas por la transacción del test
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                connection.close()
+
+        async def vista(request):
+            await sync_to_async(consultar, thread_sensitive=False)()
+            return HttpResponse()
+
+        middleware = MetricasMiddleware(vista)
+        self.assertTrue(iscoroutinefunction(middleware))
+        respuesta = await middleware(RequestFactory().get('/'))
+        self.assertIn('"1 consultas"', respuesta['Server-Timing'])
+
+    def test_presupuesto_excedido_falla(self):
+        self.client.force_login(self.paciente.user)
+        with override_settings(METRICAS_PRESUPUESTOS={'detalle_cita_paciente': 0}):
+            with self.assertRaises(PresupuestoExcedido):
+                self.client.get(reverse('detalle_cita_paciente'))
+
+    @override_settings(METRICAS_PRESUPUESTO_ESTRICTO=False, METRICAS_PRESUPUESTOS={'detalle_cita_paciente': 0})
+    def test_presupuesto_excedido_sin_modo_estricto_solo_avisa(self):
+        self.client.force_login(self.paciente.user)
+        with self.assertLogs('helcon.metricas', 'WARNING') as logs:
+            respuesta = self.client.get(reverse('detalle_cita_paciente'))
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertIn('presupuesto: 0', logs.output[0])
+
+
+def imagen(ancho, alto, formato='JPEG'):
+    buffer = io.BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = 'Cámara del doctor'  # Make: no debe llegar a las miniaturas
+    Image.new('RGB', (ancho, alto), 'navy').save(buffer, formato, exif=exif)
+    return buffer.getvalue()
+
+
+class MiniaturasTests(TestCase):
+    def setUp(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        ajustes = override_settings(MEDIA_ROOT=carpeta.name)
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+        self.doctor = crear_doctor('house')
+
+    def subir(self, contenido, nombre='foto.jpg'):
+        self.doctor.foto_perfil = SimpleUploadedFile(nombre, contenido, content_type='image/jpeg')
+        self.doctor.save()
+        self.doctor.refresh_from_db()
+
+    def abrir(self, ruta):
+        with self.doctor.foto_perfil.storage.open(ruta) as archivo:
+            miniatura = Image.open(archivo)
+            miniatura.load()
+        return miniatura
+
+    def test_miniaturas_webp_cuadradas_sin_exif(self):
+        self.subir(imagen(400, 200))
+        self.assertEqual(set(self.doctor.fotos_miniaturas), {'180', '360'})
+        for tamano, ruta in self.doctor.fotos_miniaturas.items():
+            miniatura = self.abrir(ruta)
+            self.assertEqual((miniatura.format, miniatura.size), ('WEBP', (int(tamano), int(tamano))))
+            self.assertFalse(miniatura.info.get('exif'))
+
+    def test_respeta_la_orientacion_de_la_camara(self):
+        # Mitad izquierda roja y derecha azul; orientación 6 = girar 90° a la derecha al mostrarla
+        foto = Image.new('RGB', (200, 100), 'blue')
+        foto.paste('red', (0, 0, 100, 100))
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        buffer = io.BytesIO()
+        foto.save(buffer, 'JPEG', exif=exif)
+        self.subir(buffer.getvalue())
+        miniatura = self.abrir(self.doctor.fotos_miniaturas['180']).convert('RGB')
+        # Ya girada: rojo arriba, azul abajo
+        arriba, abajo = miniatura.getpixel((90, 10)), miniatura.getpixel((90, 170))
+        self.assertGreater(arriba[0], arriba[2])
+        self.assertGreater(abajo[2], abajo[0])
+
+    def test_imagen_ilegible_usa_el_original(self):
+        self.subir(b'no es una imagen', 'foto.jpg')
+        self.assertEqual(self.doctor.fotos_miniaturas, {})
+        self.assertIn('src="/media/', foto_doctor(self.doctor, 50))
+
+    def test_guardar_sin_cambiar_la_foto_no_regenera(self):
+        self.subir(imagen(200, 200))
+        with mock.patch('helcon.models.generar_miniaturas') as generar:
+            self.doctor.descripcion = 'Nefrología'
+            self.doctor.save()
+        generar.assert_not_called()
+
+    def test_foto_doctor_elige_la_miniatura_que_cubre_el_ancho(self):
+        self.subir(imagen(400, 400))
+        atributos = foto_doctor(self.doctor, 50)
+        self.assertRegex(atributos, r'src="[^"]+_180\.webp"')
+        self.assertRegex(atributos, r'srcset="[^"]+_180\.webp 180w, [^"]+_360\.webp 360w"')
+        self.assertIn('sizes="50px" width="50" height="50"', atributos)
+        self.assertRegex(foto_doctor(self.doctor, 300), r'src="[^"]+_360\.webp"')
+
+
+class VariantesEstaticasTests(SimpleTestCase):
+    def setUp(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        self.origen = f'{carpeta.name}/origen'
+        self.destino = f'{carpeta.name}/destino'
+        os.makedirs(f'{self.origen}/images')
+        with open(f'{self.origen}/images/portada.png', 'wb') as archivo:
+            archivo.write(imagen(1000, 500, 'PNG'))
+        with open(f'{self.origen}/images/notas.txt', 'w') as archivo:
+            archivo.write('no es imagen')
+
+    def test_variantes_por_ancho_sin_agrandar(self):
+        self.assertEqual(generar_variantes(self.origen, self.destino), (1, 1))
+        datos = leer_manifiesto(self.destino)['images/portada.png']
+        self.assertEqual((datos['ancho'], datos['alto']), (1000, 500))
+        anchos = {}
+        for ancho, ruta in datos['variantes'].items():
+            with Image.open(f'{self.destino}/{ruta}') as variante:
+                anchos[ancho] = variante.size
+        # Solo los anchos que existen: el último es el original, no un "1600" de 1000px
+        self.assertEqual(anchos, {'480': (480, 240), '960': (960, 480), '1000': (1000, 500)})
+
+    def test_imagen_grande_y_angosta(self):
+        with open(f'{self.origen}/images/fondo.png', 'wb') as archivo:
+            archivo.write(imagen(2000, 100, 'PNG'))
+        with open(f'{self.origen}/images/icono.png', 'wb') as archivo:
+            archivo.write(imagen(300, 300, 'PNG'))
+        generar_variantes(self.origen, self.destino)
+        manifiesto = leer_manifiesto(self.destino)
+        self.assertEqual(set(manifiesto['images/fondo.png']['variantes']), {'480', '960', '1600'})
+        self.assertEqual(set(manifiesto['images/icono.png']['variantes']), {'300'})
+
+    def test_solo_regenera_lo_que_cambio(self):
+        generar_variantes(self.origen, self.destino)
+        self.assertEqual(generar_variantes(self.origen, self.destino), (1, 0))
+        self.assertEqual(generar_variantes(self.origen, self.destino, forzar=True), (1, 1))
+        # Original más nuevo que sus variantes
+        os.utime(f'{self.origen}/images/portada.png', (reloj.time() + 10, reloj.time() + 10))
+        self.assertEqual(generar_variantes(self.origen, self.destino), (1, 1))
+
+    def test_responsive_image_con_y_sin_manifiesto(self):
+        generar_variantes(self.origen, self.destino)
+        with mock.patch('helcon.templatetags.imagenes.leer_manifiesto', lambda: leer_manifiesto(self.destino)):
+            atributos = responsive_image('images/portada.png', '50vw', 'eager')
+            self.assertIn('portada_480.webp 480w', atributos)
+            self.assertIn('portada_1000.webp 1000w"', atributos)
+            self.assertNotIn('1600', atributos)
+            self.assertIn('data-anchos="480 960 1000"', atributos)
+            self.assertIn('sizes="50vw" width="1000" height="500" loading="eager"', atributos)
+            # Imagen sin variantes: el original
+            self.assertEqual(responsive_image('images/otra.png'), 'src="/static/images/otra.png" loading="lazy"')
+
+    @skipUnless(shutil.which('node'), 'hace falta node')
+    def test_cambiar_imagen_con_y_sin_variantes(self):
+        # imagenes.js en node con un <img> mínimo: sin data-anchos usa el original
+        script = '''
+            const fs = require('fs');
+            eval(fs.readFileSync(process.argv[1], 'utf8'));
+            function img(anchos) {
+                return {dataset: anchos ? {anchos} : {}, srcset: 'viejo 480w', src: 'viejo',
+                        removeAttribute(nombre) { delete this[nombre]; }};
+            }
+            const sin = img(), con = img('480 960');
+            cambiarImagen(sin, 'cupon1_eng.webp');
+            cambiarImagen(con, 'cupon1_eng.webp');
+            console.log(JSON.stringify([sin.src, sin.srcset, con.src, con.srcset]));
+        '''
+        salida = subprocess.run(
+            ['node', '-e', script, str(settings.BASE_DIR / 'helcon/static/js/imagenes.js')],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        self.assertEqual(json.loads(salida), [
+            '/static/images/cupon1_eng.webp', None,
+            '/static/images/variantes/cupon1_eng_960.webp',
+            '/static/images/variantes/cupon1_eng_480.webp 480w, /static/images/variantes/cupon1_eng_960.webp 960w',
+        ])
+
+
+def cache_paginas(release):
+    return override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'paginas': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pruebas-paginas', 'KEY_PREFIX': release},
+        'reserva': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pruebas-reserva'},
+    })
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class PaginaCacheadaTests(TestCase):
+    def setUp(self):
+        ajustes = cache_paginas('r1')
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+        caches['paginas'].clear()
+
+    def test_anonimos_reciben_la_copia_cacheada(self):
+        primera = self.client.get(reverse('journal1'))
+        segunda = self.client.get(reverse('journal1'))
+        self.assertEqual((primera['X-Cache'], segunda['X-Cache']), ('MISS', 'HIT'))
+        self.assertEqual(primera.content, segunda.content)
+        self.assertIn('Cookie', segunda['Vary'])
+
+    def test_con_sesion_siempre_se_renderiza(self):
+        self.client.force_login(crear_paciente('ana').user)
+        self.client.get(reverse('journal1'))
+        self.assertFalse(self.client.get(reverse('journal1')).has_header('X-Cache'))
+
+    def test_un_idioma_no_pisa_al_otro(self):
+        self.client.get(reverse('journal1'), headers={'Accept-Language': 'es'})
+        respuesta = self.client.get(reverse('journal1'), headers={'Accept-Language': 'en'})
+        self.assertEqual(respuesta['X-Cache'], 'MISS')
+
+    def test_no_se_cachean_respuestas_con_cookies_ni_token_csrf(self):
+        def con_cookie(request):
+            respuesta = HttpResponse('hola')
+            respuesta.set_cookie('visto', '1')
+            return respuesta
+
+        def con_csrf(request):
+            # La cookie CSRF la pone el middleware después de la vista
+            return HttpResponse(f'<input name="csrfmiddlewaretoken" value="{get_token(request)}">')
+
+        for vista in (con_cookie, con_csrf):
+            cacheada = pagina_cacheada(vista)
+            with self.subTest(vista=vista.__name__):
+                for _ in range(2):
+                    self.assertEqual(cacheada(RequestFactory().get(f'/{vista.__name__}/'))['X-Cache'], 'MISS')
+
+    def test_un_release_nuevo_no_sirve_las_paginas_del_anterior(self):
+        self.client.get(reverse('journal1'))
+        self.assertEqual(self.client.get(reverse('journal1'))['X-Cache'], 'HIT')
+        with cache_paginas('r2'):
+            self.assertEqual(self.client.get(reverse('journal1'))['X-Cache'], 'MISS')
+
+
+class StaticComprimidoTests(SimpleTestCase):
+    def setUp(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        self.storage = StaticComprimido(location=carpeta.name, base_url='/static/')
+        self.storage.save('css/a.css', ContentFile(b'body { color: navy; }' * 20))
+        # Como collectstatic: hash en el nombre, manifiesto y copias comprimidas
+        list(self.storage.post_process({'css/a.css': (self.storage, 'css/a.css')}))
+
+    def test_nombre_con_hash_y_copias_comprimidas(self):
+        url = self.storage.url('css/a.css')
+        self.assertRegex(url, r'^/static/css/a\.[0-9a-f]{12}\.css$')
+        nombre = url.removeprefix('/static/')
+        self.assertTrue(self.storage.exists(f'{nombre}.gz'))
+        self.assertTrue(self.storage.exists(f'{nombre}.br'))
+        # Se conserva el original sin hash (rutas armadas desde JS)
+        self.assertTrue(self.storage.exists('css/a.css'))
+
+    def test_archivo_fuera_del_manifiesto_se_sirve_sin_hash(self):
+        self.assertEqual(self.storage.url('images/no_existe.webp'), '/static/images/no_existe.webp')
+
+    def test_archivo_nuevo_sin_collectstatic_se_calcula_su_hash(self):
+        # manifest_strict = False: si el archivo existe se calcula el hash en vez de fallar
+        self.storage.save('css/b.css', ContentFile(b'p {}'))
+        self.assertRegex(self.storage.url('css/b.css'), r'^/static/css/b\.[0-9a-f]{12}\.css$')
+
+
+class BundlesTests(SimpleTestCase):
+    def setUp(self):
+        tag_bundles._bundle_construido.cache_clear()
+        self.addCleanup(tag_bundles._bundle_construido.cache_clear)
+
+    def renderizar(self, nombre):
+        return Template(f"{{% load bundles %}}{{% bundle '{nombre}' %}}").render(Context())
+
+    def test_bundle_construido_es_una_sola_etiqueta(self):
+        with mock.patch.object(tag_bundles.finders, 'find', return_value='/ruta/bundle'):
+            self.assertEqual(self.renderizar('welcome.js'), f'<script src="{static("bundles/welcome.js")}"></script>')
+            self.assertEqual(self.renderizar('login.css'), f'<link rel="stylesheet" href="{static("bundles/login.css")}">')
+
+    def test_sin_construir_o_en_debug_van_los_originales(self):
+        originales = '\n'.join(f'<script src="{static(ruta)}"></script>' for ruta in BUNDLES['welcome.js'])
+        with mock.patch.object(tag_bundles.finders, 'find', return_value=None):
+            self.assertEqual(self.renderizar('welcome.js'), originales)
+        tag_bundles._bundle_construido.cache_clear()
+        with mock.patch.object(tag_bundles.finders, 'find', return_value='/ruta/bundle'), override_settings(DEBUG=True):
+            self.assertEqual(self.renderizar('welcome.js'), '\n'.join(
+                f'<script src="{static(ruta)}"></script>' for ruta in BUNDLES['welcome.js']
+            ))
+
+    def test_bundle_desconocido(self):
+        with self.assertRaises(TemplateSyntaxError):
+            self.renderizar('no_existe.js')
+
+    def test_construir_bundles_junta_y_minifica(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        for sub in ('css', 'js'):
+            shutil.copytree(f'{STATIC_APP}/{sub}', f'{carpeta.name}/{sub}')
+        tamanos = construir_bundles(carpeta.name)
+        self.assertEqual(set(tamanos), set(BUNDLES))
+        for nombre, archivos in BUNDLES.items():
+            with self.subTest(bundle=nombre):
+                originales = sum(os.path.getsize(f'{carpeta.name}/{a}') for a in archivos)
+                self.assertLessEqual(tamanos[nombre], originales + len(archivos))
+        with open(f'{carpeta.name}/bundles/comun.js', encoding='utf-8') as archivo:
+            # Un ';' por archivo para que no se peguen al concatenarlos
+            self.assertEqual(archivo.read().count(';\n'), 1)
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def test_journals_comparten_modulo_y_comun_una_vez(self):
+        ajustes = cache_paginas('bundles')
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+        caches['paginas'].clear()
+        with mock.patch.object(tag_bundles.finders, 'find', return_value='/ruta/bundle'):
+            for nombre in ('journal3', 'journal4', 'journal5', 'journal6'):
+                with self.subTest(pagina=nombre):
+                    html = self.client.get(reverse(nombre)).content.decode()
+                    self.assertEqual(html.count(static('bundles/comun.js')), 1)
+                    self.assertIn(static('bundles/journal.js'), html)
+                    inicio = html.index('id="animaciones-journal">') + len('id="animaciones-journal">')
+                    config = json.loads(html[inicio:html.index('</script>', inicio)])
+                    self.assertTrue(config and all('selector' in elemento for elemento in config))
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class IdiomaTests(TestCase):
+    def setUp(self):
+        self.paciente = crear_paciente('ana')
+        self.client.force_login(self.paciente.user)
+
+    def test_accept_language_en_traduce_en_el_servidor(self):
+        respuesta = self.client.get(reverse('home_paciente'), headers={'Accept-Language': 'en-US,en;q=0.9'})
+        self.assertEqual(respuesta['Content-Language'], 'en')
+        self.assertContains(respuesta, '<html lang="en">')
+        self.assertContains(respuesta, '>Logout</a>')
+        self.assertNotContains(respuesta, 'Cerrar sesión')
+
+    def test_la_cookie_manda_sobre_accept_language(self):
+        self.client.cookies[settings.LANGUAGE_COOKIE_NAME] = 'es'
+        respuesta = self.client.get(reverse('home_paciente'), headers={'Accept-Language': 'en'})
+        self.assertContains(respuesta, '>Cerrar sesión</a>')
+
+    def test_blog_y_paginas_legales_se_traducen_en_el_servidor(self):
+        self.client.cookies[settings.LANGUAGE_COOKIE_NAME] = 'en'
+        for nombre in ['journal1', 'journal2', 'journal3', 'journal4', 'journal5', 'journal6',
+                       'terms', 'privacy_policies', 'difamation']:
+            with self.subTest(nombre):
+                respuesta = self.client.get(reverse(nombre))
+                self.assertContains(respuesta, '<html lang="en">')
+                self.assertContains(respuesta, '<h3>Recent posts</h3>')
+                self.assertNotContains(respuesta, 'Cerrar sesión')
+                self.assertNotContains(respuesta, 'Publicaciones recientes')
+        respuesta = self.client.get(reverse('journal1'))
+        self.assertContains(respuesta, 'Do You Know How Vital Good Rest Is?')
+        self.assertContains(respuesta, 'REST_ingles')
+        self.client.cookies[settings.LANGUAGE_COOKIE_NAME] = 'es'
+        respuesta = self.client.get(reverse('journal1'))
+        self.assertContains(respuesta, '¿Sabes lo Vital que es un Buen Descanso?')
+        self.assertContains(respuesta, 'sleep_principal_esp')
+        self.assertNotContains(respuesta, 'REST_ingles')
+
+    def test_bienvenida_en_ingles(self):
+        self.client.logout()
+        self.client.cookies[settings.LANGUAGE_COOKIE_NAME] = 'en'
+        respuesta = self.client.get(reverse('home'))
+        self.assertContains(respuesta, '<html lang="en">')
+        self.assertContains(respuesta, 'placeholder="Your name"')
+        self.assertContains(respuesta, '>Testimonial <span')
+        self.assertNotContains(respuesta, 'Servicios destacados')
+
+    def test_detalle_cita_en_ingles(self):
+        cita = Cita.objects.create(
+            doctor=crear_doctor('house'), paciente=self.paciente, nombre='Ana', doctor_nombre='House',
+            fecha=date(2030, 1, 7), hora='10:00', motivo_visita='Control',
+        )
+        self.client.cookies[settings.LANGUAGE_COOKIE_NAME] = 'en'
+        respuesta = self.client.get(reverse('detalle_cita', args=[cita.id]))
+        self.assertContains(respuesta, '<strong>Patient:</strong> Ana')
+        self.assertContains(respuesta, "confirm('Are you sure you want to cancel this appointment?')")
+        self.assertNotContains(respuesta, 'Cancelar Cita')
+
+    @skipUnless(shutil.which('node'), 'hace falta node')
+    def test_idioma_js_recarga_una_sola_vez_sin_cookies(self):
+        # localStorage dice 'en', la página llegó en 'es' y la cookie no se guarda:
+        # dos cargas en la misma sesión del navegador, una sola recarga
+        script = '''
+            const fs = require('fs');
+            const codigo = fs.readFileSync(process.argv[1], 'utf8');
+            const almacen = () => { const d = {}; return {getItem: k => d[k] ?? null, setItem: (k, v) => { d[k] = v; }}; };
+            global.localStorage = almacen();
+            global.sessionStorage = almacen();
+            localStorage.setItem('selectedLanguage', 'en');
+            let recargas = 0;
+            global.window = {location: {reload() { recargas++; }}};
+            for (let carga = 0; carga < 2; carga++) {
+                let alCargar;
+                global.document = {
+                    documentElement: {lang: 'es', dataset: {}}, cookie: '',
+                    getElementById: () => null,
+                    addEventListener: (evento, funcion) => { alCargar = funcion; },
+                };
+                eval(codigo);
+                alCargar();
+            }
+            console.log(recargas);
+        '''
+        salida = subprocess.run(
+            ['node', '-e', script, str(settings.BASE_DIR / 'helcon/static/js/idioma.js')],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        self.assertEqual(salida.strip(), '1')
+
+    def test_catalogo_en_cubre_las_plantillas_y_nada_mas(self):
+        catalogo = polib.pofile(f'{settings.LOCALE_PATHS[0]}/en/LC_MESSAGES/django.po')
+        # Las especialidades tienen el msgid en inglés (se traducen en el catálogo es)
+        en_ingles = {e.msgid for e in polib.pofile(f'{settings.LOCALE_PATHS[0]}/es/LC_MESSAGES/django.po')}
+        usados = textos_usados(settings.BASE_DIR) - en_ingles - {'...'}
+        self.assertEqual(usados - {e.msgid for e in catalogo if e.msgstr}, set())
+        # Los textos de las páginas que aún se traducen en el navegador no van al catálogo
+        self.assertEqual({e.msgid for e in catalogo} - usados, set())
+
+
+class ComprobantesTests(SimpleTestCase):
+    def setUp(self):
+        _renderizar_cacheado.cache_clear()
+
+    def test_mismos_datos_salen_de_la_cache(self):
+        primero = renderizar_comprobante('Recibo', ['Paciente: Ana', 'Monto: $20.00'])
+        segundo = renderizar_comprobante('Recibo', ('Paciente: Ana', 'Monto: $20.00'))
+        self.assertEqual(_renderizar_cacheado.cache_info().hits, 1)
+        self.assertEqual(primero.getvalue(), segundo.getvalue())
+        # Cada llamada devuelve su propio BytesIO
+        primero.read()
+        self.assertEqual(segundo.tell(), 0)
+
+    def test_otros_datos_dan_otro_pdf(self):
+        a = renderizar_comprobante('Recibo', ['Monto: $20.00']).getvalue()
+        b = renderizar_comprobante('Recibo', ['Monto: $25.00']).getvalue()
+        self.assertNotEqual(a, b)
+        self.assertEqual(_renderizar_cacheado.cache_info().misses, 2)
+
+    def test_lote_con_un_solo_membrete(self):
+        pdf = renderizar([('Recibo', [f'Comprobante {i}']) for i in range(3)])
+        self.assertTrue(pdf.startswith(b'%PDF'))
+        self.assertEqual(len(re.findall(rb'/Type /Page\b', pdf)), 3)
+        self.assertEqual(pdf.count(b'/Subtype /Form'), 1)
+
+    def test_suscripcion_usa_precio_periodo_y_metodo(self):
+        doctor = SimpleNamespace(user=SimpleNamespace(first_name='Gregory'))
+        titulo, lineas = datos_suscripcion(doctor, date(2030, 1, 7), Decimal('50'), '3 meses', 'Stripe Checkout')
+        self.assertEqual(lineas[1:], [
+            'Fecha inicio / Start Date: 07/01/2030',
+            'Precio mensual / Monthly Fee: $50.00',
+            'Periodo / Period: 3 meses',
+            'Método de pago / Payment method: Stripe Checkout',
+        ])
+
+
+class ServidorCorreoCaido(BaseEmailBackend):
+    def send_messages(self, mensajes):
+        raise ConnectionRefusedError('SMTP no responde')
+
+
+class Detener(Exception):
+    pass
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class ColaCorreoTests(TestCase):
+    def setUp(self):
+        self.correo = encolar_correo('Comprobante', 'Adjunto su comprobante.', ['ana@example.com'], adjunto=b'%PDF', adjunto_nombre='c.pdf')
+
+    def vencer(self):
+        # Adelantar el reloj: el reintento ya toca
+        CorreoPendiente.objects.update(proximo_intento=timezone.now())
+
+    def test_envia_y_borra_el_adjunto(self):
+        self.assertEqual(enviar_pendientes(), (1, 0))
+        self.correo.refresh_from_db()
+        self.assertEqual((self.correo.estado, self.correo.adjunto), (CorreoPendiente.ENVIADO, None))
+        self.assertEqual(mail.outbox[0].attachments[0][:2], ('c.pdf', b'%PDF'))
+
+    def test_reintenta_con_espera_exponencial_y_se_rinde(self):
+        esperas = []
+        for intento in range(1, MAX_INTENTOS + 1):
+            antes = timezone.now()
+            self.assertEqual(enviar_pendientes(connection=ServidorCorreoCaido()), (0, 1))
+            self.correo.refresh_from_db()
+            self.assertEqual(self.correo.intentos, intento)
+            self.assertIn('SMTP no responde', self.correo.ultimo_error)
+            if intento < MAX_INTENTOS:
+                self.assertEqual(self.correo.estado, CorreoPendiente.PENDIENTE)
+                esperas.append(round((self.correo.proximo_intento - antes).total_seconds() / 60))
+                # Antes de la espera no se vuelve a tomar
+                self.assertEqual(enviar_pendientes(connection=ServidorCorreoCaido()), (0, 0))
+                self.vencer()
+        self.assertEqual(esperas, [1, 2, 4, 8])
+        self.assertEqual(self.correo.estado, CorreoPendiente.FALLIDO)
+        self.vencer()
+        self.assertEqual(enviar_pendientes(), (0, 0))
+        self.assertEqual(mail.outbox, [])
+
+    def test_servidor_caido_al_abrir_reprograma_el_lote(self):
+        encolar_correo('Otro', 'x', ['luis@example.com'])
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('sin red')):
+            self.assertEqual(enviar_pendientes(), (0, 2))
+        self.assertEqual(set(CorreoPendiente.objects.values_list('estado', 'intentos')), {(CorreoPendiente.PENDIENTE, 1)})
+
+    def test_un_enviando_abandonado_se_retoma_al_vencer(self):
+        CorreoPendiente.objects.update(estado=CorreoPendiente.ENVIANDO, proximo_intento=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(enviar_pendientes(), (0, 0))
+        self.vencer()
+        self.assertEqual(enviar_pendientes(), (1, 0))
+
+    @mock.patch('helcon.management.commands.enviar_correos.time.sleep')
+    @mock.patch('helcon.management.commands.enviar_correos.close_old_connections')
+    def test_el_worker_sobrevive_a_errores_de_base(self, cerrar, _dormir):
+        lotes = [OperationalError('database is locked'), (1, 0), Detener()]
+        with mock.patch('helcon.management.commands.enviar_correos.enviar_pendientes', side_effect=lotes):
+            with self.assertRaises(Detener):
+                call_command('enviar_correos', '--loop', stdout=io.StringIO(), stderr=io.StringIO())
+        self.assertEqual(cerrar.call_count, 3)
+
+    def test_sin_loop_el_error_de_base_se_propaga(self):
+        with mock.patch('helcon.management.commands.enviar_correos.enviar_pendientes', side_effect=OperationalError('x')):
+            with self.assertRaises(OperationalError):
+                call_command('enviar_correos', stdout=io.StringIO())
+
+
+class TrabajosComprobanteTests(TestCase):
+    def setUp(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        ajustes = override_settings(MEDIA_ROOT=carpeta.name)
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+    def encolar(self, destinatarios=('ana@example.com',)):
+        return encolar_comprobante(None, 'Recibo', ['Paciente: Ana'], 'recibo.pdf', [
+            {'asunto': 'Comprobante', 'cuerpo': 'Adjunto.', 'destinatarios': [d]} for d in destinatarios
+        ])
+
+    def test_lease_evita_que_dos_workers_tomen_el_mismo(self):
+        trabajo = self.encolar()
+        self.assertEqual([t.id for t in _tomar_trabajos(10)], [trabajo.id])
+        self.assertEqual(_tomar_trabajos(10), [])
+        # El worker murió: al vencer el lease otro lo retoma
+        TrabajoComprobante.objects.update(proximo_intento=timezone.now())
+        self.assertEqual([t.id for t in _tomar_trabajos(10)], [trabajo.id])
+
+    def test_genera_el_pdf_una_vez_y_encola_un_correo_por_destinatario(self):
+        primero = self.encolar(['ana@example.com', 'house@example.com'])
+        segundo = self.encolar()
+        self.assertEqual(procesar_trabajos(), (2, 0))
+        primero.refresh_from_db()
+        segundo.refresh_from_db()
+        self.assertEqual(primero.estado, TrabajoComprobante.LISTO)
+        # Mismo contenido, mismo archivo
+        self.assertEqual(primero.pdf_ruta, segundo.pdf_ruta)
+        self.assertEqual(set(CorreoPendiente.objects.values_list('adjunto_ruta', flat=True)), {primero.pdf_ruta})
+        self.assertEqual(CorreoPendiente.objects.count(), 3)
+
+    def test_reintenta_y_se_rinde(self):
+        trabajo = self.encolar()
+        with mock.patch('helcon.trabajos.renderizar', side_effect=ValueError('fuente rota')):
+            for intento in range(1, MAX_INTENTOS_TRABAJO + 1):
+                self.assertEqual(procesar_trabajos(), (0, 1))
+                trabajo.refresh_from_db()
+                self.assertEqual((trabajo.intentos, trabajo.ultimo_error), (intento, 'fuente rota'))
+                TrabajoComprobante.objects.update(proximo_intento=timezone.now())
+        self.assertEqual(trabajo.estado, TrabajoComprobante.ERROR)
+        self.assertEqual(procesar_trabajos(), (0, 0))
+        self.assertFalse(CorreoPendiente.objects.exists())
+
+    def test_pool_de_procesos(self):
+        trabajo = self.encolar()
+        executor = crear_pool(1)
+        self.addCleanup(executor.shutdown)
+        self.assertEqual(procesar_trabajos(executor=executor), (1, 0))
+        trabajo.refresh_from_db()
+        with open(f'{settings.MEDIA_ROOT}/{trabajo.pdf_ruta}', 'rb') as archivo:
+            self.assertEqual(archivo.read(), renderizar([('Recibo', ['Paciente: Ana'])]))
+
+    @mock.patch('helcon.management.commands.procesar_comprobantes.time.sleep')
+    @mock.patch('helcon.management.commands.procesar_comprobantes.close_old_connections')
+    def test_el_worker_sobrevive_a_errores_de_base(self, cerrar, _dormir):
+        lotes = [OperationalError('database is locked'), (1, 0), Detener()]
+        with mock.patch('helcon.management.commands.procesar_comprobantes.procesar_trabajos', side_effect=lotes):
+            with self.assertRaises(Detener):
+                call_command('procesar_comprobantes', '--loop', '--workers', '0', stdout=io.StringIO(), stderr=io.StringIO())
+        self.assertEqual(cerrar.call_count, 3)
+
+
+def cargar_gunicorn_conf(**entorno):
+    with mock.patch.dict(os.environ, entorno):
+        return runpy.run_path(str(settings.BASE_DIR / 'gunicorn.conf.py'))
+
+
+class GunicornConfTests(SimpleTestCase):
+    databases = {'default'}  # los hooks abren sus propias conexiones (a una base temporal)
+
+    def test_wal_solo_al_arrancar_el_servidor(self):
+        self.assertNotIn('journal_mode', settings.DATABASES['default']['OPTIONS'].get('init_command', ''))
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        ruta = f'{carpeta.name}/db.sqlite3'
+        sqlite3.connect(ruta).close()
+        conexiones = ConnectionHandler({'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ruta}})
+        with mock.patch('django.db.connections', conexiones):
+            cargar_gunicorn_conf()['on_starting'](mock.Mock())
+        with sqlite3.connect(ruta) as prueba:
+            self.assertEqual(prueba.execute('PRAGMA journal_mode').fetchone(), ('wal',))
+
+    def test_asgi_o_wsgi(self):
+        conf = cargar_gunicorn_conf(SERVIDOR='asgi', WEB_CONCURRENCY='3')
+        self.assertEqual((conf['wsgi_app'], conf['worker_class'], conf['workers']),
+                         ('mi_proyecto.asgi:application', 'uvicorn_worker.UvicornWorker', 3))
+        self.assertNotIn('threads', conf)
+        conf = cargar_gunicorn_conf(SERVIDOR='wsgi', GUNICORN_THREADS='6')
+        self.assertEqual((conf['wsgi_app'], conf['worker_class'], conf['threads']),
+                         ('mi_proyecto.wsgi:application', 'gthread', 6))
+
+    def test_post_fork_cierra_las_conexiones_heredadas(self):
+        conexiones = mock.Mock()
+        with mock.patch('django.db.connections', conexiones):
+            cargar_gunicorn_conf()['post_fork'](mock.Mock(), mock.Mock())
+        conexiones.close_all.assert_called_once_with()
+
+    def test_when_ready_precarga_solo_con_preload(self):
+        servidor = mock.Mock()
+        cargar_gunicorn_conf(GUNICORN_PRELOAD='0')['when_ready'](servidor)
+        servidor.log.info.assert_not_called()
+        cargar_gunicorn_conf(GUNICORN_PRELOAD='1', SERVIDOR='asgi')['when_ready'](servidor)
+        servidor.log.info.assert_called_once_with('Django precargado en el master (%s)', 'asgi')
+
+    def test_requests_lentos_al_log(self):
+        conf = cargar_gunicorn_conf(GUNICORN_LENTO_MS='200')
+        worker, resp = SimpleNamespace(pid=42), SimpleNamespace(status='200 OK')
+        req = SimpleNamespace(method='GET', path='/home_paciente/')
+        conf['pre_request'](worker, req)
+        with self.assertNoLogs('gunicorn.error', 'WARNING'):
+            conf['post_request'](worker, req, {}, resp)
+
+        req.inicio_ns -= 500 * 1_000_000
+        with self.assertLogs('gunicorn.error', 'WARNING') as logs:
+            conf['post_request'](worker, req, {}, resp)
+        self.assertRegex(logs.output[0], r'Request lento: GET /home_paciente/ 200 OK \d+ms \(worker 42\)')
+
+        # Sin pre_request (worker uvicorn) no hay nada que medir
+        with self.assertNoLogs('gunicorn.error', 'WARNING'):
+            conf['post_request'](worker, SimpleNamespace(method='GET', path='/'), {}, resp)
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], PAGOS_PASARELA='helcon.pasarela.PasarelaFalsa')
+class RendimientoTests(TestCase):
+    """Los flujos de `medir_rendimiento` siguen funcionando sobre una base sembrada pequeña."""
+
+    def test_todos_los_flujos_sobre_datos_sembrados(self):
+        datos = sembrar(30)
+        self.assertEqual((Doctor.objects.count(), Cita.objects.count()), (30, 30))
+        with tempfile.TemporaryDirectory() as carpeta, override_settings(MEDIA_ROOT=carpeta):
+            for nombre, flujo in FLUJOS.items():
+                with self.subTest(flujo=nombre):
+                    resultado = medir(flujo, datos, iteraciones=2, calentamiento=1)
+                    self.assertEqual(resultado['iteraciones'], 2)
+                    self.assertLessEqual(resultado['p50_ms'], resultado['p99_ms'])
+        self.assertEqual(Pago.objects.filter(usuario=datos.paciente.user).count(), 3)
@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from .comprobantes import renderizar
+from .correo import encolar_correo
+from .models import TrabajoComprobante
+
+logger = logging.getLogger(__name__)
+
+MAX_INTENTOS = 3
+LEASE_MINUTOS = 10
+CARPETA_PDF = 'comprobantes'
+
+
+def encolar_comprobante(usuario, titulo, lineas, nombre_archivo, correos):
+    """
+    Registra un comprobante por generar y enviar. La vista responde de
+    inmediato; el PDF lo hace el worker `manage.py procesar_comprobantes`.
+    """
+    return TrabajoComprobante.objects.create(
+        usuario=usuario,
+        titulo=titulo,
+        lineas=list(lineas),
+        nombre_archivo=nombre_archivo,
+        correos=correos,
+    )
+
+
+def guardar_pdf(contenido):
+    # Direccionado por contenido: el mismo PDF se guarda una sola vez en MEDIA_ROOT/comprobantes/
+    digest = hashlib.sha256(contenido).hexdigest()
+    ruta = f'{CARPETA_PDF}/{digest[:2]}/{digest}.pdf'
+    if not default_storage.exists(ruta):
+        default_storage.save(ruta, ContentFile(contenido))
+    return ruta
+
+
+def _tomar_trabajos(limite):
+    ahora = timezone.now()
+    candidatos = TrabajoComprobante.objects.filter(
+        estado__in=[TrabajoComprobante.PENDIENTE, TrabajoComprobante.PROCESANDO],
+        proximo_intento__lte=ahora,
+    ).order_by('proximo_intento').values_list('id', 'estado', 'proximo_intento')[:limite]
+    tomados = [
+        trabajo_id for trabajo_id, estado, proximo in candidatos
+        if TrabajoComprobante.objects.filter(id=trabajo_id, estado=estado, proximo_intento=proximo).update(
+            estado=TrabajoComprobante.PROCESANDO,
+            proximo_intento=ahora + timedelta(minutes=LEASE_MINUTOS),
+        )
+    ]
+    return list(TrabajoComprobante.objects.filter(id__in=tomados))
+
+
+@transaction.atomic
+def _terminar(trabajo, contenido):
+    trabajo.pdf_ruta = guardar_pdf(contenido)
+    for correo in trabajo.correos:
+        encolar_correo(
+            asunto=correo['asunto'],
+            cuerpo=correo['cuerpo'],
+            destinatarios=correo['destinatarios'],
+            remitente=correo.get('remitente'),
+            adjunto_ruta=trabajo.pdf_ruta,
+            adjunto_nombre=trabajo.nombre_archivo,
+        )
+    trabajo.estado = TrabajoComprobante.LISTO
+    trabajo.terminado_en = timezone.now()
+    trabajo.save(update_fields=['pdf_ruta', 'estado', 'terminado_en'])
+
+
+def procesar_trabajos(limite=20, executor=None):
+    """
+    Genera en paralelo los PDF de un lote de trabajos, los guarda una vez
+    y encola un correo por destinatario que apunta al mismo archivo.
+    Devuelve (listos, con_error).
+    """
+    trabajos = _tomar_trabajos(limite)
+    if not trabajos:
+        return 0, 0
+
+    # En el pool corre comprobantes.renderizar: solo reportlab, sin Django ni base de datos
+    futuros = [
+        (trabajo, executor.submit(renderizar, [(trabajo.titulo, trabajo.lineas)]) if executor else None)
+        for trabajo in trabajos
+    ]
+    listos = errores = 0
+    for trabajo, futuro in futuros:
+        try:
+            contenido = futuro.result() if futuro else renderizar([(trabajo.titulo, trabajo.lineas)])
+            _terminar(trabajo, contenido)
+            listos += 1
+        except Exception as e:
+            logger.warning('Error generando comprobante %s: %s', trabajo.id, e)
+            trabajo.intentos += 1
+            trabajo.ultimo_error = str(e)
+            trabajo.estado = TrabajoComprobante.ERROR if trabajo.intentos >= MAX_INTENTOS else TrabajoComprobante.PENDIENTE
+            trabajo.proximo_intento = timezone.now() + timedelta(minutes=2 ** (trabajo.intentos - 1))
+            trabajo.save(update_fields=['intentos', 'ultimo_error', 'estado', 'proximo_intento'])
+            errores += 1
+    return listos, errores
+
+
+def crear_pool(workers):
+    """
+    Pool de procesos para que reportlab no compita por el GIL con el resto
+    del worker. Con 'spawn' los hijos arrancan un intérprete limpio: no
+    heredan la conexión abierta a la base (que con fork compartirían con el
+    padre) ni el resto del estado de Django.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
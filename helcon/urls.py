@@ -39,18 +39,21 @@ urlpatterns = [
     path('privacy_policies/', views.privacy_policies, name='privacy_policies'),
     path('agenda/<int:doctor_id>/',views.agenda, name='agenda'),
     path('api/citas/', views.api_citas, name='api_citas'),
-    path('pago_tarjeta/', views.pago_tarjeta, name='pago_tarjeta'),
+    path('api/disponibilidad/<int:doctor_id>/', views.api_disponibilidad, name='api_disponibilidad'),
+    # Pasos que leen el borrador de la cita: la cookie 'reserva_id' solo se manda bajo reserva/
+    path('reserva/pago_tarjeta/', views.pago_tarjeta, name='pago_tarjeta'),
 
     path('procesar_pago/', views.procesar_pago, name='procesar_pago'),
     path('cita/<int:cita_id>/', views.detalle_cita, name='detalle_cita'),
     
     
     ##PAGO DE CITA
-    path('pagar-cita/int:cita_id/', views.pagar_cita, name='pagar_cita'),
+    path('pagar-cita/<int:cita_id>/', views.pagar_cita, name='pagar_cita'),
     path('pago-exitoso/', views.pago_exitoso, name='pago_exitoso'),
     path('pago-cancelado/', views.pago_cancelado, name='pago_cancelado'),
     path('detalle_cita_paciente/', views.detalle_cita_paciente, name='detalle_cita_paciente'),
     path('enviar-comprobante/<int:cita_id>/', enviar_comprobante_pago, name='enviar_comprobante'),
+    path('comprobante/estado/<int:trabajo_id>/', views.estado_comprobante, name='estado_comprobante'),
     path('recomendacion_doctor/<int:doctor_id>/', views.recomendacion_doctor, name='recomendacion_doctor'),
 
     ##PAGO DE SUGERIDOS
@@ -58,8 +61,10 @@ urlpatterns = [
     path('procesar_pago_doctor/', views.procesar_pago_doctor, name='procesar_pago_doctor'),
     path('pago_tarjeta_doctor/<int:doctor_id>/', views.pago_tarjeta_doctor, name='pago_tarjeta_doctor'),
     path('enviar-comprobante/<int:doctor_id>/', enviar_comprobante_pago_doctor, name='enviar_comprobante_doctor'),
-    path('vistadecita/<int:doctor_id>/', views.vistadecita, name='vistadecita'),
-    path('confirmar_pago/', views.confirmar_pago, name='confirmar_pago'),
+    path('reserva/vistadecita/<int:doctor_id>/', views.vistadecita, name='vistadecita'),
+    path('reserva/confirmar_pago/', views.confirmar_pago, name='confirmar_pago'),
+    path('pago/estado/<uuid:clave>/', views.estado_pago, name='estado_pago'),
+    path('stripe/webhook/', views.stripe_webhook, name='stripe_webhook'),
     path('registrar_cita_doc/', views.registrar_cita_doc, name='registrar_cita_doc'),
 
 
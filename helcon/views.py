@@ -4,10 +4,9 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
 from django.conf import settings
 
-import stripe
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 from .models import Doctor, Paciente
+from .cache import pagina_cacheada
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from .models import Doctor
@@ -27,11 +26,12 @@ from .models import Doctor
 
 
 
+@pagina_cacheada
 def home(request):
     if request.user.is_authenticated:
-        if hasattr(request.user, 'paciente'):
+        if request.perfil.paciente:
             return redirect('home_paciente')
-        elif hasattr(request.user, 'doctor'):
+        elif request.perfil.doctor:
             return redirect('home_doctor')  # O donde desees que inicie el doctor
     return render(request, 'helcon/welcome.html')
 def home_doc(request):
@@ -52,6 +52,7 @@ def dissplay_view(request):
 from django.contrib.auth import authenticate, login
 from django.shortcuts import render, redirect
 from helcon.models import Doctor, Paciente  # ajusta si tus modelos están en otro archivo
+from .middleware import obtener_perfil, limpiar_perfil
 
 def login_view(request):
     if request.method == 'POST':
@@ -60,9 +61,11 @@ def login_view(request):
         user = authenticate(request, username=username, password=password)
         if user is not None:
             login(request, user)
-            if hasattr(user, 'doctor'):
+            limpiar_perfil(request)
+            perfil = obtener_perfil(request)
+            if perfil.doctor:
                 return redirect('home_doctor')
-            elif hasattr(user, 'paciente'):
+            elif perfil.paciente:
                 return redirect('home_paciente')
             else:
                 # Usuario sin perfil doctor ni paciente, lo envías a un home genérico
@@ -163,44 +166,55 @@ def formpac(request):
 
 
 
+@pagina_cacheada
 def segpag(request):
     return render(request, 'helcon/segundapaginaa.html')
 
 
+@pagina_cacheada
 def tercerapag(request):
     return render(request, 'helcon/tercerapagina.html')
 
 
+@pagina_cacheada
 def cuarpag(request):
     return render(request, 'helcon/cuartapagina.html')
 
 
+@pagina_cacheada
 def blog_view(request):
     return render(request, 'helcon/cuartapagina.html')
 
 
+@pagina_cacheada
 def journal1_view(request):
     return render(request, 'helcon/journal1.html')
 
 
+@pagina_cacheada
 def journal2_view(request):
     return render(request, 'helcon/journal2.html')
 
 
+@pagina_cacheada
 def journal3_view(request):
     return render(request, 'helcon/journal3.html')
 
 
+@pagina_cacheada
 def journal4_view(request):
     return render(request, 'helcon/journal4.html')
 
 
+@pagina_cacheada
 def journal5_view(request):
     return render(request, 'helcon/journal5.html')
 
 
+@pagina_cacheada
 def journal6_view(request):
     return render(request, 'helcon/journal6.html')
+@pagina_cacheada
 def contacto_view(request):
     return render(request, 'helcon/contacto.html')
 
@@ -210,11 +224,14 @@ from helcon.models import Cita
 
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect
-from .models import Doctor, Cita
+from django.http import Http404
+from .models import Doctor, Cita, EstadoSwitch
 
 @login_required
 def perfil_doctor(request):
-    doctor = Doctor.objects.get(user=request.user)
+    doctor = request.perfil.doctor
+    if doctor is None:
+        raise Http404("El usuario no tiene perfil de doctor.")
 
     if request.method == 'POST':
         if 'foto_perfil' in request.FILES:
@@ -232,8 +249,8 @@ def perfil_doctor(request):
         preciobase = request.POST.get('preciobase')
 
         # Guardar switch independientemente de los otros campos
-        if estado_switch:
-            doctor.estado_switch = estado_switch
+        if estado_switch in ('0', '1'):
+            doctor.estado_switch = EstadoSwitch(int(estado_switch))
 
         if especialidad:
             doctor.especialidad = especialidad
@@ -294,31 +311,27 @@ def mas_informacion(request, id):
 from django.shortcuts import render
 from .models import Doctor
 from django.db.models import Q
-
-from django.db.models import Q
+from .search import buscar_doctores
 
 def home_paciente(request):
     query = request.GET.get('q')
     especialidad = request.GET.get('especialidad')
-
-    doctores = Doctor.objects.all()
-
-    if query:
-        doctores = doctores.filter(
-            Q(user__first_name__icontains=query) | 
-            Q(user__last_name__icontains=query)
-        )
-
-    if especialidad:
-        doctores = doctores.filter(especialidad__iexact=especialidad)
-
-    # Ordenar por recomendación: los que tienen recomendado = 'si' van primero
-    doctores = doctores.order_by('-recomendado')
+    cursor = request.GET.get('cursor')
+
+    # Búsqueda indexada y paginada; los recomendados siguen apareciendo primero
+    doctores, siguiente_cursor = buscar_doctores(
+        Doctor.objects.select_related('user'),
+        query=query,
+        especialidad=especialidad,
+        cursor=cursor,
+    )
 
     context = {
         'doctores': doctores,
         'query': query or '',
         'especialidad': especialidad or '',
+        'siguiente_cursor': siguiente_cursor,
+        'especialidades': ESPECIALIDADES_TRADUCIDAS.items(),
     }
     return render(request, 'helcon/home_paciente.html', context)
 
@@ -328,7 +341,9 @@ from .models import Paciente
 
 @login_required
 def perfil_paciente(request):
-    paciente = Paciente.objects.get(user=request.user)
+    paciente = request.perfil.paciente
+    if paciente is None:
+        raise Http404("El usuario no tiene perfil de paciente.")
 
     if request.method == 'POST':
         phone = request.POST.get('phone')
@@ -356,10 +371,13 @@ def perfil_paciente(request):
 
 
 # footer
+@pagina_cacheada
 def difamation_view(request):
     return render(request, 'helcon/difamation.html')
+@pagina_cacheada
 def terms_view(request):
     return render(request, 'helcon/terms.html')
+@pagina_cacheada
 def privacy_policies(request):
     return render (request, 'helcon/privacy_policies.html')
 
@@ -387,10 +405,8 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from .models import Cita, Paciente, Doctor, NuevosPacientes
-import stripe
 from django.conf import settings
 
-stripe.api_key = settings.STRIPE_SECRET_KEY  # Asegúrate de definirlo en settings.py
 
 
 
@@ -400,30 +416,89 @@ from .models import Cita, Paciente, Doctor  # ajusta según tus modelos
 
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.http import quote_etag
+from datetime import datetime, time
+import hashlib
 from .models import Cita
 
-@login_required
-def api_citas(request):
-    user = request.user
 
-    if hasattr(user, 'paciente'):
-        citas = Cita.objects.filter(paciente=user.paciente)
-    elif hasattr(user, 'doctor'):
-        citas = Cita.objects.filter(doctor=user.doctor)
+def _citas_visibles(request, perfil):
+    """
+    Citas del doctor o paciente dentro de la ventana que pide FullCalendar
+    (?start=...&end=...). Devuelve None si el usuario no tiene perfil.
+    """
+    if perfil.paciente:
+        citas = Cita.objects.filter(paciente=perfil.paciente)
+    elif perfil.doctor:
+        citas = Cita.objects.filter(doctor=perfil.doctor)
     else:
+        return None
+
+    # Ventana en hora local; solapadas() la resuelve como rango sobre (doctor|paciente, inicio)
+    inicio = parse_date((request.GET.get('start') or '')[:10])
+    fin = parse_date((request.GET.get('end') or '')[:10])
+    return citas.solapadas(
+        desde=timezone.make_aware(datetime.combine(inicio, time.min)) if inicio else None,
+        hasta=timezone.make_aware(datetime.combine(fin, time.min)) if fin else None,
+    )
+
+
+def _etag_citas(request, perfil, resumen):
+    clave = f"{perfil.user_id}|{request.GET.urlencode()}|{resumen['total']}|{resumen['max_id']}|{resumen['ultima']}"
+    return quote_etag(hashlib.md5(clave.encode()).hexdigest())
+
+
+@login_required
+async def api_citas(request):
+    # Async: con ASGI las consultas no ocupan un worker completo mientras esperan
+    perfil = await request.aperfil()
+    citas = _citas_visibles(request, perfil)
+    if citas is None:
         return JsonResponse([], safe=False)
 
+    # ETag a mano (condition() llama a etag_func de forma síncrona). Un solo
+    # aggregate: cambia si se crea, edita o borra alguna cita de la ventana
+    resumen = await citas.aaggregate(total=Count('id'), max_id=Max('id'), ultima=Max('actualizada_en'))
+    etag = _etag_citas(request, perfil, resumen)
+    # El navegador revalida con If-None-Match y recibe 304 si nada cambió
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response['ETag'] = etag
+        return response
+
+    total = resumen['total']
+
+    # Delta: solo las citas creadas o modificadas desde ese momento
+    desde = parse_datetime(request.GET.get('updated_since') or '')
+    if desde:
+        citas = citas.filter(actualizada_en__gt=desde)
+
+    color = "#40559b" if perfil.paciente else "#28a745"
     eventos = []
-    for cita in citas:
+    async for cita in citas.values('id', 'nombre', 'motivo_visita', 'inicio', 'fin', 'hora_inicio'):
         eventos.append({
-            "title": f"{cita.nombre} - {cita.motivo_visita}",
-            "start": f"{cita.fecha}T{cita.hora}",
-            "end": f"{cita.fecha}T{cita.hora}",  # Puedes ajustar duración si quieres
-            "backgroundColor": "#40559b" if hasattr(user, 'paciente') else "#28a745",
+            "id": cita['id'],
+            "title": f"{cita['nombre']} - {cita['motivo_visita']}",
+            "start": timezone.localtime(cita['inicio']).isoformat(),
+            "end": timezone.localtime(cita['fin']).isoformat(),
+            "allDay": cita['hora_inicio'] is None,  # hora que no se pudo interpretar
+            "backgroundColor": color,
             "borderColor": "#000",
         })
 
-    return JsonResponse(eventos, safe=False)
+    response = JsonResponse(eventos, safe=False)
+    response['ETag'] = etag
+    # Total de la ventana: si no cuadra con lo que tiene el cliente tras un delta, hubo borrados
+    response['X-Citas-Total'] = total
+    # Valor para el próximo ?updated_since= (reloj del servidor, no del navegador)
+    if resumen['ultima']:
+        response['X-Citas-Ultima'] = resumen['ultima'].isoformat()
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 
@@ -431,21 +506,18 @@ def api_citas(request):
 
 def segpag_pac(request):
     return render(request, 'helcon/segundapaginaa_pac.html')
-from .models import Doctor, Cita
+from .models import Doctor, Cita, EstadoCita
 from django.contrib.auth.decorators import login_required
 
 @login_required
 def home_doc(request):
-    try:
-        doctor = Doctor.objects.get(user=request.user)
-    except Doctor.DoesNotExist:
-        doctor = None
+    doctor = request.perfil.doctor
 
-    # Filtrar solo las citas no confirmadas (corrige el texto si es necesario)
+    # Filtrar solo las citas no confirmadas
     citas = Cita.objects.filter(
         doctor=doctor,
-        estado_cita='No confirmada'  # 👈 asegúrate de que este sea el valor real
-    ).order_by('fecha', 'hora') if doctor else []
+        estado_cita=EstadoCita.NO_CONFIRMADA,
+    ).order_by('inicio') if doctor else []
 
     context = {
         'doctor': doctor,
@@ -491,8 +563,10 @@ from django.core.mail import send_mail
 from django.conf import settings
 from django.contrib import messages
 from .models import Cita, NuevosPacientes, Doctor
+from .correo import encolar_correo
 
 from decimal import Decimal
+from .precios import cotizar_doctor, descontar_cupon, saldo_pendiente
 
 def detalle_cita(request, cita_id):
     cita = get_object_or_404(Cita, id=cita_id)
@@ -503,12 +577,10 @@ def detalle_cita(request, cita_id):
 
     if doctor and doctor.preciobase is not None:
         precio_base = doctor.preciobase
+        # Lo pagado en línea (cita.precio) se descuenta del precio base
+        precio_con_descuento = saldo_pendiente(precio_base, cita.precio)
         if cita.precio is not None:
-            precio_con_descuento = round(precio_base - cita.precio, 2)
             descuento = f"-${cita.precio}"
-        else:
-            precio_con_descuento = precio_base
-            descuento = '0$'
     else:
         precio_base = None
 
@@ -526,12 +598,11 @@ def detalle_cita(request, cita_id):
                     correo_destino = None
 
             if correo_destino:
-                send_mail(
-                    subject="Cancelación de Cita Médica",
-                    message=f"Hola {cita.nombre}, lamentamos informarte que tu cita con el Dr. {request.user.get_full_name()} fue cancelada. Por favor, agenda otra en un horario disponible.",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[correo_destino],
-                    fail_silently=False,
+                # Se encola; el worker enviar_correos lo entrega sin bloquear el request
+                encolar_correo(
+                    asunto="Cancelación de Cita Médica",
+                    cuerpo=f"Hola {cita.nombre}, lamentamos informarte que tu cita con el Dr. {request.user.get_full_name()} fue cancelada. Por favor, agenda otra en un horario disponible.",
+                    destinatarios=[correo_destino],
                 )
 
             cita.delete()
@@ -551,7 +622,6 @@ def detalle_cita(request, cita_id):
 from django.conf import settings  # <- Importa settings para las llaves Stripe
 from django.shortcuts import render
 from .models import Doctor       # <- Importa tu modelo Doctor
-stripe.api_key = settings.STRIPE_SECRET_KEY  # clave secreta
 
 from django.shortcuts import get_object_or_404
 
@@ -560,34 +630,29 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.urls import reverse
-import stripe
 
 from decimal import Decimal, ROUND_HALF_UP
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.urls import reverse
-import stripe
 
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
 from django.contrib import messages
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse
 from django.contrib.auth.decorators import login_required
-import stripe
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.urls import reverse
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
-import stripe
 
 from .models import Doctor, Paciente
 from django.conf import settings
 
 # Configurar la clave secreta de Stripe desde settings
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 
 
@@ -595,65 +660,82 @@ stripe.api_key = settings.STRIPE_SECRET_KEY
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
 import json
-import stripe
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse, HttpResponseRedirect
 from django.urls import reverse
 from django.conf import settings
 import json
-import stripe
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
+
+from .pasarela import PasarelaError, PasarelaNoDisponible, obtener_pasarela
 
 @csrf_exempt
-def procesar_pago(request):
+async def procesar_pago(request):
     if request.method == 'POST':
         data = json.loads(request.body)
         try:
-            # Crear el intento de pago
-            intent = stripe.PaymentIntent.create(
-                amount=5000,  # monto en centavos
-                currency='usd',
-                payment_method=data['payment_method_id'],
-                confirm=True,
-            )
+            # Crear el intento de pago; un PaymentMethod solo se cobra una vez,
+            # así que su id sirve de idempotency key si el navegador reenvía
+            intent = await obtener_pasarela().acrear_payment_intent({
+                'amount': 5000,  # monto en centavos
+                'currency': 'usd',
+                'payment_method': data['payment_method_id'],
+                'confirm': True,
+            }, idempotency_key=f"procesar_pago:{data['payment_method_id']}")
+            if intent.status != 'succeeded':
+                # requires_action (3D Secure), processing...: todavía no está cobrado
+                return JsonResponse({
+                    'status': 'failed', 'error': 'El pago no se pudo completar. Intenta con otra tarjeta.',
+                    'redirect_url': request.build_absolute_uri(reverse('pago_cancelado')),
+                }, status=402)
 
             # Si el pago fue exitoso, redirigir
             success_url = request.build_absolute_uri(reverse('home'))
             return JsonResponse({'status': 'success', 'redirect_url': success_url})
 
-        except stripe.error.CardError as e:
-            # Si el pago fue rechazado
+        except PasarelaError as e:
+            # Si el pago fue rechazado (o Stripe no está disponible)
             cancel_url = request.build_absolute_uri(reverse('pago_cancelado'))
-            return JsonResponse({'status': 'failed', 'error': str(e), 'redirect_url': cancel_url}, status=400)
+            status = 503 if isinstance(e, PasarelaNoDisponible) else 400
+            return JsonResponse({'status': 'failed', 'error': str(e), 'redirect_url': cancel_url}, status=status)
 
     return JsonResponse({'error': 'Método no permitido'}, status=405)
 
 #PAGOSSSSS
-def pagar_cita(request, cita_id):
-    cita = Cita.objects.get(id=cita_id)
-    
-    session = stripe.checkout.Session.create(
-        payment_method_types=['card'],
-        line_items=[{
-            'price_data': {
-                'currency': 'usd',
-                'unit_amount': 5000,  # en centavos: $50.00
-                'product_data': {
-                    'name': f'Cita médica con {cita.nombre}',
-                },
-            },
-            'quantity': 1,
-        }],
-        mode='payment',
-        success_url=request.build_absolute_uri('pago-exitoso/'),
-        cancel_url=request.build_absolute_uri('/pago-cancelado/'),
-        metadata={'cita_id': cita.id}
-    )
-    return redirect(session.url, code=303)
+from .models import Pago
+from .pagos import acrear_checkout, procesar_evento
+from asgiref.sync import sync_to_async
+from django.shortcuts import aget_object_or_404
+
+# Las vistas que llaman a Stripe son async: con ASGI (uvicorn) el worker sigue
+# atendiendo otras peticiones mientras espera la respuesta de Stripe.
+@login_required
+async def pagar_cita(request, cita_id):
+    # Solo las citas del paciente que paga: un id ajeno o inexistente es 404
+    paciente = (await request.aperfil()).paciente
+    if paciente is None:
+        raise Http404("El usuario no tiene perfil de paciente.")
+    cita = await aget_object_or_404(Cita.objects.select_related('doctor'), id=cita_id, paciente=paciente)
+
+    # El webhook confirma la cita cuando Stripe avisa que se cobró
+    try:
+        url = await acrear_checkout(
+            request, Pago.CITA, cita.doctor,
+            monto_centavos=5000,  # en centavos: $50.00
+            nombre=f'Cita médica con {cita.nombre}',
+            cita=cita,
+        )
+    except PasarelaError as e:
+        return _pago_no_iniciado(request, e)
+    return redirect(url, code=303)
+
+
+def _pago_no_iniciado(request, error):
+    # Stripe rechazó o no respondió a tiempo: se avisa sin dejar al usuario esperando
+    messages.error(request, f"Ocurrió un error con el servicio de pago: {error}")
+    return redirect('pago_cancelado')
  
 def pago_exitoso(request):
     return render(request, 'helcon/pago_exitoso.html')
@@ -674,101 +756,18 @@ from .models import Cita, Paciente
 
 @login_required
 def detalle_cita_paciente(request):
-    try:
-        paciente = Paciente.objects.get(user=request.user)
-    except Paciente.DoesNotExist:
-        paciente = None
+    paciente = request.perfil.paciente
 
-    citas = Cita.objects.filter(paciente=paciente).order_by('fecha', 'hora') if paciente else []
+    # La plantilla muestra el nombre y la especialidad del doctor de cada cita
+    citas = Cita.objects.filter(paciente=paciente).select_related('doctor__user').order_by('inicio') if paciente else []
 
     return render(request, 'helcon/detalle_cita_paciente.html', {
         'citas': citas,
     })
 
-from io import BytesIO
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import cm
-from reportlab.lib.colors import black, navy, lightgrey
-
-from io import BytesIO
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import cm
-from reportlab.lib import colors
-
-
-from io import BytesIO
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-
-def generar_comprobante_suscripcion_pdf(doctor, fecha_inicio, precio_mensual, periodo="1 mes", metodo_pago="Tarjeta de crédito"):
-    buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
-
-    navy = colors.HexColor("#0B0B3B")
-    lightblue = colors.HexColor("#A9D0F5")
-    blue = colors.HexColor("#5DADE2")
-    black = colors.black
-
-    # Fondo decorativo con círculos
-    p.setFillColor(navy)
-    p.circle(-50, height + 50, 150, stroke=0, fill=1)
-    p.circle(width + 50, height - 50, 150, stroke=0, fill=1)
-
-    p.setFillColor(lightblue)
-    p.circle(80, height - 100, 40, stroke=0, fill=1)
-    p.circle(width - 100, height - 250, 60, stroke=0, fill=1)
-
-    p.setFillColor(blue)
-    p.circle(140, height - 130, 20, stroke=0, fill=1)
-    p.circle(width - 30, height - 320, 15, stroke=0, fill=1)
-
-    # Encabezado
-    p.setFillColor(black)
-    p.setFont("Helvetica-Bold", 24)
-    p.drawCentredString(width / 2, height - 80, "Health")
-
-    p.setFillColor(blue)
-    p.drawString((width / 2) + 40, height - 80, "Connectors")
-
-    p.setFillColor(black)
-    p.setFont("Helvetica-Oblique", 10)
-    p.drawCentredString(width / 2, height - 100, '"Connecting patients with healthcare"')
-
-    # Título comprobante
-    p.setFont("Helvetica-Bold", 14)
-    p.drawCentredString(width / 2, height - 140, "COMPROBANTE DE SUSCRIPCIÓN MENSUAL")
-
-    # Datos de la suscripción
-    p.setFont("Helvetica-Bold", 12)
-    inicio_y = height - 200
-    espacio = 20
-
-    nombre_doctor = f"{doctor.user.first_name} {doctor.user.last_name}"
-    p.drawString(100, inicio_y, f"Doctor: {doctor.user.first_name}")
-    p.drawString(100, inicio_y - espacio, f"Fecha inicio / Start Date: {fecha_inicio.strftime('%d/%m/%Y')}")
-    p.drawString(100, inicio_y - 2*espacio, f"Precio mensual / Monthly Fee: ${7.99}")
-
-
-    # Pie de página
-    p.setFillColor(colors.HexColor("#F2F3F4"))
-    p.rect(80, 80, width - 160, 40, stroke=0, fill=1)
-
-    p.setFillColor(black)
-    p.setFont("Helvetica-Bold", 10)
-    p.drawCentredString(width / 2, 100, "Para más información contáctenos en nuestro correo")
-
-    p.setFont("Helvetica", 10)
-    p.drawCentredString(width / 2, 90, "armadillomedico2025@gmail.com")
-
-    # Finalizar PDF
-    p.showPage()
-    p.save()
-    buffer.seek(0)
-    return buffer
+from .comprobantes import datos_cita, datos_suscripcion
+from .models import TrabajoComprobante
+from .trabajos import encolar_comprobante
 
 
 from django.contrib.auth.decorators import login_required
@@ -777,80 +776,8 @@ from django.core.mail import EmailMessage
 from .models import Cita, Paciente, Doctor
 from datetime import date
 
-@login_required
-def enviar_comprobante_pago(request, cita_id):
-    user = request.user
-
-    # Intentar encontrar paciente y doctor relacionado con el user
-    paciente = None
-    doctor = None
-    try:
-        paciente = Paciente.objects.get(user=user)
-    except Paciente.DoesNotExist:
-        pass
-
-    try:
-        doctor = Doctor.objects.get(user=user)
-    except Doctor.DoesNotExist:
-        pass
-
-    if paciente:
-        # Enviar comprobante de cita
-        try:
-            cita = Cita.objects.get(id=cita_id, paciente=paciente)
-        except Cita.DoesNotExist:
-            return HttpResponseForbidden("No tienes permiso para esta cita.")
-
-        pdf_buffer = generar_comprobante_pdf(cita)
-
-        email = EmailMessage(
-            subject="Comprobante de pago de su cita médica",
-            body="Adjunto encontrará su comprobante de pago.",
-            from_email="armadillomedico2025@gmail.com",
-            to=[paciente.user.email],
-        )
-        email.attach(f"comprobante_cita_{cita.id}.pdf", pdf_buffer.getvalue(), 'application/pdf')
-        email.send()
-
-        # ✅ Enviar mismo comprobante al doctor
-        email_doctor = EmailMessage(
-            subject="Cita confirmada con un paciente",
-            body=f"El paciente {paciente.user.get_full_name()} ha pagado y confirmado la cita.",
-            from_email="armadillomedico2025@gmail.com",
-            to=[cita.doctor.user.email],
-        )
-        email_doctor.attach(f"comprobante_cita_{cita.id}.pdf", pdf_buffer.getvalue(), 'application/pdf')
-        email_doctor.send()
-
-
-        # Opcional: eliminar cita
-        cita.delete()
-
-    elif doctor:
-        # Enviar comprobante de suscripción
-        # Aquí asumo que tienes los datos de la suscripción; ajusta según tu modelo y lógica
-        fecha_inicio = date.today()
-        precio_mensual = 50.00
-        periodo = "1 mes"
-        metodo_pago = "Tarjeta de crédito"
-
-        pdf_buffer = generar_comprobante_suscripcion_pdf(doctor, fecha_inicio, precio_mensual, periodo, metodo_pago)
-
-        email = EmailMessage(
-            subject="Comprobante de pago de su suscripción mensual",
-            body="Adjunto encontrará su comprobante de pago de suscripción.",
-            from_email="armadillomedico2025@gmail.com",
-            to=[doctor.user.email],
-        )
-        email.attach(f"comprobante_suscripcion_doctor_{doctor.id}.pdf", pdf_buffer.getvalue(), 'application/pdf')
-        email.send()
-        
-        doctor.recomendado = 'si'
-        doctor.save()
-    else:
-        return HttpResponseForbidden("Usuario no autorizado.")
-
-    # Mostrar mensaje y redirigir
+def _respuesta_comprobante(trabajo):
+    # Página que se muestra mientras el worker genera y envía el comprobante
     html = """
     <!DOCTYPE html>
     <html>
@@ -891,20 +818,110 @@ def enviar_comprobante_pago(request, cita_id):
             }
         </style>
         <script>
-            setTimeout(function() {
-                window.location.href = "http://127.0.0.1:8000/";
-            }, 2000);
+            // Consulta el estado del comprobante y redirige cuando esté listo (o a los 10 s)
+            var intentos = 0;
+            function revisar() {
+                fetch("__ESTADO_URL__").then(function (r) { return r.json(); }).then(function (data) {
+                    intentos++;
+                    if (data.estado === "listo" || data.estado === "error" || intentos >= 10) {
+                        window.location.href = "/";
+                    } else {
+                        setTimeout(revisar, 1000);
+                    }
+                });
+            }
+            setTimeout(revisar, 1000);
         </script>
     </head>
     <body>
-        <h1>✅ Correo de comprobante enviado</h1>
-        <p>Serás redirigido a la página principal en 2 segundos...</p>
+        <h1>✅ Comprobante en proceso</h1>
+        <p>Comprobante N° __TRABAJO_ID__: lo recibirás por correo en unos momentos.</p>
+        <p>Serás redirigido a la página principal...</p>
     </body>
     </html>
     """
+    html = html.replace("__ESTADO_URL__", reverse('estado_comprobante', args=[trabajo.id]))
+    html = html.replace("__TRABAJO_ID__", str(trabajo.id))
     return HttpResponse(html)
 
 
+def _encolar_comprobante_cita(request, paciente, cita):
+    titulo, lineas = datos_cita(cita)
+    nombre_archivo = f"comprobante_cita_{cita.id}.pdf"
+    # Un solo PDF para el paciente y el doctor (el worker lo guarda una vez y lo adjunta a ambos)
+    return encolar_comprobante(request.user, titulo, lineas, nombre_archivo, [
+        {
+            'asunto': "Comprobante de pago de su cita médica",
+            'cuerpo': "Adjunto encontrará su comprobante de pago.",
+            'remitente': "armadillomedico2025@gmail.com",
+            'destinatarios': [paciente.user.email],
+        },
+        {
+            'asunto': "Cita confirmada con un paciente",
+            'cuerpo': f"El paciente {paciente.user.get_full_name()} ha pagado y confirmado la cita.",
+            'remitente': "armadillomedico2025@gmail.com",
+            'destinatarios': [cita.doctor.user.email],
+        },
+    ])
+
+
+def _encolar_comprobante_suscripcion(request, doctor):
+    # Reenvío: el precio sale del último pago de la suscripción (si lo hay)
+    pagado = Pago.objects.filter(doctor=doctor, tipo=Pago.SUSCRIPCION, estado=Pago.PAGADO).order_by('-procesado_en').first()
+    if pagado:
+        titulo, lineas = datos_suscripcion(doctor, timezone.localdate(pagado.procesado_en), Decimal(pagado.monto_centavos) / 100)
+    else:
+        titulo, lineas = datos_suscripcion(doctor, date.today())
+    return encolar_comprobante(request.user, titulo, lineas, f"comprobante_suscripcion_doctor_{doctor.id}.pdf", [
+        {
+            'asunto': "Comprobante de pago de su suscripción mensual",
+            'cuerpo': "Adjunto encontrará su comprobante de pago de suscripción.",
+            'remitente': "armadillomedico2025@gmail.com",
+            'destinatarios': [doctor.user.email],
+        },
+    ])
+
+
+@login_required
+def enviar_comprobante_pago(request, cita_id):
+    # Paciente o doctor relacionado con el user
+    paciente = request.perfil.paciente
+    doctor = request.perfil.doctor
+
+    if paciente:
+        # Enviar comprobante de cita
+        try:
+            cita = Cita.objects.select_related('doctor__user').get(id=cita_id, paciente=paciente)
+        except Cita.DoesNotExist:
+            return HttpResponseForbidden("No tienes permiso para esta cita.")
+
+        trabajo = _encolar_comprobante_cita(request, paciente, cita)
+
+        # Opcional: eliminar cita
+        cita.delete()
+
+    elif doctor:
+        # Reenvío del comprobante; la suscripción solo la activa el webhook de Stripe
+        if not doctor.recomendado:
+            return HttpResponseForbidden("No hay una suscripción pagada.")
+        trabajo = _encolar_comprobante_suscripcion(request, doctor)
+    else:
+        return HttpResponseForbidden("Usuario no autorizado.")
+
+    # Mostrar mensaje y redirigir
+    return _respuesta_comprobante(trabajo)
+
+
+@login_required
+def estado_comprobante(request, trabajo_id):
+    trabajo = get_object_or_404(TrabajoComprobante, id=trabajo_id, usuario=request.user)
+    return JsonResponse({
+        'id': trabajo.id,
+        'estado': trabajo.estado,
+        'listo': trabajo.estado == TrabajoComprobante.LISTO,
+    })
+
+
 
 
 from django.shortcuts import render, get_object_or_404
@@ -927,7 +944,6 @@ def recomendacion_doctor(request, doctor_id):
 from django.conf import settings  # <- Importa settings para las llaves Stripe
 from django.shortcuts import render
 from .models import Doctor       # <- Importa tu modelo Doctor
-stripe.api_key = settings.STRIPE_SECRET_KEY  # clave secreta
 
 from django.shortcuts import get_object_or_404
 
@@ -937,13 +953,11 @@ from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
 import json
-import stripe
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 # Vista para iniciar pago relacionado con un doctor
-def pago_tarjeta_doctor(request, doctor_id):
-    doctor = get_object_or_404(Doctor, id=doctor_id)
+async def pago_tarjeta_doctor(request, doctor_id):
+    doctor = await aget_object_or_404(Doctor.objects.select_related('user'), id=doctor_id)
     
     # Aquí defines el monto fijo o variable, por ejemplo:
     monto_centavos = 299  # $50.00 por defecto (modifica según necesidad)
@@ -952,136 +966,80 @@ def pago_tarjeta_doctor(request, doctor_id):
         if monto_centavos <= 0:
             return redirect('detalle_doctor')  # Ajusta según url válida
         
-        session = stripe.checkout.Session.create(
-            payment_method_types=['card'],
-            line_items=[{
-                'price_data': {
-                    'currency': 'usd',
-                    'product_data': {
-                        'name': f'Pago por servicio del Dr. {doctor.user.first_name} {doctor.user.last_name}',
-                    },
-                    'unit_amount': monto_centavos,
-                },
-                'quantity': 1,
-            }],
-            mode='payment',
-            success_url=request.build_absolute_uri(reverse('enviar_comprobante_doctor', args=[doctor.id])),
-            cancel_url=request.build_absolute_uri(reverse('pago_cancelado')),
-        )
-        return redirect(session.url, code=303)
+        # El webhook marca al doctor como recomendado y envía el comprobante
+        try:
+            url = await acrear_checkout(
+                request, Pago.SUSCRIPCION, doctor, monto_centavos,
+                nombre=f'Pago por servicio del Dr. {doctor.user.first_name} {doctor.user.last_name}',
+            )
+        except PasarelaError as e:
+            return _pago_no_iniciado(request, e)
+        return redirect(url, code=303)
 
     context = {
         'stripe_public_key': settings.STRIPE_PUBLIC_KEY,
         'doctor': doctor,
     }
-    return render(request, 'helcon/pago_targeta_doctor.html', context)
+    # Los context processors consultan la base: se renderiza en el hilo de sync_to_async
+    return await sync_to_async(render)(request, 'helcon/pago_targeta_doctor.html', context)
 
 # Procesar pago con PaymentIntent (opcional, si usas pago inmediato con JS)
 @csrf_exempt
-def procesar_pago_doctor(request):
+async def procesar_pago_doctor(request):
     if request.method == 'POST':
         data = json.loads(request.body)
         try:
-            intent = stripe.PaymentIntent.create(
-                amount=5000,  # monto fijo, modifica si necesitas variable
-                currency='usd',
-                payment_method=data['payment_method_id'],
-                confirm=True,
-            )
+            intent = await obtener_pasarela().acrear_payment_intent({
+                'amount': 5000,  # monto fijo, modifica si necesitas variable
+                'currency': 'usd',
+                'payment_method': data['payment_method_id'],
+                'confirm': True,
+            }, idempotency_key=f"procesar_pago_doctor:{data['payment_method_id']}")
+            if intent.status != 'succeeded':
+                return JsonResponse({
+                    'status': 'failed', 'error': 'El pago no se pudo completar. Intenta con otra tarjeta.',
+                    'redirect_url': request.build_absolute_uri(reverse('pago_cancelado')),
+                }, status=402)
             success_url = request.build_absolute_uri(reverse('enviar_comprobante_doctor'))
             return JsonResponse({'status': 'success', 'redirect_url': success_url})
-        except stripe.error.CardError as e:
+        except PasarelaError as e:
             cancel_url = request.build_absolute_uri(reverse('pago_cancelado'))
-            return JsonResponse({'status': 'failed', 'error': str(e), 'redirect_url': cancel_url}, status=400)
+            status = 503 if isinstance(e, PasarelaNoDisponible) else 400
+            return JsonResponse({'status': 'failed', 'error': str(e), 'redirect_url': cancel_url}, status=status)
 
     return JsonResponse({'error': 'Método no permitido'}, status=405)
 
 # Pago directo con checkout session para doctor
-def pagar_doctor(request, doctor_id):
-    doctor = get_object_or_404(Doctor, id=doctor_id)
+async def pagar_doctor(request, doctor_id):
+    doctor = await aget_object_or_404(Doctor.objects.select_related('user'), id=doctor_id)
     monto_centavos = 5000  # Por defecto, cambia si quieres que sea dinámico
 
-    session = stripe.checkout.Session.create(
-        payment_method_types=['card'],
-        line_items=[{
-            'price_data': {
-                'currency': 'usd',
-                'unit_amount': monto_centavos,
-                'product_data': {
-                    'name': f'Pago por servicio del Dr. {doctor.user.first_name} {doctor.user.last_name}',
-                },
-            },
-            'quantity': 1,
-        }],
-        mode='payment',
-        success_url=request.build_absolute_uri(reverse('pago_exitoso')),
-        cancel_url=request.build_absolute_uri(reverse('pago_cancelado')),
-        metadata={'doctor_id': doctor.id}
-    )
-    return redirect(session.url, code=303)
-@login_required
-def enviar_comprobante_pago_doctor(request, doctor_id):
-    user = request.user
-
-    # Intentar encontrar paciente y doctor relacionado con el user
-    paciente = None
-    doctor = None
-    try:
-        paciente = Paciente.objects.get(user=user)
-    except Paciente.DoesNotExist:
-        pass
-
     try:
-        doctor = Doctor.objects.get(user=user)
-    except Doctor.DoesNotExist:
-        pass
-
-    if paciente:
-        # Enviar comprobante de cita
-        try:
-            cita = Cita.objects.get(id=cita_id, paciente=paciente)
-        except Cita.DoesNotExist:
-            return HttpResponseForbidden("No tienes permiso para esta cita.")
-
-        pdf_buffer = generar_comprobante_pdf(cita)
-
-        email = EmailMessage(
-            subject="Comprobante de pago de su cita médica",
-            body="Adjunto encontrará su comprobante de pago.",
-            from_email="armadillomedico2025@gmail.com",
-            to=[paciente.user.email],
-        )
-        email.attach(f"comprobante_cita_{cita.id}.pdf", pdf_buffer.getvalue(), 'application/pdf')
-        email.send()
-
-
-        # Opcional: eliminar cita
-        cita.delete()
-
-    elif doctor:
-        # Enviar comprobante de suscripción
-        # Aquí asumo que tienes los datos de la suscripción; ajusta según tu modelo y lógica
-        fecha_inicio = date.today()
-        precio_mensual = 50.00
-        periodo = "1 mes"
-        metodo_pago = "Tarjeta de crédito"
-
-        pdf_buffer = generar_comprobante_suscripcion_pdf(doctor, fecha_inicio, precio_mensual, periodo, metodo_pago)
-
-        email = EmailMessage(
-            subject="Comprobante de pago de su suscripción mensual",
-            body="Adjunto encontrará su comprobante de pago de suscripción.",
-            from_email="armadillomedico2025@gmail.com",
-            to=[doctor.user.email],
+        url = await acrear_checkout(
+            request, Pago.SUSCRIPCION, doctor, monto_centavos,
+            nombre=f'Pago por servicio del Dr. {doctor.user.first_name} {doctor.user.last_name}',
         )
-        email.attach(f"comprobante_suscripcion_doctor_{doctor.id}.pdf", pdf_buffer.getvalue(), 'application/pdf')
-        email.send()
-        
-        doctor.recomendado = 'si'
-        doctor.save()
+    except PasarelaError as e:
+        return _pago_no_iniciado(request, e)
+    return redirect(url, code=303)
+@login_required
+def enviar_comprobante_pago_doctor(request, doctor_id):
+    # Paciente o doctor relacionado con el user
+    paciente = request.perfil.paciente
+    doctor = request.perfil.doctor
+
+    if doctor:
+        # Reenvío del comprobante; la suscripción solo la activa el webhook de Stripe
+        if not doctor.recomendado:
+            return HttpResponseForbidden("No hay una suscripción pagada.")
+        trabajo = _encolar_comprobante_suscripcion(request, doctor)
+    elif paciente:
+        return HttpResponseForbidden("Esta página es solo para doctores.")
     else:
         return HttpResponseForbidden("Usuario no autorizado.")
-    
+
+    return _respuesta_comprobante(trabajo)
+
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
 from .models import Cita, Paciente
@@ -1092,15 +1050,13 @@ def aplicar_cupon(request, cita_id):
         cita = get_object_or_404(Cita, id=cita_id)
         paciente = cita.paciente
 
-        if paciente and paciente.cupon == 'si' and cupon_elegido == '1':
+        # El cupón se marca como usado con un compare-and-swap: dos envíos
+        # del formulario no pueden aplicar el descuento dos veces
+        if paciente and cupon_elegido == '1' and cita.precio is not None and \
+                Paciente.objects.filter(pk=paciente.pk, cupon=True).update(cupon=False):
             # Aplica el 15% de descuento
-            precio_original = float(cita.precio)
-            descuento = round(precio_original * 0.15, 2)
-            cita.precio = round(precio_original - descuento, 2)
-            cita.save()
-
-            paciente.cupon = 'no'
-            paciente.save()
+            descuento, cita.precio = descontar_cupon(cita.precio)
+            cita.save(update_fields=['precio'])
 
             messages.success(request, f'✅ Cupón aplicado. Nuevo precio: ${cita.precio:.2f}')
         elif cupon_elegido == '1':
@@ -1147,10 +1103,8 @@ from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from decimal import Decimal, ROUND_HALF_UP
 from .models import Doctor, Paciente
-import stripe
 from django.conf import settings
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
 from decimal import Decimal, ROUND_HALF_UP
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, get_object_or_404, redirect
@@ -1167,7 +1121,7 @@ from .models import Doctor, Paciente
 
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from .models import Cita
+from .models import Cita, HorarioOcupado
 
 def registrar_cita_doc(request):
     if request.method == 'POST':
@@ -1176,21 +1130,24 @@ def registrar_cita_doc(request):
         hora = request.POST.get('hora')
 
         # Suponiendo que tienes un modelo Doctor relacionado con User
-        try:
-            doctor = Doctor.objects.get(user=request.user)
-        except Doctor.DoesNotExist:
+        doctor = request.perfil.doctor
+        if doctor is None:
             # Sin mensaje, solo redirige
             return redirect('registrar_cita_doc')
 
         if nombre and fecha and hora:
-            cita = Cita.objects.create(
-                doctor=doctor,
-                doctor_nombre=doctor.user.first_name,  # o doctor.nombre si tienes ese campo
-                nombre=nombre,
-                fecha_cita=fecha,
-                fecha=fecha,
-                hora=hora,
-            )
+            try:
+                Cita.objects.create(
+                    doctor=doctor,
+                    doctor_nombre=doctor.user.first_name,  # o doctor.nombre si tienes ese campo
+                    nombre=nombre,
+                    fecha_cita=fecha,
+                    fecha=fecha,
+                    hora=hora,
+                )
+            except HorarioOcupado as e:
+                messages.error(request, str(e))
+                return redirect('registrar_cita_doc')
             return redirect('home_doctor')  # Redirige sin mensaje
         else:
             # Solo redirige sin mensaje
@@ -1207,12 +1164,10 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .models import Doctor, Paciente, Cita
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
-import stripe
 from django.conf import settings
 from django.views.decorators.http import require_POST
 
 # --- Configura tu clave secreta de Stripe ---
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse
@@ -1220,21 +1175,47 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .models import Doctor, Paciente, Cita
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
-import stripe
 from django.conf import settings
 from django.views.decorators.http import require_POST
 
 # --- Configura tu clave secreta de Stripe ---
-stripe.api_key = settings.STRIPE_SECRET_KEY
+
+from django.utils import timezone
+from datetime import timedelta
+from .disponibilidad import duracion_para, esta_libre, parsear_hora, slots_libres
+from .reserva import BorradorCita
+
+
+@login_required
+def api_disponibilidad(request, doctor_id):
+    """
+    Horarios libres del doctor como eventos de fondo para FullCalendar
+    (?start=...&end=...; por defecto la semana actual).
+    """
+    doctor = get_object_or_404(Doctor, id=doctor_id)
+    desde = parse_date((request.GET.get('start') or '')[:10])
+    hasta = parse_date((request.GET.get('end') or '')[:10])
+    if not desde:
+        hoy = timezone.localdate()
+        desde = hoy - timedelta(days=hoy.weekday())
+    if not hasta or hasta <= desde:
+        hasta = desde + timedelta(days=7)
+
+    eventos = [{
+        "start": inicio.isoformat(timespec='minutes'),
+        "end": fin.isoformat(timespec='minutes'),
+        "display": "background",
+        "backgroundColor": "#a8e6a1",
+        "extendedProps": {"libre": True},
+    } for inicio, fin in slots_libres(doctor, desde, hasta)]
+    return JsonResponse(eventos, safe=False)
+
 
 @login_required
 def agenda(request, doctor_id):
     doctor = get_object_or_404(Doctor, id=doctor_id)
 
-    try:
-        paciente = Paciente.objects.get(user=request.user)
-    except Paciente.DoesNotExist:
-        paciente = None
+    paciente = request.perfil.paciente
 
     if request.method == 'POST':
         # Obtener datos del formulario
@@ -1252,10 +1233,27 @@ def agenda(request, doctor_id):
             'doctor_id': doctor.id
         }
 
-        # Guardar en sesión para ser usados tras el pago
-        request.session['cita_data'] = data
+        # Verificar que el horario siga libre antes de pasar al pago
+        fecha = parse_date(data['fecha'] or '')
+        hora = parsear_hora(data['hora'])
+        if not fecha or not hora:
+            return render(request, 'helcon/agenda.html', {
+                'paciente': paciente,
+                'doctor': doctor,
+                'error': 'La fecha u hora de la cita no es válida.',
+            })
+        data['duracion'] = duracion_para(doctor, fecha, hora)
+        if not esta_libre(doctor, fecha, hora):
+            return render(request, 'helcon/agenda.html', {
+                'paciente': paciente,
+                'doctor': doctor,
+                'error': 'Ese horario no está disponible. Elige otro horario libre del calendario.',
+            })
 
-        return redirect('vistadecita', doctor_id=doctor.id)
+        # Borrador en la caché de reservas para los pasos siguientes (sin escribir la sesión)
+        respuesta = redirect('vistadecita', doctor_id=doctor.id)
+        BorradorCita(request.user.pk, data).guardar(respuesta)
+        return respuesta
 
 
     return render(request, 'helcon/agenda.html', {
@@ -1267,148 +1265,134 @@ def agenda(request, doctor_id):
 @login_required
 def vistadecita(request, doctor_id):
     """
-    Prepara los detalles de la cita, calcula los precios y los guarda en la sesión.
+    Muestra el resumen y el precio de la cita a partir del BorradorCita que dejó
+    la agenda en la caché 'reserva' (la cookie reserva_id solo lleva su clave,
+    ver helcon/reserva.py). Aplicar el cupón es lo único que vuelve a guardarlo.
     """
     doctor = get_object_or_404(Doctor, id=doctor_id)
-    paciente = get_object_or_404(Paciente, user=request.user)
+    paciente = request.perfil.paciente
+    if paciente is None:
+        raise Http404("El usuario no tiene perfil de paciente.")
 
-    ### CORRECCIÓN 2: Leer los datos de la sesión en lugar de usar datos de ejemplo ###
-    cita_data = request.session.get('cita_data')
-    if not cita_data:
+    borrador = BorradorCita.desde_request(request)
+    if borrador is None or borrador.doctor_id != doctor.id:
         messages.error(request, "No se encontraron datos de la cita. Por favor, agende de nuevo.")
         return redirect('home')
 
-    # Lógica de cálculo de precios
-    preciobase = doctor.preciobase or Decimal('0.00')
-    porcentaje = (preciobase * Decimal('0.02')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-    if doctor.recomendado == 'si':
-        porcentaje = (preciobase * Decimal('0.05')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-    descuento = Decimal('0.00')
-    precio_final = porcentaje
-
-    # Aplicar cupón si se envía el formulario
+    # Aplicar cupón si se envía el formulario: es el único cambio que se guarda
+    cambio = False
     if request.method == 'POST' and 'aplicar_cupon' in request.POST:
-        if paciente.cupon == 'si' and request.POST.get('cupon') == '1':
-            request.session['cupon_aplicado'] = True
+        if paciente.cupon and request.POST.get('cupon') == '1' and not borrador.cupon:
+            borrador.cupon = cambio = True
 
-    cupon_aplicado = request.session.get('cupon_aplicado', False)
-    if cupon_aplicado:
-        descuento = (porcentaje * Decimal('0.15')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        precio_final = (porcentaje - descuento).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    cupon_aplicado = borrador.cupon
+    # El precio no se guarda en el borrador: se recotiza (con caché) al pagar
+    cotizacion = cotizar_doctor(doctor, cupon=cupon_aplicado)
+    cita_data = borrador.datos_pago(cotizacion)
 
-    ### CORRECCIÓN 3: Actualizar la sesión con los precios, sin sobrescribir los datos de la cita ###
-    cita_data['precio'] = str(precio_final)
-    cita_data['descuento'] = str(descuento)
-    request.session['cita_data'] = cita_data # Guardar los datos actualizados
-    request.session.save()
-
-    return render(request, 'helcon/vistadecita.html', {
+    respuesta = render(request, 'helcon/vistadecita.html', {
         'doctor': doctor,
         'paciente': paciente,
-        'preciobase': preciobase,
-        'porcentaje': porcentaje,
-        'porcentaje2': precio_final,
-        'descuento': descuento,
+        'preciobase': cotizacion.precio_base,
+        'porcentaje': cotizacion.tarifa,
+        'porcentaje2': cotizacion.total,
+        'descuento': cotizacion.descuento,
         'cupon_aplicado': cupon_aplicado,
-        'cita': cita_data, # Pasar los datos reales de la sesión a la plantilla
+        'cita': cita_data, # Pasar los datos reales del borrador a la plantilla
     })
+    if cambio:
+        borrador.guardar(respuesta)
+    return respuesta
 
 
 @login_required
 @require_POST # Esta vista solo debe aceptar peticiones POST
-def pago_tarjeta(request):
+async def pago_tarjeta(request):
     """
     Crea la sesión de Stripe Checkout y redirige al usuario a la página de pago.
     """
-    cita_data = request.session.get('cita_data')
+    borrador = await BorradorCita.adesde_request(request)
 
-    if not cita_data:
+    if borrador is None:
         messages.error(request, "No hay datos de cita para procesar el pago.")
         return redirect('home')
 
-    doctor = get_object_or_404(Doctor, id=cita_data.get('doctor_id'))
-    
-    try:
-        precio_final = Decimal(cita_data.get('precio'))
-        monto_centavos = int(precio_final * 100)
-    except (InvalidOperation, TypeError):
-        messages.error(request, "El precio es inválido.")
-        return redirect('home')
+    doctor = await aget_object_or_404(Doctor.objects.select_related('user'), id=borrador.doctor_id)
+    paciente = (await request.aperfil()).paciente
+    # El cupón solo vale si el paciente no lo ha usado (el webhook lo consume)
+    cotizacion = cotizar_doctor(doctor, cupon=borrador.cupon and paciente is not None and paciente.cupon)
+    cita_data = borrador.datos_pago(cotizacion)
+    monto_centavos = int(cotizacion.total * 100)
 
     if monto_centavos < 50: # Stripe requiere un monto mínimo (ej. 0.50 USD)
         messages.error(request, "El monto a pagar es demasiado bajo.")
         return redirect('vistadecita', doctor_id=doctor.id)
 
     try:
-        session = stripe.checkout.Session.create(
-            payment_method_types=['card'],
-            line_items=[{
-                'price_data': {
-                    'currency': 'usd', # O tu moneda, ej: 'pab'
-                    'product_data': {
-                        'name': f'Cita médica con Dr. {doctor.user.first_name} {doctor.user.last_name}',
-                        'description': f"Fecha: {cita_data['fecha']} a las {cita_data['hora']}"
-                    },
-                    'unit_amount': monto_centavos,
-                },
-                'quantity': 1,
-            }],
-            mode='payment',
-            success_url=request.build_absolute_uri(reverse('confirmar_pago')),
-            cancel_url=request.build_absolute_uri(reverse('pago_cancelado')),
+        # Los datos de la cita viajan en el Pago: el webhook crea la cita aunque el
+        # paciente cierre la pestaña antes de volver de Stripe
+        url = await acrear_checkout(
+            request, Pago.CITA_NUEVA, doctor, monto_centavos,
+            nombre=f'Cita médica con Dr. {doctor.user.first_name} {doctor.user.last_name}',
+            descripcion=f"Fecha: {cita_data['fecha']} a las {cita_data['hora']}",
+            datos=cita_data,
         )
-        return redirect(session.url, code=303)
+        return redirect(url, code=303)
 
-    except stripe.error.StripeError as e:
+    except PasarelaError as e:
         messages.error(request, f"Ocurrió un error con el servicio de pago: {str(e)}")
         return redirect('home')
 
 
+import uuid
+
 @login_required
 def confirmar_pago(request):
     """
-    Esta es la 'success_url'. Se ejecuta después de un pago exitoso.
-    Aquí se crea la cita en la base de datos.
+    Esta es la 'success_url'. Ya no crea nada: la cita (o la suscripción)
+    la aplica el webhook de Stripe y esta página consulta su estado.
     """
-    cita_data = request.session.get('cita_data')
-
-    if not cita_data:
-        messages.error(request, "No se pudo confirmar la cita. Sesión expirada.")
+    pago = Pago.objects.filter(clave=_clave_pago(request.GET.get('pago')), usuario=request.user).first()
+    if pago is None:
+        messages.error(request, "No se encontró el pago.")
         return redirect('home')
 
-    doctor = get_object_or_404(Doctor, id=cita_data['doctor_id'])
-    paciente = get_object_or_404(Paciente, user=request.user)
+    respuesta = render(request, 'helcon/confirmar_pago.html', {
+        'pago': pago,
+        'destino': reverse('home_doctor' if pago.tipo == Pago.SUSCRIPCION else 'home_paciente'),
+    })
+    # Borrar el borrador de la cita para que no se pueda reutilizar
+    BorradorCita.borrar(request, respuesta)
+    return respuesta
 
-    # Evitar crear citas duplicadas si el usuario recarga la página de éxito
-    if Cita.objects.filter(doctor=doctor, paciente=paciente, fecha=cita_data['fecha'], hora=cita_data['hora']).exists():
-        messages.info(request, "Esta cita ya ha sido registrada.")
-    else:
-        # Guardar la cita en la base de datos con todos los campos requeridos
-        Cita.objects.create(
-            paciente=paciente,
-            doctor=doctor,
-            nombre=cita_data.get('nombre'),
-            doctor_nombre=doctor.user.get_full_name(),
-            fecha=cita_data.get('fecha'),
-            hora=cita_data.get('hora'),
-            motivo_visita=cita_data.get('motivo_visita'),
-            datos_consulta=cita_data.get('datos_consulta', ''),
-            aseguradora=cita_data.get('aseguradora', ''),
-            fecha_cita=cita_data.get('fecha'),
-            estado_cita='No confirmada',
-            precio=Decimal(cita_data.get('precio')),
-        )
-        # Aquí actualizas el campo cupon del paciente para que no pueda usar otro
-        paciente.cupon = 'no'
-        paciente.save()
 
-        messages.success(request, "¡Pago exitoso! Tu cita ha sido confirmada.")
+def _clave_pago(valor):
+    try:
+        return uuid.UUID(str(valor))
+    except ValueError:
+        return None
+
 
-    # Limpiar los datos de la sesión para que no se puedan reutilizar
-    if 'cita_data' in request.session:
-        del request.session['cita_data']
-    if 'cupon_aplicado' in request.session:
-        del request.session['cupon_aplicado']
+@login_required
+def estado_pago(request, clave):
+    pago = get_object_or_404(Pago, clave=clave, usuario=request.user)
+    return JsonResponse({
+        'estado': pago.estado,
+        'cita': pago.cita_id,
+        'listo': pago.estado != Pago.PENDIENTE,
+    })
 
-    return render(request, 'helcon/home_paciente.html')
+
+@csrf_exempt
+@require_POST
+def stripe_webhook(request):
+    """
+    Webhook de Stripe (checkout.session.completed). Responde 400 si la
+    firma no es válida; cualquier otro error deja que Stripe reintente.
+    """
+    try:
+        procesar_evento(request.body, request.META.get('HTTP_STRIPE_SIGNATURE', ''))
+    except ValueError:
+        # JSON inválido o FirmaInvalida
+        return HttpResponse(status=400)
+    return HttpResponse(status=200)
@@ -3,6 +3,13 @@ ASGI config for mi_proyecto project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Modo ASGI (las vistas de pago y api_citas son async y no bloquean el worker
+mientras esperan a Stripe o a la base):
+
+    SERVIDOR=asgi gunicorn    (ver gunicorn.conf.py)
+
+`manage.py comparar_servidores` mide este modo contra el WSGI por defecto.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
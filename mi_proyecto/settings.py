@@ -1,5 +1,8 @@
+import os
 from pathlib import Path
 
+import dj_database_url
+
 # Base directory del proyecto
 BASE_DIR = Path(__file__).resolve().parent.parent
 LOGIN_REDIRECT_URL = 'home' 
@@ -15,25 +18,41 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'helcon',  # Tu app (antes de staticfiles para que su collectstatic genere las variantes de imágenes)
     'django.contrib.staticfiles',
-    'helcon',  # Tu app
 ]
 CSRF_TRUSTED_ORIGINS = [
     'https://prototipofinal-production.up.railway.app',
 ]
 
 MIDDLEWARE = [
+    'helcon.middleware.MetricasMiddleware',  # solo con METRICAS_REQUEST=1; primero para medir todo el request
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.locale.LocaleMiddleware',  # idioma por cookie django_language o Accept-Language
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'helcon.middleware.PerfilMiddleware',  # request.perfil (doctor/paciente) una vez por request
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Métricas por request: header Server-Timing y logger 'helcon.metricas'
+METRICAS_REQUEST = os.environ.get('METRICAS_REQUEST') == '1'
+# Máximo de consultas SQL por nombre de URL: incluye usuario, perfil, context processors
+# y la escritura de la sesión del primer request (3). Un N+1 las hace crecer con los
+# datos; los tests (PresupuestoConsultasTests) corren con METRICAS_PRESUPUESTO_ESTRICTO
+METRICAS_PRESUPUESTOS = {
+    'home_paciente': 8,
+    'home_doctor': 8,
+    'detalle_cita_paciente': 8,
+    'api_citas': 8,
+}
+METRICAS_PRESUPUESTO_ESTRICTO = os.environ.get('METRICAS_PRESUPUESTO_ESTRICTO') == '1'
+
 ROOT_URLCONF = 'mi_proyecto.urls'
 
 TEMPLATES = [
@@ -48,7 +67,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'django.template.context_processors.static',
-                'helcon.context_processors.doctor_context',
+                'django.template.context_processors.i18n',
                 'helcon.context_processors.navbar_context',# <-- Agregamos aquí tu context processor
             ],
         },
@@ -57,13 +76,47 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'mi_proyecto.wsgi.application'
 
-# Base de datos (sqlite por defecto)
+# Base de datos: DATABASE_URL (PostgreSQL en producción) o sqlite local si no está definida
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': dj_database_url.config(
+        default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
+        conn_max_age=int(os.environ.get('CONN_MAX_AGE', 600)),  # conexiones persistentes por worker
+        conn_health_checks=True,
+    )
 }
+# Lo mismo que lee gunicorn.conf.py: 'asgi' (uvicorn) o 'wsgi'
+SERVIDOR = os.environ.get('SERVIDOR', 'wsgi')
+if SERVIDOR == 'asgi':
+    # Con ASGI el código sync corre en hilos que no siguen el ciclo del request:
+    # las conexiones persistentes se quedarían abiertas (ver docs de Django)
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # PRAGMAs por conexión. journal_mode=WAL (las lecturas no se bloquean mientras
+    # otro worker escribe) queda guardado en el archivo, así que no va aquí: lo activa
+    # gunicorn al arrancar (on_starting en gunicorn.conf.py) y los comandos de
+    # manage.py y los tests no reescriben el db.sqlite3 del repo
+    DATABASES['default']['OPTIONS'] = {
+        'init_command': (
+            'PRAGMA synchronous=NORMAL;'
+            'PRAGMA busy_timeout=5000;'
+            'PRAGMA temp_store=MEMORY;'
+            'PRAGMA cache_size=-20000;'
+            'PRAGMA mmap_size=134217728;'
+        ),
+        'transaction_mode': 'IMMEDIATE',  # toma el lock de escritura al inicio y evita "database is locked"
+    }
+else:
+    if os.environ.get('DB_POOLER') == 'pgbouncer':
+        # PgBouncer en modo transaction no soporta cursores del lado del servidor
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    if os.environ.get('DB_POOL'):
+        # Pool propio de Django (necesita psycopg 3 con psycopg[pool]); incompatible con CONN_MAX_AGE
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX', 10)),
+        }
 
 # Validadores de contraseña
 AUTH_PASSWORD_VALIDATORS = [
@@ -78,6 +131,60 @@ LANGUAGE_CODE = 'es'
 TIME_ZONE = 'America/Bogota'
 USE_I18N = True
 USE_TZ = True
+LANGUAGES = [
+    ('es', 'Español'),
+    ('en', 'English'),
+]
+# Catálogos .po/.mo (los textos de las plantillas están en español; ver extraer_traducciones_js)
+LOCALE_PATHS = [BASE_DIR / 'locale']
+# La misma cookie la escribe el menú de idioma desde JS
+LANGUAGE_COOKIE_AGE = 60 * 60 * 24 * 365
+
+# Caché. 'paginas' guarda el HTML de las páginas estáticas (welcome, journals, términos...)
+# en disco, compartido entre los workers de gunicorn (CACHE_PAGINAS=locmem: uno por proceso).
+# Las claves llevan el release: en cada deploy se empieza de cero sin tener que vaciarla.
+# En Heroku sale de HEROKU_RELEASE_VERSION (dyno metadata); en otros servidores, RELEASE.
+CACHE_PAGINAS = os.environ.get('CACHE_PAGINAS', 'file')
+RELEASE = os.environ.get('RELEASE') or os.environ.get('HEROKU_RELEASE_VERSION') or os.environ.get('SOURCE_VERSION', '')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'paginas': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_PAGINAS_DIR', str(BASE_DIR / '.cache_paginas')),
+        'KEY_PREFIX': RELEASE,
+    } if CACHE_PAGINAS == 'file' else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'paginas',
+        'KEY_PREFIX': RELEASE,
+    },
+    # Borradores de la cita (helcon/reserva.py): en disco para que cualquier worker
+    # los lea; cada uno vive 2 horas y se borra al confirmar el pago
+    'reserva': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_RESERVA_DIR', str(BASE_DIR / '.cache_reserva')),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+PAGINAS_CACHE_SEGUNDOS = int(os.environ.get('PAGINAS_CACHE_SEGUNDOS', 3600))
+
+# Sesiones en la base. No se usa cached_db con la caché local (locmem): cada worker
+# tendría su copia y una sesión cerrada en uno seguiría abierta en los otros.
+# Con una caché compartida (SESSION_CACHE_URL=redis://..., necesita el paquete redis)
+# sí se usa cached_db. El borrador de la cita no va en la sesión (helcon/reserva.py).
+# Las vencidas se borran con `limpiar_sesiones` (Procfile).
+SESSION_CACHE_URL = os.environ.get('SESSION_CACHE_URL')
+if SESSION_CACHE_URL:
+    CACHES['sesiones'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': SESSION_CACHE_URL,
+    }
+    SESSION_CACHE_ALIAS = 'sesiones'
+SESSION_ENGINE = os.environ.get(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if SESSION_CACHE_URL else 'django.contrib.sessions.backends.db',
+)
 
 # Archivos estáticos (CSS, JS, imágenes que no cambian)
 STATIC_URL = '/static/'
@@ -85,6 +192,15 @@ STATICFILES_DIRS = [
     BASE_DIR / 'helcon' / 'static',
 ]
 STATIC_ROOT = BASE_DIR / 'staticfiles'  # solo para producción
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Nombres con hash + gzip/Brotli precomprimidos en collectstatic (ver helcon/storage.py)
+    'staticfiles': {
+        'BACKEND': 'helcon.storage.StaticComprimido',
+    },
+}
 
 # Archivos media (archivos subidos por usuarios, como las fotos de perfil)
 MEDIA_URL = '/media/'
@@ -96,8 +212,27 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # settings.py
 STRIPE_PUBLIC_KEY = "sk_test_51RcR2MP7KXldavwCAbVCWDvSQ1w8iLtG4DXgi3lMlVL1cd5ZaJwv0PfGN32vtknHNszOtqOvBKQkYxWvLofNc19V00D1ipbvJL"
 STRIPE_SECRET_KEY = "sk_test_51RcR2MP7KXldavwCAbVCWDvSQ1w8iLtG4DXgi3lMlVL1cd5ZaJwv0PfGN32vtknHNszOtqOvBKQkYxWvLofNc19V00D1ipbvJL"
+# Firma del webhook /stripe/webhook/ (Dashboard o `stripe listen --forward-to localhost:8000/stripe/webhook/`)
+STRIPE_WEBHOOK_SECRET = os.environ.get('STRIPE_WEBHOOK_SECRET', '')
+
+# Cliente de Stripe (helcon/pasarela.py). El peor caso de una llamada es
+# (conexión + lectura) * (1 + reintentos): debe quedar bajo el timeout de gunicorn.
+PAGOS_PASARELA = os.environ.get('PAGOS_PASARELA', 'helcon.pasarela.PasarelaStripe')
+STRIPE_API_BASE = os.environ.get('STRIPE_API_BASE', '')  # p.ej. http://localhost:12111 (stripe-mock)
+STRIPE_TIMEOUT_CONEXION = float(os.environ.get('STRIPE_TIMEOUT_CONEXION', 2))
+STRIPE_TIMEOUT_LECTURA = float(os.environ.get('STRIPE_TIMEOUT_LECTURA', 8))
+STRIPE_REINTENTOS = int(os.environ.get('STRIPE_REINTENTOS', 1))
+STRIPE_POOL_CONEXIONES = int(os.environ.get('STRIPE_POOL_CONEXIONES', 10))
+# Circuit breaker: tras N fallas seguidas se deja de llamar a Stripe por unos segundos
+STRIPE_FALLOS_PARA_ABRIR = int(os.environ.get('STRIPE_FALLOS_PARA_ABRIR', 5))
+STRIPE_SEGUNDOS_ABIERTO = int(os.environ.get('STRIPE_SEGUNDOS_ABIERTO', 30))
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Los correos se encolan (helcon.CorreoPendiente) y los envía `manage.py enviar_correos`.
+# Para pruebas locales: EMAIL_BACKEND=django.core.mail.backends.console.EmailBackend
+# o django.core.mail.backends.filebased.EmailBackend (escribe en EMAIL_FILE_PATH)
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', BASE_DIR / 'correos_enviados')
+EMAIL_TIMEOUT = 10
 EMAIL_HOST = 'smtp.gmail.com'         # Ejemplo: smtp.gmail.com si usas Gmail
 EMAIL_PORT = 587                           # Puerto TLS estándar
 EMAIL_USE_TLS = True
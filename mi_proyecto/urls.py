@@ -5,6 +5,7 @@ from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('i18n/', include('django.conf.urls.i18n')),  # set_language (POST) para cambiar de idioma
     path('helcon/', include('helcon.urls')),
     path('', include('helcon.urls')),  # <-- esta línea permite que la raíz apunte a helcon
 ]